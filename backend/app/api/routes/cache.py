@@ -3,7 +3,7 @@ Cache management API endpoints.
 """
 
 from fastapi import APIRouter, HTTPException
-from app.core.cache import get_cache_stats, invalidate_cache_pattern, cache_service
+from app.core.cache import get_cache_stats, invalidate_cache_pattern, invalidate_cache_tag, cache_service
 
 router = APIRouter(prefix="/cache", tags=["cache"])
 
@@ -34,6 +34,15 @@ def invalidate_cache(pattern: str):
     return {"message": f"Invalidated {count} cache entries", "pattern": pattern}
 
 
+@router.post("/invalidate-tag/{tag}")
+def invalidate_cache_by_tag(tag: str):
+    """
+    Invalidate all cache entries registered under a tag (e.g. "perks").
+    """
+    count = invalidate_cache_tag(tag)
+    return {"message": f"Invalidated {count} cache entries", "tag": tag}
+
+
 @router.post("/cleanup")
 def cleanup_expired_cache():
     """
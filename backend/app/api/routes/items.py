@@ -6,7 +6,6 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload, selectinload, aliased
 from sqlalchemy import or_, and_, func, Integer, text
-import math
 import time
 import logging
 
@@ -388,25 +387,19 @@ def get_items(
     total = query.count()
     
     # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
     offset = (page - 1) * page_size
     
-    # Load relationships only for the paginated result set
-    items = query.options(*item_detail_load_options())\
-        .offset(offset).limit(page_size).all()
+    # Load relationships only for the paginated result set; nothing to fetch
+    # when nothing matched or the page starts past the end
+    items = []
+    if offset < total:
+        items = query.options(*item_detail_load_options())\
+            .offset(offset).limit(page_size).all()
     
     # Build detailed response items in bulk
     detailed_items = build_item_details_bulk(items, db)
     
-    return PaginatedResponse[ItemDetail](
-        items=detailed_items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
-    )
+    return PaginatedResponse[ItemDetail].from_page(detailed_items, total, page, page_size)
 
 
 @router.get("/search", response_model=PaginatedResponse[ItemDetail])
@@ -437,7 +430,7 @@ def search_items(
     Search items by name or description using exact matching (default) or fuzzy/stemmed search.
     Returns complete item details including stats, spells, and attack/defense data.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Parse search fields
     fields_to_search = ['name', 'description']  # Default fields
@@ -449,7 +442,10 @@ def search_items(
             fields_to_search = ['name', 'description']
     
     # Log search parameters for debugging
-    logger.info(f"Search query='{q}' search_fields='{search_fields}' parsed_fields={fields_to_search} exact_match={exact_match}")
+    logger.debug(
+        "Search query='%s' search_fields='%s' parsed_fields=%s exact_match=%s",
+        q, search_fields, fields_to_search, exact_match
+    )
     
     if exact_match:
         # Use ILIKE for exact word matching (default behavior)
@@ -466,7 +462,7 @@ def search_items(
         if not search_conditions:
             search_conditions.append(Item.name.ilike(search_term))
         
-        logger.info(f"Final query: searching {len(search_conditions)} field(s) for term '{q}' in fields {fields_to_search}")
+        logger.debug("Final query: searching %d field(s) for term '%s' in fields %s", len(search_conditions), q, fields_to_search)
         
         # Build base query WITHOUT relationship loading
         query = db.query(Item)
@@ -556,30 +552,24 @@ def search_items(
     total = query.count()
     
     # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
     offset = (page - 1) * page_size
     
-    # Load relationships only for the paginated result set
-    items = query.options(*item_detail_load_options())\
-        .offset(offset).limit(page_size).all()
+    # Load relationships only for the paginated result set; nothing to fetch
+    # when nothing matched or the page starts past the end
+    items = []
+    if offset < total:
+        items = query.options(*item_detail_load_options())\
+            .offset(offset).limit(page_size).all()
     
     # Build detailed response items in bulk
     detailed_items = build_item_details_bulk(items, db)
     
     # Log performance metrics
-    query_time = time.time() - start_time
+    query_time = time.perf_counter() - start_time
     search_method = 'exact_ilike' if exact_match else 'fuzzy_fulltext'
-    logger.info(f"Item search query='{q}' results={total} time={query_time:.3f}s method={search_method}")
+    logger.info("Item search query='%s' results=%d time=%.3fs method=%s", q, total, query_time, search_method)
     
-    return PaginatedResponse[ItemDetail](
-        items=detailed_items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
-    )
+    return PaginatedResponse[ItemDetail].from_page(detailed_items, total, page, page_size)
 
 
 
@@ -611,7 +601,7 @@ def filter_items_advanced(
     """
     Advanced filtering for items with multiple criteria and sorting options.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Build base query WITHOUT relationship loading (for filtering + counting)
     query = db.query(Item)
@@ -659,32 +649,29 @@ def filter_items_advanced(
         query = query.order_by(sort_column.asc())
     
     # Get total count on lightweight query (no relationship loading)
-    total = query.count()
+    total = query.order_by(None).count()
     
     # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
     offset = (page - 1) * page_size
     
-    # Load relationships only for the paginated result set
-    items = query.options(*item_detail_load_options())\
-        .offset(offset).limit(page_size).all()
+    # Load relationships only for the paginated result set; nothing to fetch
+    # when nothing matched or the page starts past the end
+    items = []
+    if offset < total:
+        items = query.options(*item_detail_load_options())\
+            .offset(offset).limit(page_size).all()
     
     # Build detailed response items in bulk
     detailed_items = build_item_details_bulk(items, db)
     
     # Log performance metrics
-    query_time = time.time() - start_time
-    logger.info(f"Item filter results={total} time={query_time:.3f}s filters=class:{item_class},ql:{min_ql}-{max_ql},nano:{is_nano}")
-    
-    return PaginatedResponse[ItemDetail](
-        items=detailed_items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
+    query_time = time.perf_counter() - start_time
+    logger.info(
+        "Item filter results=%d time=%.3fs filters=class:%s,ql:%s-%s,nano:%s",
+        total, query_time, item_class, min_ql, max_ql, is_nano
     )
+    
+    return PaginatedResponse[ItemDetail].from_page(detailed_items, total, page, page_size)
 
 
 @router.get("/with-stats", response_model=PaginatedResponse[ItemDetail])
@@ -714,7 +701,7 @@ def get_items_with_stats(
     - stat_requirements='16:>=500,17:>=400' with logic='and' (Strength >= 500 AND Intelligence >= 400)
     - stat_requirements='16:>=500,17:>=400' with logic='or' (Strength >= 500 OR Intelligence >= 400)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Parse stat requirements
     try:
@@ -832,25 +819,19 @@ def get_items_with_stats(
     total = query.count()
     
     # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
     offset = (page - 1) * page_size
     
-    # Get items for current page
-    items = query.offset(offset).limit(page_size).all()
+    # Get items for current page (none past the end)
+    items = query.offset(offset).limit(page_size).all() if offset < total else []
     
     # Log performance metrics
-    query_time = time.time() - start_time
-    logger.info(f"Complex stat query requirements='{stat_requirements}' logic='{logic}' results={total} time={query_time:.3f}s")
-    
-    return PaginatedResponse[ItemResponse](
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
+    query_time = time.perf_counter() - start_time
+    logger.info(
+        "Complex stat query requirements='%s' logic='%s' results=%d time=%.3fs",
+        stat_requirements, logic, total, query_time
     )
+    
+    return PaginatedResponse[ItemResponse].from_page(items, total, page, page_size)
 
 
 @router.get("/{aoid}", response_model=ItemDetail)
@@ -953,7 +934,7 @@ def interpolate_item(
     Returns an interpolated item with stats, spells, and criteria calculated
     for the target QL based on the item's variants at different quality levels.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # Create interpolation service
@@ -972,7 +953,7 @@ def interpolate_item(
             range_dict = {"min_ql": interpolation_range[0], "max_ql": interpolation_range[1]}
         
         # Log performance metrics
-        query_time = time.time() - start_time
+        query_time = time.perf_counter() - start_time
         logger.info(f"Item interpolation aoid={aoid} target_ql={target_ql} interpolating={interpolated_item.interpolating} time={query_time:.3f}s")
         
         return InterpolationResponse(
@@ -1004,7 +985,7 @@ def batch_interpolate_items(
     Performance: Uses a single InterpolationService instance (single DB session)
     for all items to minimize database connection overhead.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Create single interpolation service for all items
     interpolation_service = InterpolationService(db)
@@ -1056,7 +1037,7 @@ def batch_interpolate_items(
     total_count = len(request.items)
 
     # Log performance metrics
-    query_time = time.time() - start_time
+    query_time = time.perf_counter() - start_time
     logger.info(
         f"Batch interpolation: {total_count} items, {success_count} succeeded, "
         f"{len(errors)} errors, time={query_time:.3f}s"
@@ -1121,7 +1102,7 @@ def interpolate_item_by_request(
     Alternative endpoint that accepts JSON request body instead of query parameters.
     Useful for more complex interpolation requests in the future.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         interpolation_service = InterpolationService(db)
@@ -1135,7 +1116,7 @@ def interpolate_item_by_request(
         if interpolation_range:
             range_dict = {"min_ql": interpolation_range[0], "max_ql": interpolation_range[1]}
         
-        query_time = time.time() - start_time
+        query_time = time.perf_counter() - start_time
         logger.info(f"Item interpolation (POST) aoid={request.aoid} target_ql={request.target_ql} time={query_time:.3f}s")
         
         return InterpolationResponse(
@@ -4,30 +4,51 @@ Mobs API endpoints.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, and_, func
-import math
+from sqlalchemy.orm import Session
+from sqlalchemy import select, and_, func, tuple_
 import time
 import logging
 
 from app.core.database import get_db
-from app.models import (
-    Mob, SymbiantItem, Source, SourceType, ItemSource, Item, Action, ActionCriteria,
-    ItemSpellData, SpellData, SpellDataSpells, Spell, SpellCriterion, Criterion
-)
+from app.models import Mob, SymbiantItem, Source, SourceType, ItemSource, Item
 from app.api.schemas.mob import MobResponse, MobDetail, SymbiantDropInfo
 from app.api.schemas.symbiant import SymbiantResponse
-from app.api.schemas.action import ActionResponse
-from app.api.schemas.criterion import CriterionResponse
-from app.api.schemas.spell import SpellDataResponse, SpellWithCriteria
 from app.api.schemas import PaginatedResponse
+from app.api.services.symbiant_serializers import (
+    symbiant_item_load_options, serialize_item_effects, symbiant_response
+)
 from app.core.decorators import cached_response, performance_monitor
+from app.core.pagination import (
+    paginate_with_window, paginate_without_total, cached_count, count_cache_key,
+    encode_cursor, decode_cursor
+)
 
 router = APIRouter(prefix="/mobs", tags=["mobs"])
 
 # Set up logging for performance monitoring
 logger = logging.getLogger(__name__)
 
+# Sort key for mobs without a level, placing them last like ORDER BY level ASC
+MOB_LEVEL_UNKNOWN = 2147483647
+
+# source_types is static reference data; the 'mob' id is resolved once per process
+_mob_source_type_id: Optional[int] = None
+
+
+def get_mob_source_type_id(db: Session) -> Optional[int]:
+    """
+    Get the id of the 'mob' source type, querying only on first use.
+
+    A missing row is not cached, so a later import of the source types is
+    picked up without a restart.
+    """
+    global _mob_source_type_id
+    if _mob_source_type_id is None:
+        _mob_source_type_id = (
+            db.query(SourceType.id).filter(SourceType.name == 'mob').scalar()
+        )
+    return _mob_source_type_id
+
 
 @router.get("", response_model=PaginatedResponse[MobResponse])
 @cached_response("mobs")
@@ -39,6 +60,8 @@ def list_mobs(
     max_level: Optional[int] = Query(None, description="Maximum mob level"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; overrides page"),
+    with_total: bool = Query(True, description="Count all matches; false skips the count and returns null total/pages"),
     db: Session = Depends(get_db)
 ):
     """
@@ -48,8 +71,11 @@ def list_mobs(
     - is_pocket_boss: Filter by pocket boss status
     - playfield: Filter by playfield name (partial match)
     - min_level/max_level: Filter by level range
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to seek past the
+    previous page instead of scanning and discarding OFFSET rows.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     query = db.query(Mob)
 
@@ -63,25 +89,42 @@ def list_mobs(
     if max_level is not None:
         query = query.filter(Mob.level <= max_level)
 
-    # Order by level then name for consistent sorting
-    query = query.order_by(Mob.level.asc(), Mob.name.asc())
-
-    # Get total count
-    total = query.count()
-
-    # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
+    # Order by level then name for consistent sorting; unknown levels sort last
+    # and id breaks ties, so (level, name, id) is a unique seek key
+    sort_level = func.coalesce(Mob.level, MOB_LEVEL_UNKNOWN)
+    query = query.order_by(sort_level.asc(), Mob.name.asc(), Mob.id.asc())
 
-    # Get mobs for current page
-    mobs = query.offset(offset).limit(page_size).all()
+    count_key = count_cache_key(
+        "mobs_list", is_pocket_boss=is_pocket_boss, playfield=playfield,
+        min_level=min_level, max_level=max_level
+    )
+    total = has_next = None
+    if cursor is not None:
+        after = decode_cursor(cursor, (int, str, int))
+        mobs = query.filter(tuple_(sort_level, Mob.name, Mob.id) > tuple_(*after)).limit(page_size).all()
+        if with_total:
+            total = cached_count(query, count_key)
+    elif not with_total:
+        mobs, has_next = paginate_without_total(query, page, page_size)
+    else:
+        # Page and total in one query
+        mobs, total = paginate_with_window(query, page, page_size, count_key=count_key)
+
+    next_cursor = None
+    if len(mobs) == page_size:
+        last = mobs[-1]
+        next_cursor = encode_cursor(
+            last.level if last.level is not None else MOB_LEVEL_UNKNOWN, last.name, last.id
+        )
+    if cursor is not None:
+        has_next = next_cursor is not None
 
-    # Get source_type_id for 'mob' to count symbiant drops
-    source_type = db.query(SourceType).filter(SourceType.name == 'mob').first()
+    # Get source_type_id for 'mob' to count symbiant drops (not needed for an empty page)
+    source_type_id = get_mob_source_type_id(db) if mobs else None
 
     # Build drop counts for all mobs on current page
     symbiant_counts = {}
-    if source_type and mobs:
+    if source_type_id is not None:
         mob_ids = [mob.id for mob in mobs]
 
         # Query to count symbiant drops per mob
@@ -92,7 +135,7 @@ def list_mobs(
             )
             .outerjoin(Source, and_(
                 Source.source_id == Mob.id,
-                Source.source_type_id == source_type.id
+                Source.source_type_id == source_type_id
             ))
             .outerjoin(ItemSource, ItemSource.source_id == Source.id)
             .filter(Mob.id.in_(mob_ids))
@@ -119,17 +162,17 @@ def list_mobs(
     ]
 
     # Log performance metrics
-    query_time = time.time() - start_time
-    logger.info(f"Mob list query is_pocket_boss={is_pocket_boss} playfield='{playfield}' level:{min_level}-{max_level} results={total} time={query_time:.3f}s")
-
-    return PaginatedResponse[MobResponse](
-        items=mob_responses,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
+    query_time = time.perf_counter() - start_time
+    logger.info(
+        "Mob list query is_pocket_boss=%s playfield='%s' level:%s-%s results=%s time=%.3fs",
+        is_pocket_boss, playfield, min_level, max_level, total, query_time
+    )
+
+    return PaginatedResponse[MobResponse].from_page(
+        mob_responses, total, page, page_size,
+        has_next=has_next,
+        has_prev=cursor is not None or page > 1,
+        next_cursor=next_cursor
     )
 
 
@@ -151,27 +194,22 @@ def get_mob_drops(
         mob_id: Database ID of the mob
         family: Optional filter by symbiant family (Artillery, Control, etc.)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
-    # Verify mob exists
-    mob = db.query(Mob).filter(Mob.id == mob_id).first()
-    if not mob:
-        raise HTTPException(status_code=404, detail="Mob not found")
-
-    # Get source_type_id for 'mob'
-    source_type = db.query(SourceType).filter(SourceType.name == 'mob').first()
-    if not source_type:
-        raise HTTPException(status_code=500, detail="Source type 'mob' not found in database")
-
-    # Query symbiants via sources
+    # Query symbiants via sources, resolving the 'mob' source type in the join;
+    # only the columns the response uses are selected, so no ORM rows are built
     query = (
-        db.query(SymbiantItem)
+        db.query(
+            SymbiantItem.id, SymbiantItem.aoid, SymbiantItem.name,
+            SymbiantItem.ql, SymbiantItem.slot_id, SymbiantItem.family
+        )
         .join(ItemSource, SymbiantItem.id == ItemSource.item_id)
         .join(Source, ItemSource.source_id == Source.id)
+        .join(SourceType, Source.source_type_id == SourceType.id)
         .filter(
             and_(
                 Source.source_id == mob_id,
-                Source.source_type_id == source_type.id
+                SourceType.name == 'mob'
             )
         )
     )
@@ -185,104 +223,25 @@ def get_mob_drops(
 
     symbiants = query.all()
 
+    # Only an empty result needs to tell "no drops" apart from "no such mob"
+    if not symbiants:
+        if db.query(Mob.id).filter(Mob.id == mob_id).scalar() is None:
+            raise HTTPException(status_code=404, detail="Mob not found")
+        return []
+
     # Get actions/criteria and spell_data for each symbiant by joining with Item table
-    symbiant_ids = [s.id for s in symbiants]
-    items_query = (
+    items = (
         db.query(Item)
-        .filter(Item.id.in_(symbiant_ids))
-        .options(
-            joinedload(Item.actions)
-            .joinedload(Action.action_criteria)
-            .joinedload(ActionCriteria.criterion),
-            joinedload(Item.item_spell_data)
-            .joinedload(ItemSpellData.spell_data)
-            .joinedload(SpellData.spell_data_spells)
-            .joinedload(SpellDataSpells.spell)
-            .joinedload(Spell.spell_criteria)
-            .joinedload(SpellCriterion.criterion)
-        )
+        .filter(Item.id.in_([s.id for s in symbiants]))
+        .options(*symbiant_item_load_options())
+        .all()
     )
-    items = {item.id: item for item in items_query.all()}
-
-    # Build response with actions and spell_data
-    symbiant_responses = []
-    for symbiant in symbiants:
-        item = items.get(symbiant.id)
-        actions = []
-        spell_data_list = []
-
-        if item:
-            # Build actions
-            if item.actions:
-                for action in item.actions:
-                    criteria = [
-                        CriterionResponse(
-                            id=ac.criterion.id,
-                            value1=ac.criterion.value1,
-                            value2=ac.criterion.value2,
-                            operator=ac.criterion.operator
-                        )
-                        for ac in action.action_criteria
-                    ]
-
-                    actions.append(ActionResponse(
-                        id=action.id,
-                        action=action.action,
-                        item_id=action.item_id,
-                        criteria=criteria
-                    ))
-
-            # Build spell_data
-            for isd in item.item_spell_data:
-                spell_data = isd.spell_data
-
-                # Get spells for this spell_data
-                spells_with_criteria = []
-                for sds in spell_data.spell_data_spells:
-                    spell = sds.spell
-
-                    # Get criteria for this spell
-                    criteria = [
-                        CriterionResponse(
-                            id=sc.criterion.id,
-                            value1=sc.criterion.value1,
-                            value2=sc.criterion.value2,
-                            operator=sc.criterion.operator
-                        )
-                        for sc in spell.spell_criteria
-                    ]
-
-                    spells_with_criteria.append(SpellWithCriteria(
-                        id=spell.id,
-                        target=spell.target,
-                        tick_count=spell.tick_count,
-                        tick_interval=spell.tick_interval,
-                        spell_id=spell.spell_id,
-                        spell_format=spell.spell_format,
-                        spell_params=spell.spell_params or {},
-                        criteria=criteria
-                    ))
-
-                spell_data_list.append(SpellDataResponse(
-                    id=spell_data.id,
-                    event=spell_data.event,
-                    spells=spells_with_criteria
-                ))
-
-        symbiant_responses.append(SymbiantResponse(
-            id=symbiant.id,
-            aoid=symbiant.aoid,
-            name=symbiant.name,
-            ql=symbiant.ql,
-            slot_id=symbiant.slot_id,
-            family=symbiant.family,
-            spell_data=spell_data_list,
-            actions=actions
-        ))
+    effects = serialize_item_effects(items)
+    symbiant_responses = [symbiant_response(symbiant, effects) for symbiant in symbiants]
 
     # Log performance metrics
-    query_time = time.time() - start_time
-    logger.info(f"Mob drops query mob_id={mob_id} family='{family}' results={len(symbiants)} time={query_time:.3f}s")
+    query_time = time.perf_counter() - start_time
+    logger.info("Mob drops query mob_id=%s family='%s' results=%d time=%.3fs", mob_id, family, len(symbiants), query_time)
 
     return symbiant_responses
 
@@ -300,11 +259,11 @@ def get_mob(mob_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Mob not found")
 
     # Get source_type_id for 'mob' to count symbiant drops
-    source_type = db.query(SourceType).filter(SourceType.name == 'mob').first()
+    source_type_id = get_mob_source_type_id(db)
 
     # Count symbiant drops for this mob
     symbiant_count = 0
-    if source_type:
+    if source_type_id is not None:
         symbiant_count = (
             db.query(func.count(ItemSource.item_id))
             .select_from(Source)
@@ -312,7 +271,7 @@ def get_mob(mob_id: int, db: Session = Depends(get_db)):
             .filter(
                 and_(
                     Source.source_id == mob_id,
-                    Source.source_type_id == source_type.id
+                    Source.source_type_id == source_type_id
                 )
             )
             .scalar()
@@ -3,13 +3,17 @@ Nano programs API endpoints with rich spell data.
 """
 
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload, selectinload, aliased
-from sqlalchemy import and_, or_, desc, asc, Integer
-import math
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload, aliased
+from sqlalchemy import and_, or_, desc, asc, func, select, text, type_coerce, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+import functools
+import itertools
 import logging
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
 from app.models import (
     Item, ItemStats, StatValue, ItemSpellData, SpellData, SpellDataSpells, Spell, SpellCriterion, Criterion,
     Action, ActionCriteria, Source, SourceType, ItemSource
@@ -26,10 +30,20 @@ from app.api.schemas.nano import (
     NanoTargeting
 )
 from app.core.decorators import cached_response, performance_monitor
+from app.core.pagination import paginate, page_count, count_cache_key, encode_cursor, decode_cursor
 
 router = APIRouter(prefix="/nanos", tags=["nanos"])
 logger = logging.getLogger(__name__)
 
+# In DEBUG, any relationship not covered by an endpoint's loader options raises
+# InvalidRequestError instead of silently issuing an extra lazy-load SELECT
+_LAZY_LOAD_GUARD = (raiseload('*'),) if settings.DEBUG else ()
+
+# Shared empty list for relationship fields the fast list never loads; rows
+# built with model_construct reference it instead of allocating their own.
+# Serialization only reads it, so it must never be mutated.
+_EMPTY: list = []
+
 # Mapping from criterion values to readable skill names
 # NOTE: These are Anarchy Online skill IDs, not nano school IDs
 SKILL_MAPPING = {
@@ -71,83 +85,64 @@ PROFESSION_MAPPING = {
     # Add more as needed
 }
 
+# Single-lookup dispatch for casting requirements: criterion value1 -> (type, name).
+# Later entries win, preserving the skill > stat > level precedence (17 is in both maps).
+_REQ_DISPATCH: Dict[int, tuple] = (
+    {54: ("level", "level")}  # Common level requirement ID
+    | {stat_id: ("stat", name) for stat_id, name in STAT_MAPPING.items()}
+    | {skill_id: ("skill", name) for skill_id, name in SKILL_MAPPING.items()}
+)
+
 
 def parse_nano_from_item_and_spells(item: Item) -> NanoProgram:
     """
     Convert an Item with spell data into a rich NanoProgram object.
     """
+    # Only item-derived values are passed; model_construct fills every other
+    # field (None / fresh empty lists) from the schema defaults
     nano_data = {
         "id": item.id,
         "aoid": item.aoid,
         "name": item.name,
         "ql": item.ql,
         "description": item.description,
-        "casting_requirements": [],
-        "effects": [],
-        "school": None,
-        "strain": None,
-        "profession": None,
-        "level": None,
-        "casting_time": None,
-        "recharge_time": None,
-        "memory_usage": None,
-        "nano_point_cost": None,
-        "duration": None,
-        "targeting": None,
-        "source_location": None,
-        "acquisition_method": None
+        # Strain comes from the name suffix, precomputed by the items.strain_name generated column
+        "strain": item.strain_name,
     }
     
-    # Extract data from associated spells
-    for spell_data in item.spell_data:
-        for spell in spell_data.spells:
-            # Extract casting requirements from criteria
-            for criterion in spell.criteria:
-                req_type = "unknown"
-                req_name = "Unknown"
-                
-                # Determine if this is a skill, stat, or level requirement
-                if criterion.value1 in SKILL_MAPPING:
-                    req_type = "skill"
-                    req_name = SKILL_MAPPING[criterion.value1]
-                elif criterion.value1 in STAT_MAPPING:
-                    req_type = "stat" 
-                    req_name = STAT_MAPPING[criterion.value1]
-                elif criterion.value1 == 54:  # Common level requirement ID
-                    req_type = "level"
-                    req_name = "level"
-                
-                if req_type != "unknown":
-                    nano_data["casting_requirements"].append(
-                        CastingRequirement(
-                            type=req_type,
-                            requirement=req_name,
-                            value=criterion.value2,
-                            critical=True
-                        )
-                    )
-            
-            # Extract basic spell properties
-            if spell.tick_count and not nano_data["casting_time"]:
-                nano_data["casting_time"] = spell.tick_count
-            if spell.tick_interval and not nano_data["recharge_time"]:
-                nano_data["recharge_time"] = spell.tick_interval
+    # Flatten spells and their criteria once, then resolve requirements with one lookup each
+    spells = [spell for spell_data in item.spell_data for spell in spell_data.spells]
+    casting_requirements = [
+        CastingRequirement.model_construct(
+            type=entry[0],
+            requirement=entry[1],
+            value=c.value2,
+            critical=True
+        )
+        for spell in spells
+        for c in spell.criteria
+        if (entry := _REQ_DISPATCH.get(c.value1))
+    ]
+    if casting_requirements:
+        nano_data["casting_requirements"] = casting_requirements
+
+    # Extract basic spell properties (first non-zero value wins)
+    casting_time = next((spell.tick_count for spell in spells if spell.tick_count), None)
+    if casting_time is not None:
+        nano_data["casting_time"] = casting_time
+    recharge_time = next((spell.tick_interval for spell in spells if spell.tick_interval), None)
+    if recharge_time is not None:
+        nano_data["recharge_time"] = recharge_time
     
     # TODO: Extract actual nano school from spell data
     # Nano schools are integers that need proper mapping
-    # For now, leave school as None until we get the proper school integer->name mapping
-    nano_data["school"] = None
+    # For now, school stays None until we get the proper school integer->name mapping
     
-    # Extract strain from name patterns (many AO nanos have strain in name)
-    if " - " in item.name:
-        parts = item.name.split(" - ")
-        if len(parts) > 1:
-            nano_data["strain"] = parts[-1].strip()
-    
-    return NanoProgram(**nano_data)
+    # Built from trusted local values; skip validation (FastAPI still serializes via response_model)
+    return NanoProgram.model_construct(**nano_data)
 
 
-@router.get("", response_model=PaginatedResponse[NanoProgram])
+@router.get("", response_model=PaginatedResponse[NanoProgram], response_class=ORJSONResponse)
 @cached_response("nanos_list")
 @performance_monitor
 def get_nanos(
@@ -162,6 +157,7 @@ def get_nanos(
     ql_max: Optional[int] = Query(None, description="Maximum quality level"),
     sort_by: str = Query("name", description="Sort by: name, ql, level"),
     sort_desc: bool = Query(False, description="Sort descending"),
+    exact_count: bool = Query(False, description="Always recount the total instead of using a cached count"),
     db: Session = Depends(get_db)
 ):
     """
@@ -175,9 +171,8 @@ def get_nanos(
         query = query.filter(Item.ql >= ql_min)
     if ql_max is not None:
         query = query.filter(Item.ql <= ql_max)
-    
-    # Get total count on lightweight query (no relationship loading)
-    total = query.count()
+    if strain:
+        query = query.filter(Item.strain_name == strain)
     
     # Apply sorting
     if sort_by == "name":
@@ -187,17 +182,24 @@ def get_nanos(
     else:
         query = query.order_by(desc(Item.name) if sort_desc else asc(Item.name))
     
-    # Apply pagination and load relationships only for result set
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-    items = query.options(
-        selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
-        selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
-            .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
-            .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
-        selectinload(Item.actions).selectinload(Action.action_criteria)
-            .selectinload(ActionCriteria.criterion)
-    ).offset(offset).limit(page_size).all()
+    # Apply pagination and load relationships only for result set; the total
+    # is derived from a short page or a cached count keyed on the filters
+    items, total = paginate(
+        query.options(
+            selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
+            selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
+                .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
+                .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
+            selectinload(Item.actions).selectinload(Action.action_criteria)
+                .selectinload(ActionCriteria.criterion),
+            *_LAZY_LOAD_GUARD
+        ),
+        page,
+        page_size,
+        count_key=count_cache_key("nanos_list", ql_min=ql_min, ql_max=ql_max, strain=strain),
+        exact_count=exact_count
+    )
+    pages = page_count(total, page_size)
     
     # Convert to NanoProgram objects
     nanos = []
@@ -208,8 +210,6 @@ def get_nanos(
             # Apply advanced filters after parsing
             if school and nano.school != school:
                 continue
-            if strain and nano.strain != strain:
-                continue
             if profession and nano.profession != profession:
                 continue
             if level_min and (nano.level is None or nano.level < level_min):
@@ -240,6 +240,7 @@ def search_nanos(
     q: str = Query(..., min_length=1, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
+    exact_count: bool = Query(False, description="Always recount the total instead of using a cached count"),
     db: Session = Depends(get_db)
 ):
     """
@@ -257,20 +258,22 @@ def search_nanos(
         )
     )
     
-    # Get total count on lightweight query
-    total = query.count()
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-    
     # Load relationships only for result set
-    items = query.options(
-        selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
-        selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
-            .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
-            .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
-        selectinload(Item.actions).selectinload(Action.action_criteria)
-            .selectinload(ActionCriteria.criterion)
-    ).offset(offset).limit(page_size).all()
+    items, total = paginate(
+        query.options(
+            selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
+            selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
+                .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
+                .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
+            selectinload(Item.actions).selectinload(Action.action_criteria)
+                .selectinload(ActionCriteria.criterion),
+            *_LAZY_LOAD_GUARD
+        ),
+        page,
+        page_size,
+        count_key=count_cache_key("nanos_search", q=q),
+        exact_count=exact_count
+    )
     
     nanos = []
     for item in items:
@@ -281,15 +284,7 @@ def search_nanos(
             logger.warning(f"Failed to parse nano {item.id} during search: {e}")
             continue
     
-    return PaginatedResponse[NanoProgram](
-        items=nanos,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
-    )
+    return PaginatedResponse[NanoProgram].from_page(nanos, total, page, page_size)
 
 
 @router.get("/stats", response_model=NanoStatsResponse)
@@ -298,46 +293,62 @@ def search_nanos(
 def get_nano_stats(db: Session = Depends(get_db)):
     """
     Get statistics about available nano programs.
+
+    Computed entirely with SQL aggregates - no nano items are materialized.
     """
-    # Get all nano items with selectinload to avoid Cartesian product explosion
-    items = db.query(Item).filter(Item.is_nano == True).options(
-        selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
-        selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
-            .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
-            .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
-        selectinload(Item.actions).selectinload(Action.action_criteria)
-            .selectinload(ActionCriteria.criterion)
-    ).all()
-    
-    schools = set()
-    strains = set()
-    professions = set()
-    levels = []
-    quality_levels = []
-    
-    for item in items:
-        try:
-            nano = parse_nano_from_item_and_spells(item)
-            if nano.school:
-                schools.add(nano.school)
-            if nano.strain:
-                strains.add(nano.strain)
-            if nano.profession:
-                professions.add(nano.profession)
-            if nano.level:
-                levels.append(nano.level)
-            quality_levels.append(nano.ql)
-        except Exception as e:
-            logger.warning(f"Failed to parse nano {item.id} for stats: {e}")
-            continue
-    
+    total_nanos, min_ql, max_ql = db.query(
+        func.count(Item.id), func.min(Item.ql), func.max(Item.ql)
+    ).filter(Item.is_nano == True).one()
+
+    strains = [
+        row[0] for row in db.query(Item.strain_name).filter(
+            and_(Item.is_nano == True, Item.strain_name.isnot(None))
+        ).distinct().all()
+        if row[0]
+    ]
+
+    # Profession requirements on the USE action (stat 60 = Profession, 368 = VisualProfession)
+    profession_ids = db.query(Criterion.value2).join(
+        ActionCriteria, ActionCriteria.criterion_id == Criterion.id
+    ).join(
+        Action, Action.id == ActionCriteria.action_id
+    ).join(
+        Item, Item.id == Action.item_id
+    ).filter(
+        and_(
+            Item.is_nano == True,
+            Action.action == 3,
+            Criterion.value1.in_([60, 368])
+        )
+    ).distinct().all()
+    professions = {
+        PROFESSION_MAPPING[row[0]] for row in profession_ids if row[0] in PROFESSION_MAPPING
+    }
+
+    # Level requirements (stat 54) on the USE action
+    min_level, max_level = db.query(
+        func.min(Criterion.value2), func.max(Criterion.value2)
+    ).join(
+        ActionCriteria, ActionCriteria.criterion_id == Criterion.id
+    ).join(
+        Action, Action.id == ActionCriteria.action_id
+    ).join(
+        Item, Item.id == Action.item_id
+    ).filter(
+        and_(
+            Item.is_nano == True,
+            Action.action == 3,
+            Criterion.value1 == 54
+        )
+    ).one()
+
     return NanoStatsResponse(
-        total_nanos=len(items),
-        schools=sorted(list(schools)),
-        strains=sorted(list(strains)),
-        professions=sorted(list(professions)),
-        level_range=[min(levels), max(levels)] if levels else [1, 220],
-        quality_level_range=[min(quality_levels), max(quality_levels)] if quality_levels else [1, 300]
+        total_nanos=total_nanos or 0,
+        schools=[],  # School mapping is not available yet (see parse_nano_from_item_and_spells)
+        strains=sorted(strains),
+        professions=sorted(professions),
+        level_range=[min_level, max_level] if min_level is not None else [1, 220],
+        quality_level_range=[min_ql, max_ql] if min_ql is not None else [1, 300]
     )
 
 
@@ -356,7 +367,8 @@ def get_nano(nano_id: int, db: Session = Depends(get_db)):
             .joinedload(SpellData.spell_data_spells).joinedload(SpellDataSpells.spell)
             .joinedload(Spell.spell_criteria).joinedload(SpellCriterion.criterion),
         joinedload(Item.actions).joinedload(Action.action_criteria)
-            .joinedload(ActionCriteria.criterion)
+            .joinedload(ActionCriteria.criterion),
+        *_LAZY_LOAD_GUARD
     ).first()
     
     if not item:
@@ -389,8 +401,96 @@ def get_nano(nano_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Failed to process nano data")
 
 
+# Player profession ids (13 = Monster has no nanos)
+PLAYER_PROFESSION_IDS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 14, 15)
+
+# Profession pages only change on a nano import, which drops them via the "nanos" tag
+PROFESSION_PAGE_TTL = 86400
+
+
+def _json_page(page: PaginatedResponse) -> Response:
+    """Serialize a page once so cache hits are served as raw JSON bytes."""
+    return Response(content=page.model_dump_json(), media_type="application/json")
+
+
+def warm_profession_nano_cache() -> int:
+    """
+    Precompute the profession nano pages exactly as the frontend requests them
+    (page 1, 1000 per page, QL descending) so they are served from cache.
+
+    Returns:
+        Number of pages warmed
+    """
+    warmed = 0
+    db = SessionLocal()
+    try:
+        for profession_id in PLAYER_PROFESSION_IDS:
+            for endpoint in (get_nanos_by_profession, get_offensive_nanos_by_profession):
+                try:
+                    endpoint(
+                        profession_id=profession_id,
+                        page=1,
+                        page_size=1000,
+                        sort="ql",
+                        sort_order="desc",
+                        db=db
+                    )
+                    warmed += 1
+                except Exception as e:
+                    logger.warning(f"Failed to warm {endpoint.__name__} for profession {profession_id}: {e}")
+                    db.rollback()
+    finally:
+        db.close()
+
+    logger.info(f"Warmed {warmed} profession nano pages")
+    return warmed
+
+@functools.lru_cache(maxsize=64)
+def _profession_filter_subquery(profession_id: int):
+    """
+    Select of item ids whose USE action requires the given profession.
+
+    Excludes profession criteria preceded by operator 18 (target modifier).
+    The statement is session-independent, so it is built once per profession
+    and reused across requests.
+    """
+    # Alias for the current and previous criteria
+    ac_current = aliased(ActionCriteria)
+    c_current = aliased(Criterion)
+    ac_prev = aliased(ActionCriteria)
+    c_prev = aliased(Criterion)
+
+    return (
+        select(Action.item_id)
+        .join(ac_current, Action.id == ac_current.action_id)
+        .join(c_current, ac_current.criterion_id == c_current.id)
+        .outerjoin(
+            ac_prev,
+            and_(
+                ac_prev.action_id == Action.id,
+                ac_prev.order_index == ac_current.order_index - 1
+            )
+        )
+        .outerjoin(c_prev, ac_prev.criterion_id == c_prev.id)
+        .where(
+            and_(
+                Action.action == 3,  # USE action
+                or_(
+                    and_(c_current.value1 == 60, c_current.value2 == profession_id),
+                    and_(c_current.value1 == 368, c_current.value2 == profession_id)
+                ),
+                # Exclude if preceded by operator 18 (target modifier)
+                or_(
+                    c_prev.id.is_(None),  # No previous criterion
+                    c_prev.operator != 18  # Previous is not operator 18
+                )
+            )
+        )
+    )
+
+
 @router.get("/profession/{profession_id}", response_model=PaginatedResponse[ItemDetail])
-@cached_response("nanos_profession", ttl=3600)  # Cache for 1 hour
+@cached_response("nanos_profession", ttl=PROFESSION_PAGE_TTL, tag="nanos")
 @performance_monitor
 def get_nanos_by_profession(
     profession_id: int,
@@ -433,42 +533,9 @@ def get_nanos_by_profession(
     # Filter by profession requirement using optimized subquery
     # Excludes profession criteria preceded by operator 18 (target modifier)
     if profession_id > 0:
-        # Alias for the current and previous criteria
-        ac_current = aliased(ActionCriteria)
-        c_current = aliased(Criterion)
-        ac_prev = aliased(ActionCriteria)
-        c_prev = aliased(Criterion)
-
-        profession_subquery = (
-            db.query(Action.item_id)
-            .join(ac_current, Action.id == ac_current.action_id)
-            .join(c_current, ac_current.criterion_id == c_current.id)
-            .outerjoin(
-                ac_prev,
-                and_(
-                    ac_prev.action_id == Action.id,
-                    ac_prev.order_index == ac_current.order_index - 1
-                )
-            )
-            .outerjoin(c_prev, ac_prev.criterion_id == c_prev.id)
-            .filter(
-                and_(
-                    Action.action == 3,  # USE action
-                    or_(
-                        and_(c_current.value1 == 60, c_current.value2 == profession_id),
-                        and_(c_current.value1 == 368, c_current.value2 == profession_id)
-                    ),
-                    # Exclude if preceded by operator 18 (target modifier)
-                    or_(
-                        c_prev.id.is_(None),  # No previous criterion
-                        c_prev.operator != 18  # Previous is not operator 18
-                    )
-                )
-            )
-        )
-        base_query = base_query.filter(Item.id.in_(profession_subquery))
+        base_query = base_query.filter(Item.id.in_(_profession_filter_subquery(profession_id)))
     
-    # Apply sorting with DISTINCT to prevent duplicates
+    # Apply sorting
     if sort == "name":
         base_query = base_query.order_by(desc(Item.name) if sort_order == "desc" else asc(Item.name))
     elif sort == "ql":
@@ -476,29 +543,31 @@ def get_nanos_by_profession(
     else:
         base_query = base_query.order_by(desc(Item.ql) if sort_order == "desc" else asc(Item.ql))
     
-    # Add DISTINCT to prevent duplicates from joins
-    base_query = base_query.distinct()
+    # No DISTINCT needed: every filter is an IN/EXISTS semi-join on Item.id, so rows
+    # are already unique and the planner can stream through the sort index before LIMIT
     
     # Get total count efficiently
-    total = base_query.count()
+    total = base_query.order_by(None).count()
     
     # Apply pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
     offset = (page - 1) * page_size
     
-    # Execute main query with selectinload for better performance
-    items = base_query.offset(offset).limit(page_size).options(
-        # Use selectinload instead of joinedload to avoid cartesian products
-        selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
-        selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
-            .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
-            .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
-        selectinload(Item.actions).selectinload(Action.action_criteria)
-            .selectinload(ActionCriteria.criterion),
-        # Skip source loading if not critical for performance
-        # selectinload(Item.item_sources).selectinload(ItemSource.source)
-        #     .selectinload(Source.source_type)
-    ).all()
+    # Execute main query with selectinload for better performance; nothing to
+    # fetch when nothing matched or the page starts past the end
+    items = []
+    if offset < total:
+        items = base_query.offset(offset).limit(page_size).options(
+            # Use selectinload instead of joinedload to avoid cartesian products
+            selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
+            selectinload(Item.actions).selectinload(Action.action_criteria)
+                .selectinload(ActionCriteria.criterion),
+            *_LAZY_LOAD_GUARD,
+            # Spell data is not used by the TinkerNanos profession view (it reads stats and
+            # the USE action only), so skip the six-level spell chain entirely
+            # Skip source loading if not critical for performance
+            # selectinload(Item.item_sources).selectinload(ItemSource.source)
+            #     .selectinload(Source.source_type)
+        ).all()
     
     # Convert to ItemDetail objects - now all filtering is done at DB level
     detailed_items = []
@@ -508,9 +577,6 @@ def get_nanos_by_profession(
         # Build stats response
         stats_response = [stat.stat_value for stat in item.item_stats] if item.item_stats else []
         
-        # Build spell data response
-        spell_data_list = [isd.spell_data for isd in item.item_spell_data] if item.item_spell_data else []
-        
         # Build actions response
         actions = [action for action in item.actions] if item.actions else []
         
@@ -526,26 +592,18 @@ def get_nanos_by_profession(
             description=item.description,
             is_nano=item.is_nano,
             stats=stats_response,
-            spell_data=spell_data_list,
+            spell_data=[],  # Not loaded - unused by the profession view
             attack_stats=[],  # Nanos don't have attack stats
             defense_stats=[], # Nanos don't have defense stats
             actions=actions,
             sources=sources
         ))
     
-    return PaginatedResponse[ItemDetail](
-        items=detailed_items,
-        total=total,  # Now accurate count from DB filtering
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
-    )
+    return _json_page(PaginatedResponse[ItemDetail].from_page(detailed_items, total, page, page_size))
 
 
 @router.get("/offensive/{profession_id}", response_model=PaginatedResponse[ItemDetail])
-@cached_response("nanos_offensive", ttl=3600)  # Cache for 1 hour
+@cached_response("nanos_offensive", ttl=PROFESSION_PAGE_TTL, tag="nanos")
 @performance_monitor
 def get_offensive_nanos_by_profession(
     profession_id: int,
@@ -599,7 +657,9 @@ def get_offensive_nanos_by_profession(
                     and_(
                         Spell.target == 3,  # Offensive target
                         Spell.spell_id == 53002,  # Modify stat spell
-                        Spell.spell_params.op('->>')('Stat').cast(Integer) == 27  # Health damage
+                        # Same expression as idx_spells_offensive_stat_param so the planner can use it;
+                        # the model maps spell_params as generic JSON, so coerce to JSONB for ->>
+                        type_coerce(Spell.spell_params, JSONB)['Stat'].astext.cast(Integer) == 27  # Health damage
                     )
                 )
             )
@@ -609,42 +669,9 @@ def get_offensive_nanos_by_profession(
     # Filter by profession requirement using optimized subquery
     # Excludes profession criteria preceded by operator 18 (target modifier)
     if profession_id > 0:
-        # Alias for the current and previous criteria
-        ac_current = aliased(ActionCriteria)
-        c_current = aliased(Criterion)
-        ac_prev = aliased(ActionCriteria)
-        c_prev = aliased(Criterion)
-
-        profession_subquery = (
-            db.query(Action.item_id)
-            .join(ac_current, Action.id == ac_current.action_id)
-            .join(c_current, ac_current.criterion_id == c_current.id)
-            .outerjoin(
-                ac_prev,
-                and_(
-                    ac_prev.action_id == Action.id,
-                    ac_prev.order_index == ac_current.order_index - 1
-                )
-            )
-            .outerjoin(c_prev, ac_prev.criterion_id == c_prev.id)
-            .filter(
-                and_(
-                    Action.action == 3,  # USE action
-                    or_(
-                        and_(c_current.value1 == 60, c_current.value2 == profession_id),
-                        and_(c_current.value1 == 368, c_current.value2 == profession_id)
-                    ),
-                    # Exclude if preceded by operator 18 (target modifier)
-                    or_(
-                        c_prev.id.is_(None),  # No previous criterion
-                        c_prev.operator != 18  # Previous is not operator 18
-                    )
-                )
-            )
-        )
-        base_query = base_query.filter(Item.id.in_(profession_subquery))
+        base_query = base_query.filter(Item.id.in_(_profession_filter_subquery(profession_id)))
 
-    # Apply sorting with DISTINCT to prevent duplicates
+    # Apply sorting
     if sort == "name":
         base_query = base_query.order_by(desc(Item.name) if sort_order == "desc" else asc(Item.name))
     elif sort == "ql":
@@ -652,26 +679,29 @@ def get_offensive_nanos_by_profession(
     else:
         base_query = base_query.order_by(desc(Item.ql) if sort_order == "desc" else asc(Item.ql))
 
-    # Add DISTINCT to prevent duplicates from joins
-    base_query = base_query.distinct()
+    # No DISTINCT needed: every filter is an IN/EXISTS semi-join on Item.id, so rows
+    # are already unique and the planner can stream through the sort index before LIMIT
 
     # Get total count efficiently
-    total = base_query.count()
+    total = base_query.order_by(None).count()
 
     # Apply pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
     offset = (page - 1) * page_size
 
-    # Execute main query with selectinload for better performance
-    items = base_query.offset(offset).limit(page_size).options(
-        # Use selectinload instead of joinedload to avoid cartesian products
-        selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
-        selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
-            .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
-            .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
-        selectinload(Item.actions).selectinload(Action.action_criteria)
-            .selectinload(ActionCriteria.criterion),
-    ).all()
+    # Execute main query with selectinload for better performance; nothing to
+    # fetch when nothing matched or the page starts past the end
+    items = []
+    if offset < total:
+        items = base_query.offset(offset).limit(page_size).options(
+            # Use selectinload instead of joinedload to avoid cartesian products
+            selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
+            selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
+                .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
+                .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
+            selectinload(Item.actions).selectinload(Action.action_criteria)
+                .selectinload(ActionCriteria.criterion),
+            *_LAZY_LOAD_GUARD
+        ).all()
 
     # Convert to ItemDetail objects - now all filtering is done at DB level
     detailed_items = []
@@ -706,18 +736,91 @@ def get_offensive_nanos_by_profession(
             sources=sources
         ))
 
-    return PaginatedResponse[ItemDetail](
-        items=detailed_items,
-        total=total,  # Now accurate count from DB filtering
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
+    return _json_page(PaginatedResponse[ItemDetail].from_page(detailed_items, total, page, page_size))
+
+
+# Precompiled raw SQL for get_nanos_by_profession_fast.
+# Variants are built once at import; the endpoint only selects one per request.
+# Filters are EXISTS/IN semi-joins, so rows are unique without DISTINCT.
+_FAST_BASE_WHERE = """
+        FROM items i
+        WHERE i.is_nano = true
+        AND NOT i.name LIKE 'TESTLIVEITEM%'
+        AND EXISTS (
+            SELECT 1 FROM item_stats ist 
+            JOIN stat_values sv ON ist.stat_value_id = sv.id 
+            WHERE ist.item_id = i.id AND sv.stat = 75 
+            AND sv.value > 0 AND sv.value != 99999
+        )
+"""
+
+_FAST_PROFESSION_CLAUSE = """
+        AND i.id IN (
+            SELECT a.item_id FROM actions a
+            JOIN action_criteria ac ON a.id = ac.action_id
+            JOIN criteria c ON ac.criterion_id = c.id
+            WHERE a.action = 3
+            AND ((c.value1 = 60 AND c.value2 = :prof_id)
+                 OR (c.value1 = 368 AND c.value2 = :prof_id))
+        )
+"""
+
+
+def _build_fast_select(has_profession: bool, sort_by_ql: bool, descending: bool, has_cursor: bool):
+    """Build one SELECT variant for the fast profession endpoint."""
+    sort_column = "i.ql" if sort_by_ql else "i.name"
+    direction = "DESC" if descending else "ASC"
+    # Keyset seek: continue strictly after the last (sort value, id) returned
+    seek_clause = (
+        f"\n        AND ({sort_column}, i.id) {'<' if descending else '>'} (:after_value, :after_id)"
+        if has_cursor else ""
+    )
+    # Without a cursor the window count sees every match, so the page carries
+    # the total; with one it would only count rows after the cursor
+    total_column = "pg.total_count" if not has_cursor else "NULL"
+    inner_total = ", COUNT(*) OVER () AS total_count" if not has_cursor else ""
+    # Deferred join: filter, sort and LIMIT/OFFSET over narrow (id, sort column)
+    # rows, then fetch the wide columns (description etc.) for the page only
+    return text(
+        f"""
+        SELECT
+            w.id, w.aoid, w.name, w.ql, w.item_class, w.description, w.is_nano,
+            {total_column} AS total_count
+        FROM items w
+        JOIN (
+        SELECT i.id{inner_total}
+"""
+        + _FAST_BASE_WHERE
+        + (_FAST_PROFESSION_CLAUSE if has_profession else "")
+        + seek_clause
+        + f"""
+        ORDER BY {sort_column} {direction}, i.id {direction}
+        LIMIT :limit OFFSET :offset
+        ) pg ON pg.id = w.id
+        ORDER BY {sort_column.replace("i.", "w.")} {direction}, w.id {direction}
+"""
+    )
+
+
+# Keyed on (has_profession, sort_by_ql, descending, has_cursor)
+_FAST_SELECT_SQL = {
+    key: _build_fast_select(*key)
+    for key in itertools.product((True, False), repeat=4)
+}
+
+
+# Keyed on has_profession
+_FAST_COUNT_SQL = {
+    has_profession: text(
+        "\n        SELECT COUNT(*)"
+        + _FAST_BASE_WHERE
+        + (_FAST_PROFESSION_CLAUSE if has_profession else "")
     )
+    for has_profession in (True, False)
+}
 
 
-@router.get("/profession/{profession_id}/fast", response_model=PaginatedResponse[ItemDetail])
+@router.get("/profession/{profession_id}/fast", response_model=PaginatedResponse[ItemDetail], response_class=ORJSONResponse)
 @cached_response("nanos_profession_fast", ttl=7200)  # Cache for 2 hours
 @performance_monitor
 def get_nanos_by_profession_fast(
@@ -726,6 +829,7 @@ def get_nanos_by_profession_fast(
     page_size: int = Query(1000, ge=1, le=1000, description="Items per page"),
     sort: str = Query("ql", description="Sort field: name, ql"),
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; overrides page"),
     db: Session = Depends(get_db)
 ):
     """
@@ -736,59 +840,16 @@ def get_nanos_by_profession_fast(
     - Raw SQL for complex filters
     - Simplified response objects
     - Extended caching
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to page with an index
+    seek on (sort column, id) instead of OFFSET. ``page`` still works but is
+    deprecated: deep offsets scan and discard every preceding row.
     """
-    from sqlalchemy import text
-    
-    # Build optimized SQL query with minimal joins
-    sort_field = "i.ql" if sort == "ql" else "i.name"
-    sort_direction = "DESC" if sort_order == "desc" else "ASC"
-    
-    # Use raw SQL for maximum performance
-    sql_query = text(f"""
-        SELECT DISTINCT
-            i.id, i.aoid, i.name, i.ql, i.item_class, i.description, i.is_nano
-        FROM items i
-        WHERE i.is_nano = true
-        AND NOT i.name LIKE 'TESTLIVEITEM%'
-        AND EXISTS (
-            SELECT 1 FROM item_stats ist 
-            JOIN stat_values sv ON ist.stat_value_id = sv.id 
-            WHERE ist.item_id = i.id AND sv.stat = 75 
-            AND sv.value > 0 AND sv.value != 99999
-        )
-        {'AND i.id IN (\
-            SELECT a.item_id FROM actions a\
-            JOIN action_criteria ac ON a.id = ac.action_id\
-            JOIN criteria c ON ac.criterion_id = c.id\
-            WHERE a.action = 3\
-            AND ((c.value1 = 60 AND c.value2 = :prof_id)\
-                 OR (c.value1 = 368 AND c.value2 = :prof_id))\
-        )' if profession_id > 0 else ''}
-        ORDER BY {sort_field} {sort_direction}
-        LIMIT :limit OFFSET :offset
-    """)
-    
-    count_query = text("""
-        SELECT COUNT(DISTINCT i.id)
-        FROM items i
-        WHERE i.is_nano = true
-        AND NOT i.name LIKE 'TESTLIVEITEM%'
-        AND EXISTS (
-            SELECT 1 FROM item_stats ist 
-            JOIN stat_values sv ON ist.stat_value_id = sv.id 
-            WHERE ist.item_id = i.id AND sv.stat = 75 
-            AND sv.value > 0 AND sv.value != 99999
-        )
-    """ + (""" 
-        AND i.id IN (
-            SELECT a.item_id FROM actions a
-            JOIN action_criteria ac ON a.id = ac.action_id
-            JOIN criteria c ON ac.criterion_id = c.id
-            WHERE a.action = 3
-            AND ((c.value1 = 60 AND c.value2 = :prof_id)
-                 OR (c.value1 = 368 AND c.value2 = :prof_id))
-        )
-    """ if profession_id > 0 else ""))
+    # Pick the precompiled statement variant - no per-request SQL string building
+    has_profession = profession_id > 0
+    sort_by_ql = sort == "ql"
+    sql_query = _FAST_SELECT_SQL[(has_profession, sort_by_ql, sort_order == "desc", cursor is not None)]
+    count_query = _FAST_COUNT_SQL[has_profession]
     
     # Execute queries
     offset = (page - 1) * page_size
@@ -797,18 +858,26 @@ def get_nanos_by_profession_fast(
         'offset': offset,
         'prof_id': profession_id if profession_id > 0 else None
     }
+    if cursor is not None:
+        params['after_value'], params['after_id'] = decode_cursor(cursor, (int if sort_by_ql else str, int))
+        params['offset'] = 0
     
-    # Get total count
-    count_result = db.execute(count_query, params).scalar()
-    total = count_result or 0
-    
-    # Get items
+    # Get items; non-cursor pages carry the total via COUNT(*) OVER ()
     result = db.execute(sql_query, params).fetchall()
     
+    # Separate count only for cursor pages, or past the last offset page
+    if result and cursor is None:
+        total = result[0].total_count
+    elif not result and cursor is None and page == 1:
+        total = 0
+    else:
+        total = db.execute(count_query, params).scalar() or 0
+    
     # Build minimal ItemDetail objects
     detailed_items = []
     for row in result:
-        detailed_items.append(ItemDetail(
+        # Plain column values with empty relationship lists - safe to skip validation
+        detailed_items.append(ItemDetail.model_construct(
             id=row[0],
             aoid=row[1],
             name=row[2],
@@ -816,22 +885,22 @@ def get_nanos_by_profession_fast(
             item_class=row[4],
             description=row[5] or "",
             is_nano=row[6],
-            stats=[],  # Skip for performance - load separately if needed
-            spell_data=[],  # Skip for performance - load separately if needed
-            attack_stats=[],
-            defense_stats=[],
-            actions=[],  # Skip for performance - load separately if needed
-            sources=[]   # Skip for performance - load separately if needed
+            stats=_EMPTY,  # Skip for performance - load separately if needed
+            spell_data=_EMPTY,
+            attack_stats=_EMPTY,
+            defense_stats=_EMPTY,
+            actions=_EMPTY,
+            sources=_EMPTY
         ))
     
-    pages = math.ceil(total / page_size) if total > 0 else 1
+    next_cursor = None
+    if len(result) == page_size:
+        last = result[-1]
+        next_cursor = encode_cursor(last[3] if sort_by_ql else last[2], last[0])
     
-    return PaginatedResponse[ItemDetail](
-        items=detailed_items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
+    return PaginatedResponse[ItemDetail].from_page(
+        detailed_items, total, page, page_size,
+        has_next=next_cursor is not None if cursor is not None else None,
+        has_prev=cursor is not None or page > 1,
+        next_cursor=next_cursor
     )
\ No newline at end of file
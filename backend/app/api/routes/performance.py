@@ -2,14 +2,21 @@
 Performance monitoring and optimization API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.indexes import create_performance_indexes, check_index_usage, analyze_slow_queries
 from app.core.cache import get_cache_stats
+import asyncio
 import logging
 
-router = APIRouter(prefix="/performance", tags=["performance"])
+
+def no_store(response: Response) -> None:
+    """Monitoring numbers must always be fresh - keep them out of HTTP caches."""
+    response.headers["Cache-Control"] = "no-store"
+
+
+router = APIRouter(prefix="/performance", tags=["performance"], dependencies=[Depends(no_store)])
 logger = logging.getLogger(__name__)
 
 
@@ -63,15 +70,25 @@ def get_slow_queries(
 
 
 @router.get("/overview")
-def get_performance_overview(db: Session = Depends(get_db)):
+async def get_performance_overview(
+    db: Session = Depends(get_db),
+    slow_query_db: Session = Depends(get_db, use_cache=False)
+):
     """
     Get comprehensive performance overview including cache stats, index usage, and slow queries.
+
+    The two system-view queries run concurrently in worker threads, each on
+    its own session, so the overview takes as long as the slower of them.
     """
     try:
+        index_usage, slow_queries = await asyncio.gather(
+            asyncio.to_thread(check_index_usage, db),
+            asyncio.to_thread(analyze_slow_queries, slow_query_db, 500)
+        )
         overview = {
             "cache_stats": get_cache_stats(),
-            "index_usage": check_index_usage(db),
-            "slow_queries": analyze_slow_queries(db, 500)
+            "index_usage": index_usage,
+            "slow_queries": slow_queries
         }
         
         return overview
@@ -7,11 +7,13 @@ three distinct type systems: SL (Shadowlands), AI (Alien Invasion), and LE (Lost
 """
 
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, desc, asc
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
-import math
+from itertools import groupby
+from operator import attrgetter
+import orjson
 import logging
 import time
 
@@ -23,11 +25,15 @@ from app.api.schemas.perk import (
     PerkValidationResponse, PerkSeriesResponse, PerkSeriesPerk
 )
 from app.api.schemas import PaginatedResponse
+from app.core.cache import CACHE_TTL
 from app.core.decorators import cached_response, performance_monitor
 
-router = APIRouter(prefix="/perks", tags=["perks"])
+router = APIRouter(prefix="/perks", tags=["perks"], default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+# Perk definitions only change on import; clients revalidate with the ETag hourly
+PERK_DATA_CACHE_CONTROL = "public, max-age=3600"
+
 
 # Batch lookup schemas
 class BatchPerkLookupRequest(BaseModel):
@@ -50,162 +56,8 @@ def get_perk_service(db: Session = Depends(get_db)) -> PerkService:
     return PerkService(db)
 
 
-def _get_filtered_perks_from_service(
-    perk_service: PerkService,
-    type: Optional[str] = None,
-    profession: Optional[str] = None,
-    breed: Optional[str] = None,
-    min_level: Optional[int] = None,
-    max_level: Optional[int] = None,
-    ai_level: Optional[int] = None,
-    series: Optional[str] = None,
-    search: Optional[str] = None,
-    character_level: Optional[int] = None,
-    character_profession: Optional[str] = None,
-    character_breed: Optional[str] = None,
-    ai_title_level: Optional[int] = None,
-    available_sl_points: Optional[int] = None,
-    available_ai_points: Optional[int] = None
-) -> List[PerkResponse]:
-    """
-    Get filtered perks using efficient database queries.
-
-    This function builds database queries to filter perks based on the new
-    perks table structure, avoiding JSON-based filtering for better performance.
-    """
-    from app.models.perk import Perk
-    from app.models.item import Item, ItemSpellData
-    from sqlalchemy import and_, or_, func
-
-    # Start with base query joining items with perks table
-    query = perk_service.db.query(Item)\
-        .join(Perk, Item.id == Perk.item_id)\
-        .join(ItemSpellData, Item.id == ItemSpellData.item_id)
-
-    # Apply basic filters using database queries
-    if type:
-        query = query.filter(Perk.type == type)
-
-    if series:
-        query = query.filter(Perk.perk_series == series)
-
-    if search:
-        query = query.filter(Perk.name.ilike(f'%{search}%'))
-
-    # Apply level filtering
-    if min_level is not None:
-        query = query.filter(Perk.level_required >= min_level)
-    if max_level is not None:
-        query = query.filter(Perk.level_required <= max_level)
-
-    # Apply AI level filtering
-    if ai_level is not None:
-        query = query.filter(Perk.ai_level_required <= ai_level)
-
-    # Apply profession filtering (handle both name and ID)
-    if profession:
-        try:
-            # Try as integer ID first
-            profession_id = int(profession)
-        except ValueError:
-            # Convert name to ID
-            profession_id = perk_service._profession_name_to_id(profession)
-
-        if profession_id is not None:
-            query = query.filter(
-                or_(
-                    func.array_length(Perk.professions, 1).is_(None),
-                    func.array_length(Perk.professions, 1) == 0,
-                    Perk.professions.contains([profession_id])
-                )
-            )
-
-    # Apply breed filtering (handle both name and ID)
-    if breed:
-        try:
-            # Try as integer ID first
-            breed_id = int(breed)
-        except ValueError:
-            # Convert name to ID
-            breed_id = perk_service._breed_name_to_id(breed)
-
-        if breed_id is not None:
-            query = query.filter(
-                or_(
-                    func.array_length(Perk.breeds, 1).is_(None),
-                    func.array_length(Perk.breeds, 1) == 0,
-                    Perk.breeds.contains([breed_id])
-                )
-            )
-
-    # Execute query with proper loading of relationships
-    from sqlalchemy.orm import joinedload
-    results = query.options(
-        joinedload(Item.perk),
-        joinedload(Item.item_spell_data).joinedload(ItemSpellData.spell_data)
-    ).distinct().all()
-
-    # Convert to response objects with character compatibility checks
-    perk_responses = []
-    for item in results:
-        perk = item.perk
-        if not perk:
-            continue
-
-        # Apply character compatibility filtering if provided
-        if character_level is not None and perk.level_required > character_level:
-            continue
-
-        if character_profession and perk.professions and len(perk.professions) > 0:
-            char_prof_id = perk_service._profession_name_to_id(character_profession)
-            if char_prof_id and char_prof_id not in perk.professions:
-                continue
-
-        if character_breed and perk.breeds and len(perk.breeds) > 0:
-            char_breed_id = perk_service._breed_name_to_id(character_breed)
-            if char_breed_id and char_breed_id not in perk.breeds:
-                continue
-
-        if ai_title_level is not None and perk.ai_level_required > ai_title_level:
-            continue
-
-        # Check point affordability
-        if not perk_service._is_affordable(
-            perk.type, perk.counter, available_sl_points, available_ai_points, None, perk.name
-        ):
-            continue
-
-        # Handle empty arrays as "all professions/breeds allowed"
-        professions = perk_service._profession_ids_to_names(perk.professions or [])
-        breeds = perk_service._breed_ids_to_names(perk.breeds or [])
-
-        if not perk.professions or len(perk.professions) == 0:
-            professions = []
-        if not perk.breeds or len(perk.breeds) == 0:
-            breeds = []
-
-        perk_response = PerkResponse(
-            id=item.id,
-            aoid=item.aoid,
-            name=perk.name,
-            counter=perk.counter,
-            type=perk.type,
-            professions=professions,
-            breeds=breeds,
-            level=perk.level_required,
-            ai_title=perk.ai_level_required if perk.ai_level_required > 0 else None,
-            description=item.description,
-            ql=item.ql,
-            perk_series=perk.perk_series,
-            formatted_name=f"{perk.name} {perk.counter}"
-        )
-        perk_responses.append(perk_response)
-
-    return perk_responses
-
-
 @router.get("", response_model=PaginatedResponse[PerkResponse])
-@cached_response("perks_list")
+@cached_response("perks_list", tag="perks")
 @performance_monitor
 def get_perks(
     page: int = Query(1, ge=1, description="Page number"),
@@ -244,10 +96,9 @@ def get_perks(
     """
     logger.info(f"Getting perks: page={page}, series={series}, profession={profession}, type={type}")
 
-    # Get filtered perks using database queries for better performance
-    filtered_perks = _get_filtered_perks_from_service(
-        perk_service=perk_service,
-        type=type,
+    # Filtering, sorting and paging all run in a single SQL query
+    paginated_perks, total = perk_service.list_perks(
+        perk_types=[type] if type else None,
         profession=profession,
         breed=breed,
         min_level=min_level,
@@ -260,43 +111,20 @@ def get_perks(
         character_breed=character_breed,
         ai_title_level=ai_title_level,
         available_sl_points=available_sl_points,
-        available_ai_points=available_ai_points
+        available_ai_points=available_ai_points,
+        sort_by=sort_by,
+        sort_desc=sort_desc,
+        page=page,
+        page_size=page_size
     )
 
-    # Apply sorting
-    reverse = sort_desc
-    if sort_by == "name":
-        filtered_perks.sort(key=lambda p: p.name, reverse=reverse)
-    elif sort_by == "level":
-        filtered_perks.sort(key=lambda p: p.level, reverse=reverse)
-    elif sort_by == "type":
-        filtered_perks.sort(key=lambda p: p.type, reverse=reverse)
-    elif sort_by == "counter":
-        filtered_perks.sort(key=lambda p: p.counter, reverse=reverse)
-    else:
-        filtered_perks.sort(key=lambda p: p.name, reverse=reverse)
-
-    # Apply pagination
-    total = len(filtered_perks)
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-    paginated_perks = filtered_perks[offset:offset + page_size]
-
     logger.info(f"Returning {len(paginated_perks)} perks (total: {total})")
 
-    return PaginatedResponse[PerkResponse](
-        items=paginated_perks,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
-    )
+    return PaginatedResponse[PerkResponse].from_page(paginated_perks, total, page, page_size)
 
 
 @router.get("/search", response_model=PaginatedResponse[PerkResponse])
-@cached_response("perks_search")
+@cached_response("perks_search", tag="perks")
 @performance_monitor
 def search_perks(
     request: PerkSearchRequest,
@@ -313,143 +141,90 @@ def search_perks(
     """
     logger.info(f"Advanced perk search with query: {request.query}")
 
-    # Get available perks from service
-    perks = perk_service.get_available_perks(
+    paginated_perks, total = perk_service.list_perks(
+        perk_types=request.types,
+        search=request.query,
+        professions=request.professions,
+        breeds=request.breeds,
+        level_range=request.level_range,
+        ai_title_range=request.ai_title_range,
+        counter_range=request.counter_range,
         character_level=request.character_level,
         character_profession=request.character_professions[0] if request.character_professions else None,
         character_breed=request.character_breed,
         ai_title_level=request.ai_title_level,
-        perk_types=request.types,
         available_sl_points=request.available_sl_points,
         available_ai_points=request.available_ai_points,
-        owned_perks=request.owned_perks
+        owned_perks=request.owned_perks,
+        sort_by=request.sort_by,
+        sort_desc=request.sort_descending,
+        page=page,
+        page_size=page_size
     )
 
-    # Apply search filters
-    filtered_perks = []
-    for perk in perks:
-        # Text search
-        if request.query and request.query.lower() not in perk.name.lower():
-            continue
-
-        # Profession filter
-        if request.professions and not any(prof in perk.professions for prof in request.professions):
-            continue
-
-        # Breed filter
-        if request.breeds and not any(breed in perk.breeds for breed in request.breeds):
-            continue
-
-        # Level range filter
-        if request.level_range and len(request.level_range) == 2:
-            if perk.level < request.level_range[0] or perk.level > request.level_range[1]:
-                continue
-
-        # AI title range filter
-        if request.ai_title_range and len(request.ai_title_range) == 2 and perk.ai_title:
-            if perk.ai_title < request.ai_title_range[0] or perk.ai_title > request.ai_title_range[1]:
-                continue
-
-        # Counter range filter
-        if request.counter_range and len(request.counter_range) == 2:
-            if perk.counter < request.counter_range[0] or perk.counter > request.counter_range[1]:
-                continue
-
-        filtered_perks.append(perk)
-
-    # Apply sorting
-    reverse = request.sort_descending
-    if request.sort_by == "name":
-        filtered_perks.sort(key=lambda p: p.name, reverse=reverse)
-    elif request.sort_by == "level":
-        filtered_perks.sort(key=lambda p: p.level, reverse=reverse)
-    elif request.sort_by == "type":
-        filtered_perks.sort(key=lambda p: p.type, reverse=reverse)
-    elif request.sort_by == "cost":
-        # Sort by cumulative cost (counter for SL/AI, 0 for LE)
-        filtered_perks.sort(key=lambda p: p.counter if p.type in ['SL', 'AI'] else 0, reverse=reverse)
-    else:
-        filtered_perks.sort(key=lambda p: p.name, reverse=reverse)
-
-    # Apply pagination
-    total = len(filtered_perks)
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-    paginated_perks = filtered_perks[offset:offset + page_size]
-
     logger.info(f"Advanced search returning {len(paginated_perks)} perks (total: {total})")
 
-    return PaginatedResponse[PerkResponse](
-        items=paginated_perks,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
-    )
+    return PaginatedResponse[PerkResponse].from_page(paginated_perks, total, page, page_size)
+
+
+def _not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str = PERK_DATA_CACHE_CONTROL
+) -> Optional[Response]:
+    """
+    Conditional GET for perk data: tag the response with ``etag`` and, if the
+    client already holds that version, return an empty 304 to send instead.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison (RFC 9110): W/ prefixes are ignored
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
 
 
 @router.get("/stats", response_model=PerkStatsResponse)
-@cached_response("perks_stats", ttl=3600)
 @performance_monitor
 def get_perk_stats(
+    request: Request,
+    response: Response,
     perk_service: PerkService = Depends(get_perk_service)
 ):
     """
     Get statistics about available perks in the database.
 
     Returns aggregate information about perk types, profession/breed requirements,
-    and level ranges to help with UI filtering and validation.
+    and level ranges to help with UI filtering and validation. Supports
+    conditional GET via ETag/If-None-Match.
     """
+    not_modified = _not_modified(request, response, perk_service.get_data_etag())
+    if not_modified:
+        return not_modified
+    return _perk_stats(perk_service=perk_service)
+
+
+@cached_response("perks_stats", ttl=3600, tag="perks")
+def _perk_stats(perk_service: PerkService) -> PerkStatsResponse:
+    """Server-side cached body of get_perk_stats."""
     logger.info("Getting perk statistics")
 
-    # Get all perks for statistics
-    all_perks = perk_service.get_available_perks()
-
-    # Collect statistics
-    types = set()
-    professions = set()
-    breeds = set()
-    levels = []
-    ai_titles = []
-    series_names = set()
-
-    for perk in all_perks:
-        types.add(perk.type)
-        professions.update(perk.professions)
-        breeds.update(perk.breeds)
-        levels.append(perk.level)
-        if perk.ai_title:
-            ai_titles.append(perk.ai_title)
-
-        # Extract base perk name for series counting
-        base_name = perk.name
-        if ' ' in perk.name and perk.name.split()[-1].isdigit():
-            base_name = ' '.join(perk.name.split()[:-1])
-        series_names.add(base_name)
-
-    level_range = [min(levels), max(levels)] if levels else [1, 220]
-    ai_title_range = [min(ai_titles), max(ai_titles)] if ai_titles else [1, 30]
-
-    stats = PerkStatsResponse(
-        total_perks=len(all_perks),
-        total_series=len(series_names),
-        types=sorted(list(types)),
-        professions=sorted(list(professions)),
-        breeds=sorted(list(breeds)),
-        level_range=level_range,
-        ai_title_range=ai_title_range
-    )
+    # Aggregated in SQL; the cached result is a handful of values
+    stats = perk_service.get_perk_stats()
 
     logger.info(f"Perk stats: {stats.total_perks} perks, {stats.total_series} series")
     return stats
 
 
 @router.get("/series", response_model=List[PerkSeriesResponse])
-@cached_response("perks_series")
 @performance_monitor
 def get_perk_series_grouped(
+    request: Request,
+    response: Response,
     profession: Optional[str] = Query(None, description="Filter by required profession"),
     breed: Optional[str] = Query(None, description="Filter by required breed"),
     type: Optional[str] = Query(None, description="Filter by perk type (SL, AI, LE)"),
@@ -459,104 +234,60 @@ def get_perk_series_grouped(
     Get perks grouped by series name.
 
     Returns all perk series with their counters (1-10), showing profession/breed requirements,
-    type information, and level requirements for each series.
+    type information, and level requirements for each series. Supports
+    conditional GET via ETag/If-None-Match.
     """
+    not_modified = _not_modified(request, response, perk_service.get_data_etag())
+    if not_modified:
+        return not_modified
+    return _perk_series_grouped(profession=profession, breed=breed, type=type, perk_service=perk_service)
+
+
+@cached_response("perks_series", tag="perks")
+def _perk_series_grouped(
+    profession: Optional[str],
+    breed: Optional[str],
+    type: Optional[str],
+    perk_service: PerkService
+) -> List[PerkSeriesResponse]:
+    """Server-side cached body of get_perk_series_grouped."""
     logger.info(f"Getting perk series grouped - profession: {profession}, breed: {breed}, type: {type}")
 
-    # Import Perk model here to avoid circular imports
-    from app.models.perk import Perk
-    from app.models.item import Item
-
-    # Get database session from perk_service
-    db = perk_service.db
-
-    # Build base query to get all perks with their series
-    query = db.query(Perk.perk_series, Perk.type, Perk.professions, Perk.breeds)\
-        .join(Item, Perk.item_id == Item.id)\
-        .distinct(Perk.perk_series)
-
-    # Apply filtering
-    if profession:
-        # Convert profession name to ID for filtering
-        profession_id = perk_service._profession_name_to_id(profession)
-        if profession_id is not None:
-            query = query.filter(
-                or_(
-                    func.array_length(Perk.professions, 1).is_(None),
-                    func.array_length(Perk.professions, 1) == 0,
-                    Perk.professions.contains([profession_id])
-                )
-            )
-
-    if breed:
-        # Convert breed name to ID for filtering
-        breed_id = perk_service._breed_name_to_id(breed)
-        if breed_id is not None:
-            query = query.filter(
-                or_(
-                    func.array_length(Perk.breeds, 1).is_(None),
-                    func.array_length(Perk.breeds, 1) == 0,
-                    Perk.breeds.contains([breed_id])
-                )
-            )
-
-    if type:
-        query = query.filter(Perk.type == type)
-
-    # Execute query to get series metadata
-    series_results = query.all()
-
-    # Collect all matching series names
-    series_names = [row[0] for row in series_results]
-
-    # Load ALL perks for ALL matching series in a single query (eliminates N+1)
-    all_perks_query = db.query(Perk, Item.aoid)\
-        .join(Item, Perk.item_id == Item.id)\
-        .filter(Perk.perk_series.in_(series_names))\
-        .order_by(Perk.perk_series, Perk.counter)
-
-    all_perk_rows = all_perks_query.all()
-
-    # Group perks by series name
-    from collections import defaultdict
-    perks_by_series = defaultdict(list)
-    for perk, aoid in all_perk_rows:
-        perks_by_series[perk.perk_series].append(
-            PerkSeriesPerk(
-                counter=perk.counter,
-                aoid=aoid,
-                level_required=perk.level_required,
-                ai_level_required=perk.ai_level_required if perk.ai_level_required > 0 else None
-            )
-        )
+    rows = perk_service.list_series_levels(profession=profession, breed=breed, perk_type=type)
 
-    # Build responses using pre-loaded perk data
+    # Group levels by series; series metadata comes from its first level
     series_responses = []
 
-    for series_name, series_type, professions, breeds in series_results:
-        # Convert profession and breed IDs to names
-        profession_names = perk_service._profession_ids_to_names(professions or [])
-        breed_names = perk_service._breed_ids_to_names(breeds or [])
+    for series_name, levels in groupby(rows, key=attrgetter("perk_series")):
+        levels = list(levels)
+        first = levels[0]
 
-        # Create series response using pre-loaded perks
         series_response = PerkSeriesResponse(
             series_name=series_name,
-            type=series_type,
-            professions=profession_names,
-            breeds=breed_names,
-            perks=perks_by_series.get(series_name, [])
+            type=first.type,
+            professions=perk_service._profession_ids_to_names(first.professions or []),
+            breeds=perk_service._breed_ids_to_names(first.breeds or []),
+            perks=[
+                PerkSeriesPerk(
+                    counter=level.counter,
+                    aoid=level.aoid,
+                    level_required=level.level_required,
+                    ai_level_required=level.ai_level_required if level.ai_level_required > 0 else None
+                )
+                for level in levels
+            ]
         )
         series_responses.append(series_response)
 
     # Sort by series name
-    series_responses.sort(key=lambda s: s.series_name)
+    series_responses.sort(key=attrgetter("series_name"))
 
     logger.info(f"Found {len(series_responses)} perk series")
     return series_responses
 
 
 @router.get("/{perk_name}", response_model=PerkSeries)
-@cached_response("perk_series")
+@cached_response("perk_series", tag="perks")
 @performance_monitor
 def get_perk_series(
     perk_name: str,
@@ -597,34 +328,30 @@ def calculate_perk_effects(
     """
     logger.info(f"Calculating perk effects for character level {request.character_level}")
 
-    # Calculate available points
-    # SL points: 2 per character level from 15+ (max 40 at level 35+)
-    sl_points_available = 0
-    if request.character_level >= 15:
-        sl_points_available = min(40, (request.character_level - 14) * 2)
-
+    # Calculate available points. Both clamps are game rules, not guards:
+    # SL points: 2 per character level from 15+ (0 below 15, max 40 at level 34+)
     # AI points: 1 per AI title level (max 30)
-    ai_points_available = 0
-    if request.ai_title_level:
-        ai_points_available = min(30, request.ai_title_level)
+    sl_points_available = max(0, min(40, (request.character_level - 14) * 2))
+    ai_points_available = min(30, request.ai_title_level or 0)
 
     # Calculate point costs
     total_sl_cost = 0
     total_ai_cost = 0
 
+    # Resolve all perk types in one query instead of one series lookup per perk
+    perk_types = perk_service.get_perk_types_bulk(list(request.target_perks))
+
     for perk_name, target_level in request.target_perks.items():
         current_level = request.owned_perks.get(perk_name, 0)
         levels_to_buy = target_level - current_level
 
         if levels_to_buy > 0:
-            # Get perk series to determine type
-            perk_series = perk_service.get_perk_series(perk_name)
-            if perk_series:
-                if perk_series.type == 'SL':
-                    total_sl_cost += levels_to_buy
-                elif perk_series.type == 'AI':
-                    total_ai_cost += levels_to_buy
-                # LE perks are free
+            perk_type = perk_types.get(perk_name)
+            if perk_type == 'SL':
+                total_sl_cost += levels_to_buy
+            elif perk_type == 'AI':
+                total_ai_cost += levels_to_buy
+            # LE perks are free
 
     # Calculate remaining points
     sl_points_remaining = sl_points_available - total_sl_cost
@@ -657,11 +384,16 @@ def calculate_perk_effects(
     return response
 
 
+# AOIDs are fixed game IDs, so a found perk can be cached by browsers and CDNs too
+PERK_LOOKUP_CACHE_CONTROL = f"public, max-age={CACHE_TTL['perk_lookup']}, immutable"
+
+
 @router.get("/lookup/{aoid}")
-@cached_response("perk_lookup")
 @performance_monitor
 def lookup_perk_by_aoid(
     aoid: int,
+    request: Request,
+    response: Response,
     perk_service: PerkService = Depends(get_perk_service)
 ):
     """
@@ -669,17 +401,36 @@ def lookup_perk_by_aoid(
 
     Used primarily for importing perks from external sources like AOSetups
     where only the AOID is provided. Returns basic perk information
-    including name, type, level.
+    including name, type, level. Supports conditional GET via
+    ETag/If-None-Match once max-age runs out.
     """
-    logger.info(f"Looking up perk by AOID: {aoid}")
+    # Headers are set outside the cached helper so cache hits carry them as well
+    not_modified = _not_modified(
+        request, response, perk_service.get_data_etag(), cache_control=PERK_LOOKUP_CACHE_CONTROL
+    )
+    if not_modified:
+        return not_modified
 
-    perk_info = perk_service.get_perk_info_by_aoid(aoid)
+    perk_info = _lookup_perk(aoid=aoid, perk_service=perk_service)
 
     if not perk_info:
+        # Misses may be imported later, so keep them out of downstream caches
+        del response.headers["Cache-Control"]
+        del response.headers["ETag"]
         # Return a 404 with null body for easier handling in frontend
         return None
 
-    logger.info(f"Found perk: {perk_info['name']} (type: {perk_info.get('type', 'SL')}, level: {perk_info.get('counter', 1)})")
+    return perk_info
+
+
+@cached_response("perk_lookup", tag="perks")
+def _lookup_perk(aoid: int, perk_service: PerkService) -> Optional[Dict[str, Any]]:
+    """Server-side cached AOID lookup behind lookup_perk_by_aoid."""
+    logger.info(f"Looking up perk by AOID: {aoid}")
+
+    perk_info = perk_service.get_perk_info_by_aoid(aoid)
+    if perk_info:
+        logger.info(f"Found perk: {perk_info['name']} (type: {perk_info.get('type', 'SL')}, level: {perk_info.get('counter', 1)})")
     return perk_info
 
 
@@ -694,7 +445,7 @@ def batch_lookup_perks(
     Optimized for profile imports to reduce connection pool usage.
     Max 100 perks per request.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = []
     errors = []
 
@@ -721,7 +472,7 @@ def batch_lookup_perks(
             ))
             errors.append(f"Perk {aoid} not found")
 
-    query_time = time.time() - start_time
+    query_time = time.perf_counter() - start_time
     logger.info(f"Batch perk lookup: {len(request.aoids)} perks, {len(errors)} errors, time={query_time:.3f}s")
 
     return BatchPerkLookupResponse(
@@ -756,9 +507,8 @@ def validate_perk_requirements(
     owned_perks_dict = {}
     if owned_perks:
         try:
-            import json
-            owned_perks_dict = json.loads(owned_perks)
-        except (json.JSONDecodeError, ValueError):
+            owned_perks_dict = orjson.loads(owned_perks)
+        except orjson.JSONDecodeError:
             logger.warning(f"Invalid owned_perks JSON: {owned_perks}")
 
     validation = perk_service.validate_perk_requirements(
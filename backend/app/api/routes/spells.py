@@ -2,10 +2,11 @@
 Spells API endpoints.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-import math
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, exists, func, tuple_
+import functools
 import time
 import logging
 
@@ -17,9 +18,16 @@ from app.api.schemas import (
     PaginatedResponse
 )
 from app.core.decorators import cached_response, performance_monitor
+from app.core.pagination import (
+    paginate_with_window, paginate_without_total, cached_count, count_cache_key,
+    encode_cursor, decode_cursor
+)
 
 router = APIRouter(prefix="/spells", tags=["spells"])
 
+# pg_trgm indexes are only usable for terms of at least one trigram
+SEARCH_MIN_LENGTH = 3
+
 # Set up logging for performance monitoring
 logger = logging.getLogger(__name__)
 
@@ -31,40 +39,66 @@ def get_spells(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
     target: Optional[int] = Query(None, description="Filter by target type"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; overrides page"),
+    with_total: bool = Query(True, description="Count all matches; false skips the count and returns null total/pages"),
     db: Session = Depends(get_db)
 ):
     """
-    Get paginated list of spells.
+    Get paginated list of spells, ordered by ID.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to seek past the
+    previous page instead of scanning and discarding OFFSET rows.
     """
     query = db.query(Spell)
     
     # Apply filters
     if target is not None:
         query = query.filter(Spell.target == target)
+    query = query.order_by(Spell.id)
     
-    # Get total count
-    total = query.count()
-    
-    # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-    
-    # Get spells for current page
-    spells = query.offset(offset).limit(page_size).all()
+    count_key = count_cache_key("spells_list", target=target)
+    total = has_next = None
+    if cursor is not None:
+        (after_id,) = decode_cursor(cursor, (int,))
+        spells = query.filter(Spell.id > after_id).limit(page_size).all()
+        if with_total:
+            total = cached_count(query, count_key)
+    elif not with_total:
+        spells, has_next = paginate_without_total(query, page, page_size)
+    else:
+        # Page and total in one query
+        spells, total = paginate_with_window(query, page, page_size, count_key=count_key)
+    next_cursor = encode_cursor(spells[-1].id) if len(spells) == page_size else None
+    if cursor is not None:
+        has_next = next_cursor is not None
     
-    return PaginatedResponse[SpellResponse](
-        items=spells,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
+    return PaginatedResponse[SpellResponse].from_page(
+        spells, total, page, page_size,
+        has_next=has_next,
+        has_prev=cursor is not None or page > 1,
+        next_cursor=next_cursor
     )
 
 
 
 
+@functools.lru_cache(maxsize=2048)
+def _parse_criteria(criteria_requirements: str) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Parse 'value1:value2:operator[,...]' into criterion triples.
+
+    Raises:
+        ValueError: If any entry is not three integers
+    """
+    requirements = []
+    for req in criteria_requirements.split(','):
+        parts = req.split(':')
+        if len(parts) != 3:
+            raise ValueError("Each criterion must have format 'value1:value2:operator'")
+        requirements.append((int(parts[0]), int(parts[1]), int(parts[2])))
+    return tuple(requirements)
+
+
 @router.get("/with-criteria", response_model=PaginatedResponse[SpellWithCriteria])
 @cached_response("spells_list")
 @performance_monitor
@@ -85,6 +119,7 @@ def get_spells_with_criteria(
     # Pagination
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
+    with_total: bool = Query(True, description="Count all matches; false skips the count and returns null total/pages"),
     
     db: Session = Depends(get_db)
 ):
@@ -96,58 +131,54 @@ def get_spells_with_criteria(
     - criteria_requirements='100:200:1,150:300:2' with logic='and' (must have BOTH criteria)
     - criteria_requirements='100:200:1,150:300:2' with logic='or' (must have EITHER criterion)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
+    
+    query = db.query(Spell)
     
-    query = db.query(Spell).distinct()
+    def has_criterion(*conditions):
+        # EXISTS keeps one row per spell, so no DISTINCT is needed
+        return exists().where(
+            SpellCriterion.spell_id == Spell.id,
+            SpellCriterion.criterion_id == Criterion.id,
+            *conditions
+        )
     
     if criteria_requirements:
-        # Parse complex criteria requirements
         try:
-            requirements = []
-            for req in criteria_requirements.split(','):
-                parts = req.split(':')
-                if len(parts) != 3:
-                    raise ValueError("Each criterion must have format 'value1:value2:operator'")
-                
-                val1, val2, op = int(parts[0]), int(parts[1]), int(parts[2])
-                requirements.append((val1, val2, op))
-        except (ValueError, IndexError) as e:
+            requirements = _parse_criteria(criteria_requirements)
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=f"Invalid criteria_requirements format: {e}")
         
         if logic == "and":
-            # AND logic: spell must have ALL specified criteria
-            for val1, val2, op in requirements:
-                query = query.join(SpellCriterion).join(Criterion).filter(
-                    Criterion.value1 == val1,
-                    Criterion.value2 == val2,
-                    Criterion.operator == op
-                )
+            # AND logic: spell must have ALL specified criteria. One grouped
+            # pass over spell_criteria replaces a semi-join per requirement;
+            # criteria are unique on (value1, value2, operator), so counting
+            # distinct criterion ids counts distinct requirements met
+            required = sorted(set(requirements))
+            matching_spell_ids = (
+                select(SpellCriterion.spell_id)
+                .join(Criterion, SpellCriterion.criterion_id == Criterion.id)
+                .where(tuple_(Criterion.value1, Criterion.value2, Criterion.operator).in_(required))
+                .group_by(SpellCriterion.spell_id)
+                .having(func.count(func.distinct(SpellCriterion.criterion_id)) == len(required))
+            )
+            query = query.filter(Spell.id.in_(matching_spell_ids))
         else:
             # OR logic: spell must have ANY of the specified criteria
-            criterion_ids = []
-            for val1, val2, op in requirements:
-                subquery = db.query(Criterion.id).filter(
-                    Criterion.value1 == val1,
-                    Criterion.value2 == val2,
-                    Criterion.operator == op
-                ).all()
-                criterion_ids.extend([row[0] for row in subquery])
-            
-            if criterion_ids:
-                query = query.join(SpellCriterion).filter(
-                    SpellCriterion.criterion_id.in_(set(criterion_ids))
-                )
+            query = query.filter(has_criterion(
+                tuple_(Criterion.value1, Criterion.value2, Criterion.operator).in_(requirements)
+            ))
     else:
         # Use individual filters as fallback
-        if any([value1 is not None, value2 is not None, operator is not None]):
-            query = query.join(SpellCriterion).join(Criterion)
-            
-            if value1 is not None:
-                query = query.filter(Criterion.value1 == value1)
-            if value2 is not None:
-                query = query.filter(Criterion.value2 == value2)
-            if operator is not None:
-                query = query.filter(Criterion.operator == operator)
+        conditions = []
+        if value1 is not None:
+            conditions.append(Criterion.value1 == value1)
+        if value2 is not None:
+            conditions.append(Criterion.value2 == value2)
+        if operator is not None:
+            conditions.append(Criterion.operator == operator)
+        if conditions:
+            query = query.filter(has_criterion(*conditions))
     
     # Apply additional filters
     if target is not None:
@@ -155,20 +186,25 @@ def get_spells_with_criteria(
     if spell_id is not None:
         query = query.filter(Spell.spell_id == spell_id)
     
-    # Always load criteria for response
+    # Always load criteria for response (a separate IN query, so LIMIT applies
+    # to spells); each link has one criterion, so it joins into that query
     query = query.options(
-        joinedload(Spell.spell_criteria).joinedload(SpellCriterion.criterion)
+        selectinload(Spell.spell_criteria).joinedload(SpellCriterion.criterion)
     )
     
-    # Get total count
-    total = query.count()
-    
-    # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-    
-    # Get spells for current page
-    spells = query.offset(offset).limit(page_size).all()
+    has_next = None
+    if with_total:
+        # Page and total in one query
+        spells, total = paginate_with_window(
+            query, page, page_size,
+            count_key=count_cache_key(
+                "spells_with_criteria", criteria_requirements=criteria_requirements, logic=logic,
+                value1=value1, value2=value2, operator=operator, target=target, spell_id=spell_id
+            )
+        )
+    else:
+        spells, has_next = paginate_without_total(query, page, page_size)
+        total = None
     
     # Build response objects
     spell_responses = [
@@ -186,18 +222,13 @@ def get_spells_with_criteria(
     ]
     
     # Log performance metrics
-    query_time = time.time() - start_time
-    logger.info(f"Spell criteria query requirements='{criteria_requirements}' logic='{logic}' results={total} time={query_time:.3f}s")
-    
-    return PaginatedResponse[SpellWithCriteria](
-        items=spell_responses,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
+    query_time = time.perf_counter() - start_time
+    logger.info(
+        "Spell criteria query requirements='%s' logic='%s' results=%s time=%.3fs",
+        criteria_requirements, logic, total, query_time
     )
+    
+    return PaginatedResponse[SpellWithCriteria].from_page(spell_responses, total, page, page_size, has_next=has_next)
 
 
 @router.get("/search", response_model=PaginatedResponse[SpellResponse])
@@ -207,16 +238,25 @@ def search_spells(
     q: str = Query(..., min_length=1, description="Search query for spell format or params"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
+    with_total: bool = Query(True, description="Count all matches; false skips the count and returns null total/pages"),
     db: Session = Depends(get_db)
 ):
     """
     Search spells by spell format or parameters.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    search_term = f"%{q}%"
+    # Shorter terms have no trigram to look up in the spell_format index, so
+    # they would scan every spell; LIKE wildcards in the term match literally
+    term = q.strip()
+    if len(term) < SEARCH_MIN_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Search query must be at least {SEARCH_MIN_LENGTH} characters"
+        )
+    search_term = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
     query = db.query(Spell).filter(
-        Spell.spell_format.ilike(search_term)
+        Spell.spell_format.ilike(search_term, escape="\\")
         # Note: Could add JSONB search for spell_params if needed
         # or_(
         #     Spell.spell_format.ilike(search_term),
@@ -224,29 +264,22 @@ def search_spells(
         # )
     ).order_by(Spell.spell_id)
     
-    # Get total count
-    total = query.count()
-    
-    # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-    
-    # Get spells for current page
-    spells = query.offset(offset).limit(page_size).all()
+    has_next = None
+    if with_total:
+        # Page and total in one query
+        spells, total = paginate_with_window(
+            query, page, page_size,
+            count_key=count_cache_key("spells_search", q=q)
+        )
+    else:
+        spells, has_next = paginate_without_total(query, page, page_size)
+        total = None
     
     # Log performance metrics
-    query_time = time.time() - start_time
-    logger.info(f"Spell search query='{q}' results={total} time={query_time:.3f}s")
+    query_time = time.perf_counter() - start_time
+    logger.info("Spell search query='%s' results=%s time=%.3fs", q, total, query_time)
     
-    return PaginatedResponse[SpellResponse](
-        items=spells,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
-    )
+    return PaginatedResponse[SpellResponse].from_page(spells, total, page, page_size, has_next=has_next)
 
 
 @router.get("/{spell_id}", response_model=SpellResponse)
@@ -4,6 +4,7 @@ StatValues API endpoints.
 
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -24,9 +25,17 @@ def get_stat_values(
 ):
     """
     Get list of stat values.
+
+    Read-only and flat, so rows are selected as plain columns and wrapped
+    without building ORM instances.
     """
-    stat_values = db.query(StatValue).offset(skip).limit(limit).all()
-    return stat_values
+    rows = db.execute(
+        select(StatValue.id, StatValue.stat, StatValue.value)
+        .order_by(StatValue.id)
+        .offset(skip)
+        .limit(limit)
+    ).all()
+    return [StatValueResponse.model_construct(**row._mapping) for row in rows]
 
 
 @router.get("/{stat_value_id}", response_model=StatValueResponse)
@@ -3,24 +3,21 @@ Symbiants API endpoints.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+from sqlalchemy import select
 import time
 import logging
-import math
 
-from app.core.database import get_db
-from app.models import (
-    SymbiantItem, Mob, Source, SourceType, ItemSource, Item, Action, ActionCriteria,
-    ItemSpellData, SpellData, SpellDataSpells, Spell, SpellCriterion, Criterion
-)
-from app.api.schemas.symbiant import SymbiantResponse, SymbiantWithDropsResponse, MobDropInfo
-from app.api.schemas.action import ActionResponse
-from app.api.schemas.criterion import CriterionResponse
-from app.api.schemas.spell import SpellDataResponse, SpellWithCriteria
+from app.core.database import get_read_only_db
+from app.models import SymbiantItem, Mob, Source, SourceType, ItemSource, Item
+from app.api.schemas.symbiant import SymbiantResponse, MobDropInfo
 from app.api.schemas import PaginatedResponse
+from app.api.services.symbiant_serializers import (
+    symbiant_item_load_options, serialize_item_effects, load_item_effects, symbiant_response
+)
 from app.core.decorators import cached_response, performance_monitor
+from app.core.pagination import paginate_with_window, count_cache_key
 
 router = APIRouter(prefix="/symbiants", tags=["symbiants"])
 
@@ -34,8 +31,8 @@ logger = logging.getLogger(__name__)
 def list_symbiants(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
-    db: Session = Depends(get_db)
-) -> PaginatedResponse[SymbiantResponse]:
+    db: Session = Depends(get_read_only_db)
+):
     """
     List symbiants with pagination.
 
@@ -44,8 +41,11 @@ def list_symbiants(
     - page_size: Number of items per page (default: 50, max: 200)
 
     Returns paginated symbiants in the database with default ordering.
+
+    The encoded page is cached on (page, page_size) alone; nothing in it
+    depends on who is asking, so every client can share the cached bytes.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Base query with ordering
     base_query = (
@@ -57,132 +57,35 @@ def list_symbiants(
         )
     )
 
-    # Get total count
-    total = base_query.count()
-
-    # Calculate pagination
-    pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-
-    # Get paginated results
-    symbiants = base_query.limit(page_size).offset(offset).all()
-
-    # Get actions/criteria and spell_data for each symbiant by joining with Item table
-    symbiant_ids = [s.id for s in symbiants]
-    items_query = (
-        db.query(Item)
-        .filter(Item.id.in_(symbiant_ids))
-        .options(
-            selectinload(Item.actions)
-            .selectinload(Action.action_criteria)
-            .selectinload(ActionCriteria.criterion),
-            selectinload(Item.item_spell_data)
-            .selectinload(ItemSpellData.spell_data)
-            .selectinload(SpellData.spell_data_spells)
-            .selectinload(SpellDataSpells.spell)
-            .selectinload(Spell.spell_criteria)
-            .selectinload(SpellCriterion.criterion)
-        )
+    # Page and total in one query; later pages reuse the cached total
+    symbiants, total = paginate_with_window(
+        base_query, page, page_size, count_key=count_cache_key("symbiants_list")
     )
-    items = {item.id: item for item in items_query.all()}
-
-    # Build response with actions and spell_data
-    symbiant_responses = []
-    for symbiant in symbiants:
-        item = items.get(symbiant.id)
-        actions = []
-        spell_data_list = []
-
-        if item:
-            # Build actions
-            if item.actions:
-                for action in item.actions:
-                    criteria = [
-                        CriterionResponse(
-                            id=ac.criterion.id,
-                            value1=ac.criterion.value1,
-                            value2=ac.criterion.value2,
-                            operator=ac.criterion.operator
-                        )
-                        for ac in action.action_criteria
-                    ]
-
-                    actions.append(ActionResponse(
-                        id=action.id,
-                        action=action.action,
-                        item_id=action.item_id,
-                        criteria=criteria
-                    ))
 
-            # Build spell_data
-            for isd in item.item_spell_data:
-                spell_data = isd.spell_data
+    # Get actions/criteria and spell_data for each symbiant from its Item rows
+    effects = load_item_effects(db, [s.id for s in symbiants])
 
-                # Get spells for this spell_data
-                spells_with_criteria = []
-                for sds in spell_data.spell_data_spells:
-                    spell = sds.spell
-
-                    # Get criteria for this spell
-                    criteria = [
-                        CriterionResponse(
-                            id=sc.criterion.id,
-                            value1=sc.criterion.value1,
-                            value2=sc.criterion.value2,
-                            operator=sc.criterion.operator
-                        )
-                        for sc in spell.spell_criteria
-                    ]
-
-                    spells_with_criteria.append(SpellWithCriteria(
-                        id=spell.id,
-                        target=spell.target,
-                        tick_count=spell.tick_count,
-                        tick_interval=spell.tick_interval,
-                        spell_id=spell.spell_id,
-                        spell_format=spell.spell_format,
-                        spell_params=spell.spell_params or {},
-                        criteria=criteria
-                    ))
-
-                spell_data_list.append(SpellDataResponse(
-                    id=spell_data.id,
-                    event=spell_data.event,
-                    spells=spells_with_criteria
-                ))
-
-        symbiant_responses.append(SymbiantResponse(
-            id=symbiant.id,
-            aoid=symbiant.aoid,
-            name=symbiant.name,
-            ql=symbiant.ql,
-            slot_id=symbiant.slot_id,
-            family=symbiant.family,
-            spell_data=spell_data_list,
-            actions=actions
-        ))
+    symbiant_responses = [symbiant_response(symbiant, effects) for symbiant in symbiants]
 
     # Log performance metrics
-    query_time = time.time() - start_time
-    logger.info(f"Symbiant list query page={page} page_size={page_size} results={len(symbiant_responses)}/{total} time={query_time:.3f}s")
-
-    return PaginatedResponse[SymbiantResponse](
-        items=symbiant_responses,
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
-        has_next=page < pages,
-        has_prev=page > 1
+    query_time = time.perf_counter() - start_time
+    logger.info(
+        "Symbiant list query page=%d page_size=%d results=%d/%d time=%.3fs",
+        page, page_size, len(symbiant_responses), total, query_time
     )
 
+    # Serialize once straight to JSON bytes: FastAPI returns a Response as-is,
+    # skipping the response_model round-trip, and cache hits reuse the bytes
+    page_response = PaginatedResponse[SymbiantResponse].from_page(symbiant_responses, total, page, page_size)
+    return Response(content=page_response.model_dump_json(), media_type="application/json")
+
 
 @router.get("/{symbiant_id}/dropped-by", response_model=List[MobDropInfo])
 @cached_response("symbiant_sources")
 @performance_monitor
 def get_symbiant_sources(
     symbiant_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_only_db)
 ):
     """
     Get all pocket bosses that drop this symbiant.
@@ -195,43 +98,39 @@ def get_symbiant_sources(
     Args:
         symbiant_id: Database ID of the symbiant (from symbiant_items view)
     """
-    start_time = time.time()
-
-    # Verify symbiant exists
-    symbiant = db.query(SymbiantItem).filter(SymbiantItem.id == symbiant_id).first()
-    if not symbiant:
-        raise HTTPException(status_code=404, detail="Symbiant not found")
+    start_time = time.perf_counter()
 
-    # Get source_type_id for 'mob'
-    source_type = db.query(SourceType).filter(SourceType.name == 'mob').first()
-    if not source_type:
-        raise HTTPException(status_code=500, detail="Source type 'mob' not found in database")
-
-    # Query mobs via sources (only pocket bosses)
-    query = (
-        db.query(Mob)
-        .join(Source, Source.source_id == Mob.id)
+    # Pocket bosses with a 'mob' source for this symbiant; EXISTS stops at the
+    # first matching source per mob and never yields a mob twice
+    drops_symbiant = (
+        select(Source.id)
+        .join(SourceType, Source.source_type_id == SourceType.id)
         .join(ItemSource, ItemSource.source_id == Source.id)
-        .filter(
-            and_(
-                ItemSource.item_id == symbiant_id,
-                Source.source_type_id == source_type.id,
-                Mob.is_pocket_boss == True
-            )
+        .where(
+            Source.source_id == Mob.id,
+            SourceType.name == 'mob',
+            ItemSource.item_id == symbiant_id
         )
+        .exists()
+    )
+    query = (
+        db.query(Mob)
+        .filter(Mob.is_pocket_boss == True, drops_symbiant)
+        .order_by(Mob.level.asc(), Mob.name.asc())
     )
-
-    # Order by level and name
-    query = query.order_by(Mob.level.asc(), Mob.name.asc())
 
     mobs = query.all()
 
+    # Only an empty result needs to tell "no bosses" apart from "no such symbiant"
+    if not mobs and db.query(SymbiantItem.id).filter(SymbiantItem.id == symbiant_id).scalar() is None:
+        raise HTTPException(status_code=404, detail="Symbiant not found")
+
     # Log performance metrics
-    query_time = time.time() - start_time
-    logger.info(f"Symbiant sources query symbiant_id={symbiant_id} results={len(mobs)} time={query_time:.3f}s")
+    query_time = time.perf_counter() - start_time
+    logger.info("Symbiant sources query symbiant_id=%s results=%d time=%.3fs", symbiant_id, len(mobs), query_time)
 
     return [
-        MobDropInfo(
+        MobDropInfo.model_construct(
             id=m.id,
             name=m.name,
             level=m.level,
@@ -246,7 +145,7 @@ def get_symbiant_sources(
 @router.get("/{symbiant_id}", response_model=SymbiantResponse)
 @cached_response("symbiants")
 @performance_monitor
-def get_symbiant(symbiant_id: int, db: Session = Depends(get_db)):
+def get_symbiant(symbiant_id: int, db: Session = Depends(get_read_only_db)):
     """
     Get detailed information about a specific symbiant.
     """
@@ -256,91 +155,6 @@ def get_symbiant(symbiant_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Symbiant not found")
 
     # Get actions/criteria and spell_data from Item table
-    item = (
-        db.query(Item)
-        .filter(Item.id == symbiant_id)
-        .options(
-            joinedload(Item.actions)
-            .joinedload(Action.action_criteria)
-            .joinedload(ActionCriteria.criterion),
-            joinedload(Item.item_spell_data)
-            .joinedload(ItemSpellData.spell_data)
-            .joinedload(SpellData.spell_data_spells)
-            .joinedload(SpellDataSpells.spell)
-            .joinedload(Spell.spell_criteria)
-            .joinedload(SpellCriterion.criterion)
-        )
-        .first()
-    )
-
-    actions = []
-    spell_data_list = []
-
-    if item:
-        # Build actions
-        if item.actions:
-            for action in item.actions:
-                criteria = [
-                    CriterionResponse(
-                        id=ac.criterion.id,
-                        value1=ac.criterion.value1,
-                        value2=ac.criterion.value2,
-                        operator=ac.criterion.operator
-                    )
-                    for ac in action.action_criteria
-                ]
-
-                actions.append(ActionResponse(
-                    id=action.id,
-                    action=action.action,
-                    item_id=action.item_id,
-                    criteria=criteria
-                ))
-
-        # Build spell_data
-        for isd in item.item_spell_data:
-            spell_data = isd.spell_data
+    items = db.query(Item).filter(Item.id == symbiant_id).options(*symbiant_item_load_options()).all()
 
-            # Get spells for this spell_data
-            spells_with_criteria = []
-            for sds in spell_data.spell_data_spells:
-                spell = sds.spell
-
-                # Get criteria for this spell
-                criteria = [
-                    CriterionResponse(
-                        id=sc.criterion.id,
-                        value1=sc.criterion.value1,
-                        value2=sc.criterion.value2,
-                        operator=sc.criterion.operator
-                    )
-                    for sc in spell.spell_criteria
-                ]
-
-                spells_with_criteria.append(SpellWithCriteria(
-                    id=spell.id,
-                    target=spell.target,
-                    tick_count=spell.tick_count,
-                    tick_interval=spell.tick_interval,
-                    spell_id=spell.spell_id,
-                    spell_format=spell.spell_format,
-                    spell_params=spell.spell_params or {},
-                    criteria=criteria
-                ))
-
-            spell_data_list.append(SpellDataResponse(
-                id=spell_data.id,
-                event=spell_data.event,
-                spells=spells_with_criteria
-            ))
-
-    return SymbiantResponse(
-        id=symbiant.id,
-        aoid=symbiant.aoid,
-        name=symbiant.name,
-        ql=symbiant.ql,
-        slot_id=symbiant.slot_id,
-        family=symbiant.family,
-        spell_data=spell_data_list,
-        actions=actions
-    )
+    return symbiant_response(symbiant, serialize_item_effects(items))
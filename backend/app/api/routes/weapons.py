@@ -42,7 +42,7 @@ def analyze_weapons(
 
     Performance target: < 500ms response time (REQ-PERF-001)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         # Create weapon filter service
@@ -52,7 +52,7 @@ def analyze_weapons(
         weapons = weapon_service.filter_weapons(request)
 
         # Log performance metrics
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         logger.info(
             f"Weapon analysis complete: returned {len(weapons)} weapons in {elapsed_time:.3f}s"
         )
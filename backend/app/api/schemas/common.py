@@ -5,18 +5,61 @@ Common Pydantic schemas used across the API.
 from typing import TypeVar, Generic, Optional, List, Any
 from pydantic import BaseModel, Field
 
+from app.core.pagination import page_count
+
 T = TypeVar('T')
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response wrapper."""
     items: List[T]
-    total: int = Field(description="Total number of items")
+    total: Optional[int] = Field(description="Total number of items; null when with_total=false")
     page: int = Field(description="Current page number")
     page_size: int = Field(description="Number of items per page")
-    pages: int = Field(description="Total number of pages")
+    pages: Optional[int] = Field(description="Total number of pages; null when with_total=false")
     has_next: bool = Field(description="Whether there is a next page")
     has_prev: bool = Field(description="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(None, description="Keyset cursor for the next page, where supported")
+
+    @classmethod
+    def from_page(
+        cls,
+        items: List[T],
+        total: Optional[int],
+        page: int,
+        page_size: int,
+        has_next: Optional[bool] = None,
+        has_prev: Optional[bool] = None,
+        next_cursor: Optional[str] = None
+    ) -> "PaginatedResponse[T]":
+        """
+        Build a page response, deriving pages and the next/prev flags.
+
+        has_next defaults to whether a later page exists. Without a total
+        (with_total=false pages) it is taken from next_cursor when one is
+        given, and must be passed explicitly otherwise.
+
+        Raises:
+            ValueError: If total, has_next and next_cursor are all None
+        """
+        pages = page_count(total, page_size) if total is not None else None
+        if has_next is None:
+            if pages is not None:
+                has_next = page < pages
+            elif next_cursor is not None:
+                has_next = True
+            else:
+                raise ValueError("has_next is required for a page without a total or next_cursor")
+        return cls(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=pages,
+            has_next=has_next,
+            has_prev=page > 1 if has_prev is None else has_prev,
+            next_cursor=next_cursor
+        )
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,260 @@
+"""
+Shared symbiant response building.
+
+The symbiant list, symbiant detail and mob drops endpoints all turn the
+Item behind a symbiant into actions and spell data. The conversion was
+previously repeated in each of them; keeping one copy means the loader
+options and the serialization cannot drift apart.
+
+The symbiant list reads the same data as plain Core rows through
+load_item_effects, skipping ORM instance materialization for the few
+columns each response needs.
+
+Responses are built with ``model_construct``: every value comes straight
+from typed ORM columns, so per-object validation would only re-check what
+the database already guarantees on the largest pages the API serves.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, raiseload, selectinload
+
+from app.models import (
+    Item, Action, ActionCriteria, ItemSpellData, SpellData, SpellDataSpells,
+    Spell, SpellCriterion, Criterion
+)
+from app.api.schemas.symbiant import SymbiantResponse
+from app.api.schemas.action import ActionResponse
+from app.api.schemas.criterion import CriterionResponse
+from app.api.schemas.spell import SpellDataResponse, SpellWithCriteria
+
+ItemEffects = Tuple[List[ActionResponse], List[SpellDataResponse]]
+
+
+def symbiant_item_load_options() -> list:
+    """
+    Loader options for everything serialize_item_effects reads from an Item.
+
+    Each collection gets its own IN query, so rows never multiply across
+    branches; the many-to-one hop below each collection is joined into that
+    query rather than costing another round-trip. Any other relationship
+    on the Item raises instead of lazy loading inside the serialization loop.
+    """
+    return [
+        selectinload(Item.actions)
+        .selectinload(Action.action_criteria)
+        .joinedload(ActionCriteria.criterion),
+        selectinload(Item.item_spell_data)
+        .joinedload(ItemSpellData.spell_data)
+        .selectinload(SpellData.spell_data_spells)
+        .joinedload(SpellDataSpells.spell)
+        .selectinload(Spell.spell_criteria)
+        .joinedload(SpellCriterion.criterion),
+        raiseload('*'),
+    ]
+
+
+def _criterion_response(criterion: Criterion) -> CriterionResponse:
+    return CriterionResponse.model_construct(
+        id=criterion.id,
+        value1=criterion.value1,
+        value2=criterion.value2,
+        operator=criterion.operator
+    )
+
+
+def serialize_item_effects(items: Iterable[Item]) -> Dict[int, ItemEffects]:
+    """
+    Build actions and spell data for each item.
+
+    Args:
+        items: Items loaded with symbiant_item_load_options()
+
+    Returns:
+        Dict of item id -> (actions, spell_data)
+    """
+    effects = {}
+    for item in items:
+        actions = [
+            ActionResponse.model_construct(
+                id=action.id,
+                action=action.action,
+                item_id=action.item_id,
+                criteria=[_criterion_response(ac.criterion) for ac in action.action_criteria]
+            )
+            for action in item.actions
+        ]
+
+        spell_data_list = []
+        for isd in item.item_spell_data:
+            spell_data = isd.spell_data
+            spells_with_criteria = [
+                SpellWithCriteria.model_construct(
+                    id=spell.id,
+                    target=spell.target,
+                    tick_count=spell.tick_count,
+                    tick_interval=spell.tick_interval,
+                    spell_id=spell.spell_id,
+                    spell_format=spell.spell_format,
+                    spell_params=spell.spell_params or {},
+                    criteria=[_criterion_response(sc.criterion) for sc in spell.spell_criteria]
+                )
+                for spell in (sds.spell for sds in spell_data.spell_data_spells)
+            ]
+            spell_data_list.append(SpellDataResponse.model_construct(
+                id=spell_data.id,
+                event=spell_data.event,
+                spells=spells_with_criteria
+            ))
+
+        effects[item.id] = (actions, spell_data_list)
+    return effects
+
+
+def load_item_effects(db: Session, item_ids: Sequence[int]) -> Dict[int, ItemEffects]:
+    """
+    Build actions and spell data for each item from Core row queries.
+
+    Produces the same result as serialize_item_effects over items loaded
+    with symbiant_item_load_options(), in one query per level and without
+    materializing ORM instances.
+
+    Args:
+        db: Database session
+        item_ids: Item ids to load
+
+    Returns:
+        Dict of item id -> (actions, spell_data)
+    """
+    if not item_ids:
+        return {}
+    actions_by_item = defaultdict(list)
+    spell_data_by_item = defaultdict(list)
+
+    # Criteria, spells and spell data are shared between parents; each is
+    # built once and the same response object is referenced wherever it occurs
+    criteria = {}
+
+    def criterion_response(criterion_id, value1, value2, operator):
+        response = criteria.get(criterion_id)
+        if response is None:
+            response = criteria[criterion_id] = CriterionResponse.model_construct(
+                id=criterion_id, value1=value1, value2=value2, operator=operator
+            )
+        return response
+
+    action_rows = db.execute(
+        select(Action.id, Action.action, Action.item_id)
+        .where(Action.item_id.in_(item_ids))
+        .order_by(Action.id)
+    ).all()
+
+    action_criteria = defaultdict(list)
+    if action_rows:
+        criteria_rows = db.execute(
+            select(
+                ActionCriteria.action_id, Criterion.id, Criterion.value1,
+                Criterion.value2, Criterion.operator
+            )
+            .join(Criterion, Criterion.id == ActionCriteria.criterion_id)
+            .where(ActionCriteria.action_id.in_([row.id for row in action_rows]))
+            .order_by(ActionCriteria.action_id, ActionCriteria.order_index)
+        ).all()
+        for action_id, *criterion in criteria_rows:
+            action_criteria[action_id].append(criterion_response(*criterion))
+
+    for row in action_rows:
+        actions_by_item[row.item_id].append(ActionResponse.model_construct(
+            id=row.id,
+            action=row.action,
+            item_id=row.item_id,
+            criteria=action_criteria.get(row.id, [])
+        ))
+
+    spell_data_rows = db.execute(
+        select(ItemSpellData.item_id, SpellData.id, SpellData.event)
+        .join(SpellData, SpellData.id == ItemSpellData.spell_data_id)
+        .where(ItemSpellData.item_id.in_(item_ids))
+        .order_by(ItemSpellData.item_id, SpellData.id)
+    ).all()
+
+    spells_by_spell_data = defaultdict(list)
+    spell_data_ids = {row.id for row in spell_data_rows}
+    if spell_data_ids:
+        spell_rows = db.execute(
+            select(
+                SpellDataSpells.spell_data_id, Spell.id, Spell.target, Spell.tick_count,
+                Spell.tick_interval, Spell.spell_id, Spell.spell_format, Spell.spell_params
+            )
+            .join(Spell, Spell.id == SpellDataSpells.spell_id)
+            .where(SpellDataSpells.spell_data_id.in_(sorted(spell_data_ids)))
+            .order_by(SpellDataSpells.spell_data_id, Spell.id)
+        ).all()
+
+        spell_criteria = defaultdict(list)
+        spell_ids = {row.id for row in spell_rows}
+        if spell_ids:
+            criteria_rows = db.execute(
+                select(
+                    SpellCriterion.spell_id, Criterion.id, Criterion.value1,
+                    Criterion.value2, Criterion.operator
+                )
+                .join(Criterion, Criterion.id == SpellCriterion.criterion_id)
+                .where(SpellCriterion.spell_id.in_(sorted(spell_ids)))
+                .order_by(SpellCriterion.spell_id, Criterion.id)
+            ).all()
+            for spell_id, *criterion in criteria_rows:
+                spell_criteria[spell_id].append(criterion_response(*criterion))
+
+        spells = {}
+        for row in spell_rows:
+            spell = spells.get(row.id)
+            if spell is None:
+                spell = spells[row.id] = SpellWithCriteria.model_construct(
+                    id=row.id,
+                    target=row.target,
+                    tick_count=row.tick_count,
+                    tick_interval=row.tick_interval,
+                    spell_id=row.spell_id,
+                    spell_format=row.spell_format,
+                    spell_params=row.spell_params or {},
+                    criteria=spell_criteria.get(row.id, [])
+                )
+            spells_by_spell_data[row.spell_data_id].append(spell)
+
+    spell_data = {}
+    for row in spell_data_rows:
+        response = spell_data.get(row.id)
+        if response is None:
+            response = spell_data[row.id] = SpellDataResponse.model_construct(
+                id=row.id,
+                event=row.event,
+                spells=spells_by_spell_data.get(row.id, [])
+            )
+        spell_data_by_item[row.item_id].append(response)
+
+    return {
+        item_id: (actions_by_item[item_id], spell_data_by_item[item_id])
+        for item_id in item_ids
+    }
+
+
+def symbiant_response(symbiant, effects: Dict[int, ItemEffects]) -> SymbiantResponse:
+    """
+    Build a SymbiantResponse from a symbiant_items row and serialized item effects.
+
+    A symbiant without a matching item gets empty actions and spell data.
+    """
+    actions, spell_data_list = effects.get(symbiant.id, ([], []))
+    return SymbiantResponse.model_construct(
+        id=symbiant.id,
+        aoid=symbiant.aoid,
+        name=symbiant.name,
+        ql=symbiant.ql,
+        slot_id=symbiant.slot_id,
+        family=symbiant.family,
+        spell_data=spell_data_list,
+        actions=actions
+    )
@@ -4,7 +4,7 @@ Service for filtering weapons based on character stats and requirements.
 
 import logging
 from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_, or_, select, exists, BigInteger, Integer, func
 
 from app.models import (
@@ -55,7 +55,7 @@ class WeaponFilterService:
         Filter weapons based on character stats and requirements.
 
         Uses two-stage loading to prevent timeout:
-        1. Filter with minimal loading (only attack stats for filtering)
+        1. Filter in SQL, fetching only the matching item ids
         2. Load full details for filtered results only
 
         Args:
@@ -70,14 +70,10 @@ class WeaponFilterService:
             f"skills={[s.skill_id for s in request.top_weapon_skills]}"
         )
 
-        # STAGE 1: Filter with minimal loading (only what's needed for filtering)
+        # STAGE 1: Filter entirely in SQL and fetch only ids - every check runs
+        # in the WHERE clause, so no Item rows or attack stats are built here
         # No QL filtering - return all QL variants for proper interpolation
-        query = self.db.query(Item).options(
-            # Only load attack stats (needed for weapon skill filtering)
-            joinedload(Item.attack_defense)
-                .joinedload(AttackDefense.attack_stats)
-                .joinedload(AttackDefenseAttack.stat_value)
-        ).filter(
+        query = self.db.query(Item.id).filter(
             Item.atkdef_id.isnot(None),
             Item.item_class == self.WEAPON_ITEM_CLASS
         )
@@ -262,21 +258,19 @@ class WeaponFilterService:
 
         query = query.filter(Item.id.not_in(expansion_forbidden))
 
-        # Use distinct to avoid duplicates
+        # Use distinct to avoid duplicates (the skill join yields one row per attack stat)
         query = query.distinct()
 
         # Execute filtering query (Stage 1)
-        items = query.all()
+        item_ids = [item_id for (item_id,) in query.all()]
 
-        logger.info(f"Found {len(items)} weapons matching criteria")
+        logger.info(f"Found {len(item_ids)} weapons matching criteria")
 
         # STAGE 2: Load full details for filtered results only
         # This prevents timeout by only loading deep relationships for filtered items
-        if not items:
+        if not item_ids:
             return []
 
-        item_ids = [item.id for item in items]
-
         # Stage 2: Load item details with all relationships
         # Use selectinload for large result sets (200-1000 weapons) to avoid Cartesian products
         # For smaller result sets or single-item lookups, joinedload would be more efficient
@@ -1,25 +1,41 @@
 """
-Simple in-memory caching service for frequently accessed data.
-Can be extended to use Redis or other caching backends.
+Caching service for frequently accessed data.
+
+Defaults to a thread-safe in-memory cache. Set CACHE_BACKEND=redis to share
+cached responses between workers through REDIS_URL.
 """
 
 import json
 import time
+import pickle
 import hashlib
+import logging
 from typing import Any, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 import threading
 
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
 
 class CacheService:
     """
     Thread-safe in-memory cache with TTL support.
+
+    Entries live in this process only; invalidating from another process
+    (such as the importer CLI) leaves the server workers' copies in place.
     """
+
+    # Whether other processes see this cache's entries and invalidations
+    shared = False
     
     def __init__(self, default_ttl: int = 300):  # 5 minutes default
         self.default_ttl = default_ttl
         self.cache: Dict[str, Tuple[Any, float]] = {}  # key: (value, expiry_time)
         self.lock = threading.RLock()
+        self.tags: Dict[str, set] = {}  # tag: keys to drop together
+        self.key_tags: Dict[str, set] = {}  # key: its tags, to untag on removal
         self.stats = {
             'hits': 0,
             'misses': 0,
@@ -45,7 +61,7 @@ class CacheService:
             
             # Check if expired
             if time.time() > expiry_time:
-                del self.cache[key]
+                self._remove(key)
                 self.stats['evictions'] += 1
                 self.stats['misses'] += 1
                 return None
@@ -61,18 +77,62 @@ class CacheService:
             self.cache[key] = (value, expiry_time)
             self.stats['sets'] += 1
     
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set a value only if the key is absent (or expired). Returns True if set."""
+        with self.lock:
+            existing = self.cache.get(key)
+            if existing is not None and time.time() <= existing[1]:
+                return False
+            self.cache[key] = (value, time.time() + (ttl or self.default_ttl))
+            return True
+
+    def _remove(self, key: str) -> None:
+        """Drop a present key and its tag registrations. Caller holds the lock."""
+        del self.cache[key]
+        for tag in self.key_tags.pop(key, ()):
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
     def delete(self, key: str) -> bool:
         """Delete a key from cache."""
         with self.lock:
             if key in self.cache:
-                del self.cache[key]
+                self._remove(key)
                 return True
             return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete all keys starting with prefix and return count removed."""
+        with self.lock:
+            keys_to_delete = [key for key in self.cache if key.startswith(prefix)]
+            for key in keys_to_delete:
+                self._remove(key)
+            return len(keys_to_delete)
     
     def clear(self) -> None:
         """Clear all cache entries."""
         with self.lock:
             self.cache.clear()
+            self.tags.clear()
+            self.key_tags.clear()
+
+    def tag(self, key: str, *tags: str) -> None:
+        """Register key under each tag so invalidate_tag() can drop it."""
+        with self.lock:
+            if key not in self.cache:
+                return
+            for tag in tags:
+                self.tags.setdefault(tag, set()).add(key)
+            self.key_tags.setdefault(key, set()).update(tags)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every key registered under tag and return count removed."""
+        with self.lock:
+            keys = list(self.tags.get(tag, ()))
+            return sum(1 for key in keys if self.delete(key))
     
     def get_stats(self) -> dict:
         """Get cache statistics."""
@@ -98,14 +158,139 @@ class CacheService:
                     expired_keys.append(key)
             
             for key in expired_keys:
-                del self.cache[key]
+                self._remove(key)
                 self.stats['evictions'] += 1
             
             return len(expired_keys)
 
 
+class RedisCache(CacheService):
+    """
+    Redis-backed cache with the same interface as CacheService.
+
+    Values are pickled (the cache only ever holds our own response objects)
+    and namespaced under a key prefix so clear() never touches other data.
+    Redis errors degrade to cache misses rather than failing the request.
+    """
+
+    NAMESPACE = "tinkertools:"
+    TAG_TTL = 86400
+    shared = True
+
+    def __init__(self, url: str, default_ttl: int = 300):
+        super().__init__(default_ttl)
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self.errors = (redis.RedisError,)
+
+    def _count(self, stat: str) -> None:
+        with self.lock:
+            self.stats[stat] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from cache."""
+        try:
+            raw = self.client.get(self.NAMESPACE + key)
+        except self.errors as e:
+            logger.warning(f"Redis get failed for {key}: {e}")
+            raw = None
+        if raw is None:
+            self._count('misses')
+            return None
+        self._count('hits')
+        return pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set a value in cache with TTL."""
+        ttl_ms = int((ttl or self.default_ttl) * 1000)
+        try:
+            self.client.set(self.NAMESPACE + key, pickle.dumps(value), px=ttl_ms)
+            self._count('sets')
+        except self.errors as e:
+            logger.warning(f"Redis set failed for {key}: {e}")
+
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set a value only if the key is absent (SET NX). Returns True if set."""
+        ttl_ms = int((ttl or self.default_ttl) * 1000)
+        try:
+            return bool(self.client.set(self.NAMESPACE + key, pickle.dumps(value), px=ttl_ms, nx=True))
+        except self.errors as e:
+            logger.warning(f"Redis add failed for {key}: {e}")
+            # Without Redis there is nothing to coordinate on; let the caller compute
+            return True
+
+    def delete(self, key: str) -> bool:
+        """Delete a key from cache."""
+        try:
+            return bool(self.client.delete(self.NAMESPACE + key))
+        except self.errors as e:
+            logger.warning(f"Redis delete failed for {key}: {e}")
+            return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete all keys starting with prefix and return count removed."""
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.NAMESPACE}{prefix}*", count=500))
+            return self.client.delete(*keys) if keys else 0
+        except self.errors as e:
+            logger.warning(f"Redis delete_prefix failed for {prefix}: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """Clear all cache entries in our namespace."""
+        self.delete_prefix("")
+
+    def tag(self, key: str, *tags: str) -> None:
+        """Register key under each tag (a Redis set) so invalidate_tag() can drop it."""
+        try:
+            pipe = self.client.pipeline()
+            for tag in tags:
+                tag_key = f"{self.NAMESPACE}tag:{tag}"
+                pipe.sadd(tag_key, key)
+                # Let the set expire too; its entries are long gone by then
+                pipe.expire(tag_key, self.TAG_TTL)
+            pipe.execute()
+        except self.errors as e:
+            logger.warning(f"Redis tag failed for {key}: {e}")
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every key registered under tag and return count removed."""
+        tag_key = f"{self.NAMESPACE}tag:{tag}"
+        try:
+            keys = [self.NAMESPACE + key.decode() for key in self.client.smembers(tag_key)]
+            removed = self.client.delete(*keys) if keys else 0
+            self.client.delete(tag_key)
+            return removed
+        except self.errors as e:
+            logger.warning(f"Redis invalidate_tag failed for {tag}: {e}")
+            return 0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        stats = super().get_stats()
+        try:
+            stats['cache_size'] = sum(1 for _ in self.client.scan_iter(match=f"{self.NAMESPACE}*", count=500))
+        except self.errors:
+            stats['cache_size'] = None
+        return stats
+
+    def cleanup_expired(self) -> int:
+        """Redis expires keys itself."""
+        return 0
+
+
+def _create_cache_service() -> CacheService:
+    """Build the configured cache backend, falling back to memory if Redis is unusable."""
+    if settings.CACHE_BACKEND == "redis":
+        try:
+            return RedisCache(settings.REDIS_URL)
+        except ImportError:
+            logger.warning("redis package not available - using in-memory cache")
+    return CacheService()
+
+
 # Global cache instance
-cache_service = CacheService()
+cache_service = _create_cache_service()
 
 
 def cache_key_for_query(endpoint: str, **params) -> str:
@@ -125,16 +310,12 @@ def cache_response(key: str, response: Any, ttl: int = 300) -> None:
 
 def invalidate_cache_pattern(pattern: str) -> int:
     """Invalidate cache keys matching a pattern (simple startswith)."""
-    with cache_service.lock:
-        keys_to_delete = []
-        for key in cache_service.cache.keys():
-            if key.startswith(pattern):
-                keys_to_delete.append(key)
-        
-        for key in keys_to_delete:
-            cache_service.delete(key)
-        
-        return len(keys_to_delete)
+    return cache_service.delete_prefix(pattern)
+
+
+def invalidate_cache_tag(tag: str) -> int:
+    """Invalidate every cache key registered under tag."""
+    return cache_service.invalidate_tag(tag)
 
 
 def get_cache_stats() -> dict:
@@ -151,5 +332,8 @@ CACHE_TTL = {
     'symbiants': 1800,      # 30 minutes - symbiant info is very static
     'search_results': 180,  # 3 minutes - search results can be cached briefly
     'stats': 60,            # 1 minute - stats change more frequently
-    'weapons_analyze': 3600 # 1 hour - weapon analysis is static game data
+    'counts': 60,           # 1 minute - pagination totals, approximate is fine
+    'weapons_analyze': 3600, # 1 hour - weapon analysis is static game data
+    'perk_lookup': 86400,   # 1 day - keyed on immutable game AOIDs, dropped with the "perks" tag on import
+    'perks_etag': 3600      # 1 hour - perk data version behind conditional GETs, also dropped on import
 }
\ No newline at end of file
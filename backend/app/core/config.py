@@ -7,7 +7,10 @@ class Settings(BaseSettings):
     CORS_ORIGINS: str = "http://localhost:5173"
     APP_ENV: str = "development"
     LOG_LEVEL: str = "INFO"
+    DEBUG: bool = False
+    CACHE_WARMUP_ON_STARTUP: bool = False
     REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_BACKEND: str = "memory"  # "memory" (per process) or "redis" (shared)
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
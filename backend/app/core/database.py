@@ -22,18 +22,28 @@ if not DATABASE_URL:
 # Connection pool configuration
 _default_pool_size = 10
 _default_max_overflow = 20
+# Compiled-SQL cache entries per engine. Statements are cached by shape (which
+# filters are present), and the filter combinations across list endpoints
+# outgrow SQLAlchemy's default of 500, which would recompile on every miss.
+_default_query_cache_size = 1200
 
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before use
     pool_size=_default_pool_size,        # Connection pool size
     max_overflow=_default_max_overflow,     # Additional connections beyond pool_size
+    query_cache_size=_default_query_cache_size,
     echo=os.getenv("SQL_DEBUG", "false").lower() == "true"  # Log SQL queries in debug mode
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read-only sessions share the same pool; on PostgreSQL each checked-out
+# connection runs its transactions READ ONLY and is reset on return
+read_only_engine = engine.execution_options(postgresql_readonly=True)
+ReadOnlySessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_only_engine)
+
 # Create declarative base for ORM models
 Base = declarative_base()
 
@@ -54,6 +64,20 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+def get_read_only_db() -> Generator[Session, None, None]:
+    """
+    Dependency function to get a read-only database session.
+    For endpoints that only read static game data; any write fails.
+
+    Yields:
+        Session: SQLAlchemy database session in a READ ONLY transaction
+    """
+    db = ReadOnlySessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
 def create_tables():
     """
     Create all tables defined in the Base metadata.
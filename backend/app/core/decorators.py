@@ -3,46 +3,113 @@ Decorators for API endpoints including caching and performance monitoring.
 """
 
 import time
+import random
 import functools
 import logging
-from typing import Callable, Any
-from fastapi import Request
+from typing import Callable, Any, NamedTuple
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
 import asyncio
-from app.core.cache import cache_key_for_query, get_cached_response, cache_response, CACHE_TTL
+from app.core.cache import cache_key_for_query, get_cached_response, cache_response, cache_service, CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
 
-def cached_response(cache_type: str, ttl: int = None):
+# Stampede protection: one caller computes a missing entry while others wait
+STAMPEDE_LOCK_TTL = 10      # seconds a compute lock is held at most
+STAMPEDE_WAIT = 2.0         # seconds a waiting caller polls before computing itself
+STAMPEDE_POLL = 0.05
+TTL_JITTER = 0.1            # spread expiries by up to +10% so keys don't expire together
+
+
+def _cache_params(kwargs: dict) -> dict:
+    """Drop the DB session and services wrapping it - they vary per request."""
+    return {
+        k: v for k, v in kwargs.items()
+        if k != 'db' and not isinstance(v, Session) and not isinstance(getattr(v, 'db', None), Session)
+    }
+
+
+def _jittered(ttl: int) -> float:
+    return ttl * (1 + random.random() * TTL_JITTER)
+
+
+class EncodedBody(NamedTuple):
+    """Cached form of a pre-serialized Response: the encoded bytes, not the object."""
+    body: bytes
+    status_code: int
+    media_type: str
+
+
+def _to_cache(result: Any) -> Any:
+    if isinstance(result, Response):
+        return EncodedBody(bytes(result.body), result.status_code, result.media_type)
+    return result
+
+
+def _lookup(cache_key: str) -> Any:
+    """Get a cached result, rebuilding pre-serialized responses straight from their bytes."""
+    cached = get_cached_response(cache_key)
+    if isinstance(cached, EncodedBody):
+        return Response(content=cached.body, status_code=cached.status_code, media_type=cached.media_type)
+    return cached
+
+
+def cached_response(cache_type: str, ttl: int = None, tag: str = None):
     """
     Decorator to cache API responses based on query parameters.
 
+    On a miss, only the caller holding the ``<key>:lock`` entry computes the
+    response; concurrent callers poll briefly for it before falling back to
+    computing it themselves.
+
+    Endpoints that return a pre-serialized ``Response`` are cached as their
+    encoded bytes, so a hit is a cache GET plus a new Response around the same
+    bytes - no model construction or JSON encoding.
+
     Args:
         cache_type: Type of cache (must be in CACHE_TTL)
         ttl: Time to live in seconds (overrides default from CACHE_TTL)
+        tag: Invalidation tag shared by all entries for one data domain (e.g. "perks")
     """
     def decorator(func: Callable) -> Callable:
+        cache_ttl = ttl or CACHE_TTL.get(cache_type, 300)
+
+        def store(cache_key: str, result: Any) -> None:
+            cache_response(cache_key, _to_cache(result), _jittered(cache_ttl))
+            if tag:
+                cache_service.tag(cache_key, tag)
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             # Generate cache key from function parameters
-            # Remove 'db' session from cache key as it's not relevant
-            cache_params = {k: v for k, v in kwargs.items() if k != 'db'}
-            cache_key = cache_key_for_query(f"{func.__module__}.{func.__name__}", **cache_params)
+            cache_key = cache_key_for_query(f"{func.__module__}.{func.__name__}", **_cache_params(kwargs))
 
             # Try to get cached response
-            cached = get_cached_response(cache_key)
+            cached = _lookup(cache_key)
             if cached is not None:
                 logger.debug(f"Cache hit for {func.__name__}: {cache_key}")
                 return cached
 
-            # Execute function and cache result
-            start_time = time.time()
-            result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            lock_key = f"{cache_key}:lock"
+            has_lock = cache_service.add(lock_key, True, STAMPEDE_LOCK_TTL)
+            if not has_lock:
+                deadline = time.perf_counter() + STAMPEDE_WAIT
+                while time.perf_counter() < deadline:
+                    await asyncio.sleep(STAMPEDE_POLL)
+                    cached = _lookup(cache_key)
+                    if cached is not None:
+                        return cached
 
-            # Cache the result
-            cache_ttl = ttl or CACHE_TTL.get(cache_type, 300)
-            cache_response(cache_key, result, cache_ttl)
+            # Execute function and cache result
+            try:
+                start_time = time.perf_counter()
+                result = await func(*args, **kwargs)
+                execution_time = time.perf_counter() - start_time
+                store(cache_key, result)
+            finally:
+                if has_lock:
+                    cache_service.delete(lock_key)
 
             logger.debug(f"Cache miss for {func.__name__}: {cache_key} (executed in {execution_time:.3f}s)")
             return result
@@ -50,30 +117,38 @@ def cached_response(cache_type: str, ttl: int = None):
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             # Generate cache key from function parameters
-            # Remove 'db' session from cache key as it's not relevant
-            cache_params = {k: v for k, v in kwargs.items() if k != 'db'}
-            cache_key = cache_key_for_query(f"{func.__module__}.{func.__name__}", **cache_params)
+            cache_key = cache_key_for_query(f"{func.__module__}.{func.__name__}", **_cache_params(kwargs))
 
             # Try to get cached response
-            cached = get_cached_response(cache_key)
+            cached = _lookup(cache_key)
             if cached is not None:
                 logger.debug(f"Cache hit for {func.__name__}: {cache_key}")
                 return cached
 
-            # Execute function and cache result
-            start_time = time.time()
-            result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            lock_key = f"{cache_key}:lock"
+            has_lock = cache_service.add(lock_key, True, STAMPEDE_LOCK_TTL)
+            if not has_lock:
+                deadline = time.perf_counter() + STAMPEDE_WAIT
+                while time.perf_counter() < deadline:
+                    time.sleep(STAMPEDE_POLL)
+                    cached = _lookup(cache_key)
+                    if cached is not None:
+                        return cached
 
-            # Cache the result
-            cache_ttl = ttl or CACHE_TTL.get(cache_type, 300)
-            cache_response(cache_key, result, cache_ttl)
+            # Execute function and cache result
+            try:
+                start_time = time.perf_counter()
+                result = func(*args, **kwargs)
+                execution_time = time.perf_counter() - start_time
+                store(cache_key, result)
+            finally:
+                if has_lock:
+                    cache_service.delete(lock_key)
 
             logger.debug(f"Cache miss for {func.__name__}: {cache_key} (executed in {execution_time:.3f}s)")
             return result
 
         # Return appropriate wrapper based on whether function is async
-        import asyncio
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
         else:
@@ -88,11 +163,11 @@ def performance_monitor(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     async def async_wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # Log slow queries (>500ms per REQ-PERF-001)
             if execution_time > 0.5:
@@ -103,17 +178,17 @@ def performance_monitor(func: Callable) -> Callable:
             return result
         
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             logger.error(f"Error in {func.__name__} after {execution_time:.3f}s: {e}")
             raise
     
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # Log slow queries (>500ms per REQ-PERF-001)
             if execution_time > 0.5:
@@ -124,7 +199,7 @@ def performance_monitor(func: Callable) -> Callable:
             return result
         
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             logger.error(f"Error in {func.__name__} after {execution_time:.3f}s: {e}")
             raise
     
@@ -26,6 +26,7 @@ from app.models import (
 )
 from app.core import perk_validator
 from app.core.migration_runner import MigrationRunner
+from app.core.cache import cache_service, invalidate_cache_tag
 
 logger = logging.getLogger(__name__)
 
@@ -699,6 +700,18 @@ class DataImporter:
                     db.rollback()
                     self.stats.errors += len(chunk)
         
+        # Rows were (re)written; drop the cached responses built from them
+        tags = ("perks", "nanos") if is_nano else ("perks",)
+        for tag in tags:
+            invalidated = invalidate_cache_tag(tag)
+            if invalidated:
+                logger.info(f"Invalidated {invalidated} cached {tag} responses")
+        if not cache_service.shared:
+            logger.warning(
+                f"CACHE_BACKEND=memory: running servers keep their cached {'/'.join(tags)} responses. "
+                f"Restart them, or POST /api/v1/cache/invalidate-tag/<tag> to each worker for: {', '.join(tags)}."
+            )
+
         elapsed = time.time() - self.stats.start_time
         logger.info(f"Import completed in {elapsed:.1f}s. "
                    f"Created: {self.stats.items_created}, "
@@ -112,6 +112,20 @@ PERFORMANCE_INDEXES = [
                     WHERE spell_id = 53045;''',
         'description': 'Functional index for Modify Stat spell parameter lookups (implant clusters)'
     },
+    {
+        'name': 'idx_spells_offensive_stat_param',
+        'query': '''CREATE INDEX IF NOT EXISTS idx_spells_offensive_stat_param
+                    ON spells(((spell_params->>'Stat')::integer))
+                    WHERE spell_id = 53002;''',
+        'description': 'Functional index for damage spell Stat lookups (TinkerNukes offensive nanos)'
+    },
+    {
+        'name': 'idx_spells_offensive_target',
+        'query': '''CREATE INDEX IF NOT EXISTS idx_spells_offensive_target
+                    ON spells(target, spell_id)
+                    WHERE target = 3 AND spell_id = 53002;''',
+        'description': 'Partial index for hostile-target Modify Stat spells'
+    },
     
     # Spell data junction table indexes
     {
@@ -0,0 +1,159 @@
+"""
+Pagination helpers for list endpoints.
+
+Offset pages are served by ``paginate``/``paginate_with_window``; endpoints
+that also accept a keyset ``cursor`` encode the last row's sort key with
+``encode_cursor`` and validate it on the way back in with ``decode_cursor``.
+
+Counting every matching row is often the most expensive part of a paginated
+request, and list totals rarely need to be exact to the second. ``paginate``
+derives the total from the page itself when it can, and otherwise reuses a
+short-lived cached count keyed on the filters (not the page), so paging
+through a result set runs the COUNT once.
+"""
+
+import base64
+import json
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Query
+
+from app.core.cache import cache_key_for_query, cache_service, CACHE_TTL
+
+
+def cached_count(query: Query, count_key: str, ttl: Optional[int] = None) -> int:
+    """Return ``query.count()``, cached under ``count_key`` for a short TTL."""
+    total = cache_service.get(count_key)
+    if total is None:
+        # ORDER BY is irrelevant to the count and only slows the subquery down
+        total = query.order_by(None).count()
+        cache_service.set(count_key, total, ttl or CACHE_TTL['counts'])
+    return total
+
+
+def paginate(
+    query: Query,
+    page: int,
+    page_size: int,
+    count_key: Optional[str] = None,
+    exact_count: bool = False
+) -> Tuple[List[Any], int]:
+    """
+    Fetch one page of ``query`` and the total number of matching rows.
+
+    Args:
+        query: Filtered and ordered query (loader options are fine)
+        page: 1-based page number
+        page_size: Rows per page
+        count_key: Cache key for the total; None disables count caching
+        exact_count: Always run a fresh COUNT(*)
+
+    Returns:
+        Tuple of (rows on the page, total matching rows)
+    """
+    offset = (page - 1) * page_size
+    rows = query.offset(offset).limit(page_size).all()
+
+    # A short, non-empty page (or an empty first page) is the last page,
+    # so the total follows without counting
+    if len(rows) < page_size and (rows or page == 1):
+        return rows, offset + len(rows)
+
+    if exact_count or count_key is None:
+        return rows, query.order_by(None).count()
+
+    return rows, cached_count(query, count_key)
+
+
+def paginate_with_window(
+    query: Query,
+    page: int,
+    page_size: int,
+    count_key: Optional[str] = None
+) -> Tuple[List[Any], int]:
+    """
+    Fetch one page of a single-entity ``query`` and its total in one round-trip.
+
+    The total rides along on every row as ``COUNT(*) OVER ()``, so the filter
+    is planned and run once. The query must not produce duplicate rows
+    (DISTINCT or one-to-many joins) since the window counts rows, not entities;
+    use EXISTS for such filters and selectinload for collections.
+
+    With ``count_key``, the total is cached for a short TTL; later pages of
+    the same filters skip the window and let LIMIT stop the scan early.
+
+    Returns:
+        Tuple of (entities on the page, total matching rows)
+    """
+    offset = (page - 1) * page_size
+
+    if count_key is not None:
+        total = cache_service.get(count_key)
+        if total is not None:
+            return query.offset(offset).limit(page_size).all(), total
+
+    rows = query.add_columns(func.count().over().label("full_count"))\
+        .offset(offset)\
+        .limit(page_size)\
+        .all()
+
+    if rows:
+        total = rows[0].full_count
+    elif page == 1:
+        # Empty first page: nothing matches
+        total = 0
+    else:
+        # Past the end: no row carries the total
+        total = query.order_by(None).count()
+
+    if count_key is not None:
+        cache_service.set(count_key, total, CACHE_TTL['counts'])
+    return [row[0] for row in rows], total
+
+
+def paginate_without_total(query: Query, page: int, page_size: int) -> Tuple[List[Any], bool]:
+    """
+    Fetch one page of ``query`` without counting the full result.
+
+    One extra row is fetched to tell whether another page follows, for
+    clients (infinite scroll) that never show a total.
+
+    Returns:
+        Tuple of (rows on the page, whether a next page exists)
+    """
+    rows = query.offset((page - 1) * page_size).limit(page_size + 1).all()
+    return rows[:page_size], len(rows) > page_size
+
+
+def page_count(total: int, page_size: int) -> int:
+    """Number of pages needed for ``total`` rows; an empty result is one page."""
+    return -(-total // page_size) if total > 0 else 1
+
+
+def count_cache_key(endpoint: str, **filters: Any) -> str:
+    """Build a count cache key from an endpoint name and its filter values."""
+    return cache_key_for_query(f"{endpoint}:count", **filters)
+
+
+def encode_cursor(*sort_key: Any) -> str:
+    """Encode the last row's sort key (ending in its id) as an opaque page cursor."""
+    return base64.urlsafe_b64encode(json.dumps(list(sort_key)).encode()).decode()
+
+
+def decode_cursor(cursor: str, types: Tuple[type, ...]) -> tuple:
+    """
+    Decode a page cursor back into its sort key, checking each value's type.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or does not match ``types``
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(types) \
+                or not all(isinstance(v, t) and not isinstance(v, bool) for v, t in zip(values, types)):
+            raise ValueError(cursor)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(values)
@@ -1,3 +1,6 @@
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -8,7 +11,7 @@ from app.core.config import settings
 from app.api.routes.health import router as health_router
 from app.api.routes.items import router as items_router
 from app.api.routes.implants import router as implants_router
-from app.api.routes.nanos import router as nanos_router
+from app.api.routes.nanos import router as nanos_router, warm_profession_nano_cache
 from app.api.routes.spells import router as spells_router
 from app.api.routes.symbiants import router as symbiants_router
 from app.api.routes.mobs import router as mobs_router
@@ -20,12 +23,22 @@ from app.api.routes.equipment_bonuses import router as equipment_bonuses_router
 from app.api.routes.perks import router as perks_router
 from app.api.routes.weapons import router as weapons_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Precompute hot static pages in the background so startup is not blocked."""
+    if settings.CACHE_WARMUP_ON_STARTUP:
+        threading.Thread(target=warm_profession_nano_cache, daemon=True).start()
+    yield
+
+
 app = FastAPI(
     title="TinkerTools API",
     description="API for TinkerTools - Anarchy Online game data utilities",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS - Environment-based origin configuration
@@ -2,7 +2,7 @@
 Item model and related junction tables.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Computed, Integer, String, Boolean, ForeignKey, Text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -19,6 +19,11 @@ class Item(Base):
     is_nano = Column(Boolean, default=False)
     animation_mesh_id = Column(Integer, ForeignKey('animation_mesh.id'))
     atkdef_id = Column(Integer, ForeignKey('attack_defense.id'))
+    # Nano strain (name suffix after the last ' - '), generated by Postgres
+    strain_name = Column(
+        String(128),
+        Computed("CASE WHEN name LIKE '% - %' THEN btrim(regexp_replace(name, '^.* - ', '')) END", persisted=True)
+    )
     
     # Relationships
     animation_mesh = relationship('AnimationMesh', back_populates='items')
@@ -2,8 +2,9 @@
 Perk model for TinkerTools database.
 """
 
-from sqlalchemy import Column, Integer, String, ARRAY, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, ARRAY, ForeignKey
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 
 
@@ -19,6 +20,11 @@ class Perk(Base):
     ai_level_required = Column(Integer, nullable=False)
     professions = Column(ARRAY(Integer), nullable=False)
     breeds = Column(ARRAY(Integer), nullable=False)
+    # "<name> <counter>" display name, generated by Postgres
+    formatted_name = Column(String(140), Computed("name || ' ' || counter::text", persisted=True))
+    # Word index of the name for multi-word search, generated by Postgres;
+    # deferred so loading Perk entities never drags it along
+    name_tsv = deferred(Column(TSVECTOR, Computed("to_tsvector('simple', name)", persisted=True)))
 
     # Relationships
     item = relationship('Item', back_populates='perk', uselist=False)
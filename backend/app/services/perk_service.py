@@ -7,8 +7,10 @@ three distinct type systems: SL (Shadowlands), AI (Alien Invasion), and LE (Lost
 """
 
 from typing import List, Optional, Dict, Tuple, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func, text, Integer, or_, distinct
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy import and_, func, text, Integer, or_, distinct, case, exists
+from operator import attrgetter
+import hashlib
 import logging
 
 from app.models.item import Item, ItemSpellData, ItemStats
@@ -18,9 +20,11 @@ from app.models.spell import Spell, SpellCriterion
 from app.models.action import Action, ActionCriteria
 from app.api.schemas.perk import (
     PerkResponse, PerkDetail, PerkSeries, PerkValidationResponse,
-    PerkCalculationResponse, PerkRequirement, PerkEffect, PerkPointCost
+    PerkCalculationResponse, PerkRequirement, PerkEffect, PerkPointCost,
+    PerkStatsResponse
 )
 from app.api.schemas.spell import SpellDataResponse
+from app.core.cache import cache_service, invalidate_cache_tag, CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +55,39 @@ BREED_NAMES = {
     7: 'HumanMonster'
 }
 
+# Reverse lookups for filter arguments given by name
+PROFESSION_IDS = {name: prof_id for prof_id, name in PROFESSION_NAMES.items()}
+BREED_IDS = {name: breed_id for breed_id, name in BREED_NAMES.items()}
+
+
+# Perk spell effects/criteria are one-to-many at every hop; joinedload would
+# multiply rows per level, so each hop is one "WHERE id IN (...)" query instead
+SPELL_CHAIN_LOADERS = (
+    selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data)
+        .selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell)
+        .selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
+)
+
+# Exactly the columns PerkResponse is built from (no Perk/Item entity hydration)
+PERK_LIST_COLUMNS = (
+    Perk.item_id, Perk.name, Perk.counter, Perk.type, Perk.professions, Perk.breeds,
+    Perk.level_required, Perk.ai_level_required, Perk.perk_series, Perk.formatted_name,
+    Item.aoid, Item.description, Item.ql,
+)
+
+# Cache key holding the perk data version behind ETags
+PERK_ETAG_KEY = "perks:etag"
+
+# Whitelisted ORDER BY expressions for list_perks
+PERK_SORT_COLUMNS = {
+    'name': Perk.name,
+    'level': Perk.level_required,
+    'type': Perk.type,
+    'counter': Perk.counter,
+    # Cumulative cost: counter for SL/AI, LE research is free
+    'cost': case((Perk.type.in_(['SL', 'AI']), Perk.counter), else_=0),
+}
+
 
 class PerkService:
     """Service for perk-related operations."""
@@ -60,131 +97,224 @@ class PerkService:
 
     def __init__(self, db: Session):
         self.db = db
+        # Request-scoped lookup memos: a PerkService lives for one request
+        # (see get_perk_service), so repeated lookups never go stale
+        self._series_cache: Dict[str, Optional[PerkSeries]] = {}
+        self._perk_info_cache: Dict[int, Optional[Dict[str, Any]]] = {}
 
-    def get_available_perks(
+    def list_perks(
         self,
+        perk_types: Optional[List[str]] = None,
+        profession: Optional[str] = None,
+        breed: Optional[str] = None,
+        min_level: Optional[int] = None,
+        max_level: Optional[int] = None,
+        ai_level: Optional[int] = None,
+        series: Optional[str] = None,
+        search: Optional[str] = None,
+        professions: Optional[List[str]] = None,
+        breeds: Optional[List[str]] = None,
+        level_range: Optional[List[int]] = None,
+        ai_title_range: Optional[List[int]] = None,
+        counter_range: Optional[List[int]] = None,
         character_level: Optional[int] = None,
         character_profession: Optional[str] = None,
         character_breed: Optional[str] = None,
         ai_title_level: Optional[int] = None,
-        perk_types: Optional[List[str]] = None,
         available_sl_points: Optional[int] = None,
         available_ai_points: Optional[int] = None,
-        owned_perks: Optional[Dict[str, int]] = None
-    ) -> List[PerkResponse]:
+        owned_perks: Optional[Dict[str, int]] = None,
+        sort_by: str = "name",
+        sort_desc: bool = False,
+        page: int = 1,
+        page_size: int = 50
+    ) -> Tuple[List[PerkResponse], int]:
         """
-        Get available perks filtered by character constraints.
+        Get one page of perks with all filtering, sorting and paging done in SQL.
+
+        The total row count comes back on every row via ``COUNT(*) OVER ()``,
+        so a page and its total cost a single round-trip.
 
         Args:
+            perk_types: Filter by perk types (SL, AI, LE)
+            profession: Required profession name or ID (unrestricted perks match)
+            breed: Required breed name or ID (unrestricted perks match)
+            min_level: Minimum character level requirement
+            max_level: Maximum character level requirement
+            ai_level: Maximum AI title level requirement
+            series: Exact perk series name
+            search: Case-insensitive substring of the perk name; several words
+                also match names containing all of them in any order
+            professions: Perk must list at least one of these professions
+            breeds: Perk must list at least one of these breeds
+            level_range: Character level requirement range [min, max]
+            ai_title_range: AI title requirement range [min, max] (perks without one match)
+            counter_range: Perk level range [min, max]
             character_level: Character level for requirement filtering
             character_profession: Character profession for filtering
             character_breed: Character breed for filtering
             ai_title_level: AI title level for AI perk requirements
-            perk_types: Filter by perk types (SL, AI, LE)
             available_sl_points: Available SL points for affordability check
             available_ai_points: Available AI points for affordability check
             owned_perks: Currently owned perks {name: level} for progression validation
+            sort_by: One of PERK_SORT_COLUMNS, falls back to name
+            sort_desc: Sort descending
+            page: 1-based page number
+            page_size: Rows per page
 
         Returns:
-            List of PerkResponse objects that meet the criteria
+            Tuple of (PerkResponse objects for the page, total matching rows)
         """
-        logger.info(f"Getting available perks for character level {character_level}, profession {character_profession}")
+        has_spell_data = exists().where(ItemSpellData.item_id == Perk.item_id)
+        query = self.db.query(
+            *PERK_LIST_COLUMNS,
+            func.count().over().label("total")
+        ).join(Item, Item.id == Perk.item_id).filter(has_spell_data)
 
-        # Start with base query joining items with perks table
-        query = self.db.query(Item)\
-            .join(Perk, Item.id == Perk.item_id)\
-            .join(ItemSpellData, Item.id == ItemSpellData.item_id)
-
-        # Apply character level requirement filtering
+        if perk_types:
+            query = query.filter(Perk.type.in_(perk_types))
+        if series:
+            query = query.filter(Perk.perk_series == series)
+        if search:
+            query = query.filter(self._name_matches(search))
+
+        if min_level is not None:
+            query = query.filter(Perk.level_required >= min_level)
+        if max_level is not None:
+            query = query.filter(Perk.level_required <= max_level)
         if character_level is not None:
             query = query.filter(Perk.level_required <= character_level)
+        if level_range and len(level_range) == 2:
+            query = query.filter(Perk.level_required.between(level_range[0], level_range[1]))
 
-        # Apply profession filtering
-        if character_profession is not None:
-            profession_id = self._profession_name_to_id(character_profession)
-            if profession_id is not None:
-                # Use PostgreSQL array contains operator - empty array means all professions
-                query = query.filter(
-                    or_(
-                        func.array_length(Perk.professions, 1).is_(None),  # NULL array
-                        func.array_length(Perk.professions, 1) == 0,      # Empty array
-                        Perk.professions.contains([profession_id])         # Contains profession
-                    )
-                )
-
-        # Apply breed filtering
-        if character_breed is not None:
-            breed_id = self._breed_name_to_id(character_breed)
-            if breed_id is not None:
-                # Use PostgreSQL array contains operator - empty array means all breeds
-                query = query.filter(
-                    or_(
-                        func.array_length(Perk.breeds, 1).is_(None),       # NULL array
-                        func.array_length(Perk.breeds, 1) == 0,           # Empty array
-                        Perk.breeds.contains([breed_id])                   # Contains breed
-                    )
-                )
-
-        # Apply AI title level filtering
+        if ai_level is not None:
+            query = query.filter(Perk.ai_level_required <= ai_level)
         if ai_title_level is not None:
             query = query.filter(Perk.ai_level_required <= ai_title_level)
+        if ai_title_range and len(ai_title_range) == 2:
+            query = query.filter(or_(
+                Perk.ai_level_required <= 0,
+                Perk.ai_level_required.between(ai_title_range[0], ai_title_range[1])
+            ))
 
-        # Apply perk type filtering
-        if perk_types is not None:
-            query = query.filter(Perk.type.in_(perk_types))
+        if counter_range and len(counter_range) == 2:
+            query = query.filter(Perk.counter.between(counter_range[0], counter_range[1]))
 
-        # Execute query with proper loading of relationships
-        results = query.options(
-            joinedload(Item.perk),
-            joinedload(Item.item_spell_data).joinedload(ItemSpellData.spell_data).joinedload(SpellData.spell_data_spells).joinedload(SpellDataSpells.spell).joinedload(Spell.spell_criteria).joinedload(SpellCriterion.criterion)
-        ).distinct().all()
+        # Unrestricted perks (empty array) stay visible to every profession/breed
+        for name in (profession, character_profession):
+            profession_id = self._resolve_id(name, self._profession_name_to_id)
+            if profession_id is not None:
+                query = query.filter(self._allows(Perk.professions, profession_id))
+        for name in (breed, character_breed):
+            breed_id = self._resolve_id(name, self._breed_name_to_id)
+            if breed_id is not None:
+                query = query.filter(self._allows(Perk.breeds, breed_id))
 
-        # Convert to response objects
-        perk_responses = []
-        for item in results:
-            # Get perk metadata from perks table
-            perk = item.perk
-            if not perk:
-                logger.warning(f"Item {item.id} has no perk relationship")
-                continue
+        # Explicit requirement lists only match perks that name one of them
+        if professions:
+            ids = [pid for pid in map(self._profession_name_to_id, professions) if pid is not None]
+            query = query.filter(Perk.professions.overlap(ids))
+        if breeds:
+            ids = [bid for bid in map(self._breed_name_to_id, breeds) if bid is not None]
+            query = query.filter(Perk.breeds.overlap(ids))
 
-            # Validate ownership progression
-            if owned_perks and not self._can_purchase_level(perk.name, perk.counter, owned_perks):
-                continue
+        query = self._filter_purchasable(query, owned_perks, available_sl_points, available_ai_points)
 
-            # Check point affordability
-            if not self._is_affordable(perk.type, perk.counter, available_sl_points, available_ai_points, owned_perks, perk.name):
-                continue
+        sort_column = PERK_SORT_COLUMNS.get(sort_by, PERK_SORT_COLUMNS["name"])
+        order = (sort_column.desc(), Perk.counter.desc(), Perk.item_id.desc()) if sort_desc \
+            else (sort_column.asc(), Perk.counter.asc(), Perk.item_id.asc())
 
-            # Handle empty arrays as "all professions/breeds allowed" according to task requirements
-            professions = self._profession_ids_to_names(perk.professions or [])
-            breeds = self._breed_ids_to_names(perk.breeds or [])
+        rows = query.order_by(*order)\
+            .limit(page_size)\
+            .offset((page - 1) * page_size)\
+            .all()
 
-            # If arrays are empty or None, it means all professions/breeds are allowed
-            if not perk.professions or len(perk.professions) == 0:
-                professions = []  # Empty list indicates "all allowed"
-            if not perk.breeds or len(perk.breeds) == 0:
-                breeds = []  # Empty list indicates "all allowed"
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page the window has no rows to carry the total
+            total = query.with_entities(func.count(Perk.item_id)).scalar() or 0
+        else:
+            total = 0
 
-            perk_response = PerkResponse(
-                id=item.id,
-                aoid=item.aoid,
-                name=perk.name,
-                counter=perk.counter,
-                type=perk.type,
-                professions=professions,
-                breeds=breeds,
-                level=perk.level_required,
-                ai_title=perk.ai_level_required if perk.ai_level_required > 0 else None,
-                description=item.description,
-                ql=item.ql,
-                perk_series=perk.perk_series,  # Add perk_series for grouping
-                formatted_name=f"{perk.name} {perk.counter}"  # Add formatted name with counter
-            )
-            perk_responses.append(perk_response)
+        perks = [self._perk_to_response(row) for row in rows]
+        return perks, total
+
+    def get_perk_stats(self) -> PerkStatsResponse:
+        """
+        Get aggregate statistics over all perks.
+
+        Everything is computed with SQL aggregates; only the distinct
+        profession/breed IDs come back as rows.
+
+        Returns:
+            PerkStatsResponse with counts, types, requirements and level ranges
+        """
+        has_spell_data = exists().where(ItemSpellData.item_id == Perk.item_id)
+        # Series base name: strip a trailing " <number>" word
+        series_name = func.regexp_replace(Perk.name, ' [0-9]+$', '')
+        has_ai_title = Perk.ai_level_required > 0
+
+        row = self.db.query(
+            func.count().label("total_perks"),
+            func.count(distinct(series_name)).label("total_series"),
+            func.array_agg(distinct(Perk.type)).label("types"),
+            func.min(Perk.level_required).label("min_level"),
+            func.max(Perk.level_required).label("max_level"),
+            func.min(Perk.ai_level_required).filter(has_ai_title).label("min_ai_title"),
+            func.max(Perk.ai_level_required).filter(has_ai_title).label("max_ai_title")
+        ).filter(has_spell_data).one()
+
+        profession_ids = [pid for (pid,) in self.db.query(func.unnest(Perk.professions)).filter(has_spell_data).distinct()]
+        breed_ids = [bid for (bid,) in self.db.query(func.unnest(Perk.breeds)).filter(has_spell_data).distinct()]
+
+        return PerkStatsResponse(
+            total_perks=row.total_perks,
+            total_series=row.total_series,
+            types=sorted(row.types or []),
+            professions=sorted(self._profession_ids_to_names(profession_ids)),
+            breeds=sorted(self._breed_ids_to_names(breed_ids)),
+            level_range=[row.min_level, row.max_level] if row.min_level is not None else [1, 220],
+            ai_title_range=[row.min_ai_title, row.max_ai_title] if row.min_ai_title is not None else [1, 30]
+        )
+
+    def list_series_levels(
+        self,
+        profession: Optional[str] = None,
+        breed: Optional[str] = None,
+        perk_type: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Get every perk level for the series listing in one query.
+
+        Args:
+            profession: Only series open to this profession name
+            breed: Only series open to this breed name
+            perk_type: Filter by perk type (SL, AI, LE)
+
+        Returns:
+            Rows of series name, type, requirements, counter and aoid,
+            ordered so each series' levels are contiguous
+        """
+        query = self.db.query(
+            Perk.perk_series, Perk.type, Perk.professions, Perk.breeds,
+            Perk.counter, Perk.level_required, Perk.ai_level_required, Item.aoid
+        ).join(Item, Perk.item_id == Item.id)
+
+        # Unrestricted perks (empty array) stay visible to every profession/breed
+        if profession:
+            profession_id = self._profession_name_to_id(profession)
+            if profession_id is not None:
+                query = query.filter(self._allows(Perk.professions, profession_id))
+        if breed:
+            breed_id = self._breed_name_to_id(breed)
+            if breed_id is not None:
+                query = query.filter(self._allows(Perk.breeds, breed_id))
+
+        if perk_type:
+            query = query.filter(Perk.type == perk_type)
 
-        logger.info(f"Found {len(perk_responses)} available perks")
-        return perk_responses
+        return query.order_by(Perk.perk_series, Perk.counter).all()
 
     def get_perk_series(self, perk_name: str) -> Optional[PerkSeries]:
         """
@@ -196,16 +326,24 @@ class PerkService:
         Returns:
             PerkSeries with all available levels or None if not found
         """
+        if perk_name in self._series_cache:
+            return self._series_cache[perk_name]
+
+        self._series_cache[perk_name] = self._load_perk_series(perk_name)
+        return self._series_cache[perk_name]
+
+    def _load_perk_series(self, perk_name: str) -> Optional[PerkSeries]:
+        """Query and build a perk series; see get_perk_series."""
         logger.info(f"Getting perk series for '{perk_name}'")
 
         # Query all levels of the perk by perk series
         query = self.db.query(Item)\
             .join(Perk, Item.id == Perk.item_id)\
-            .join(ItemSpellData, Item.id == ItemSpellData.item_id)\
+            .filter(exists().where(ItemSpellData.item_id == Item.id))\
             .filter(Perk.perk_series == perk_name)\
             .options(
-                joinedload(Item.perk),
-                joinedload(Item.item_spell_data).joinedload(ItemSpellData.spell_data).joinedload(SpellData.spell_data_spells).joinedload(SpellDataSpells.spell).joinedload(Spell.spell_criteria).joinedload(SpellCriterion.criterion)
+                contains_eager(Item.perk),
+                *SPELL_CHAIN_LOADERS
             )\
             .order_by(Perk.counter)
 
@@ -275,12 +413,12 @@ class PerkService:
                 spell_data=spell_data_responses,
                 point_cost=point_cost,
                 perk_series=perk.perk_series,  # Add perk_series for grouping
-                formatted_name=f"{perk.name} {counter}"  # Add formatted name with counter
+                formatted_name=perk.formatted_name
             )
             perk_levels.append(perk_detail)
 
         # Sort by counter level
-        perk_levels.sort(key=lambda p: p.counter)
+        perk_levels.sort(key=attrgetter("counter"))
 
         perk_series = PerkSeries(
             name=perk_name,
@@ -295,6 +433,25 @@ class PerkService:
         logger.info(f"Found perk series '{perk_name}' with {len(perk_levels)} levels")
         return perk_series
 
+    def get_perk_types_bulk(self, series_names: List[str]) -> Dict[str, str]:
+        """
+        Get the perk type (SL, AI, LE) for several perk series in one query.
+
+        Args:
+            series_names: Perk series names
+
+        Returns:
+            Dictionary mapping each found series name to its type
+        """
+        if not series_names:
+            return {}
+
+        rows = self.db.query(Perk.perk_series, Perk.type)\
+            .filter(Perk.perk_series.in_(series_names))\
+            .distinct()\
+            .all()
+        return dict(rows)
+
     def calculate_perk_effects(self, owned_perks: Dict[str, int]) -> Dict[str, int]:
         """
         Calculate aggregate spell_data effects from owned perks.
@@ -309,19 +466,29 @@ class PerkService:
 
         total_effects = {}
 
+        # Load levels 1..owned_level of every owned perk in one query
+        level_ranges = [
+            and_(Perk.perk_series == perk_name, Perk.counter.between(1, owned_level))
+            for perk_name, owned_level in owned_perks.items() if owned_level > 0
+        ]
+        items_by_level = {}
+        if level_ranges:
+            perk_items = self.db.query(Item)\
+                .join(Perk, Item.id == Perk.item_id)\
+                .filter(or_(*level_ranges))\
+                .options(
+                    contains_eager(Item.perk),
+                    *SPELL_CHAIN_LOADERS
+                )\
+                .order_by(Item.id)\
+                .all()
+            for perk_item in perk_items:
+                items_by_level.setdefault((perk_item.perk.perk_series, perk_item.perk.counter), perk_item)
+
         for perk_name, owned_level in owned_perks.items():
             # Get all levels from 1 to owned_level
             for level in range(1, owned_level + 1):
-                # Find the perk item for this level
-                perk_item = self.db.query(Item)\
-                    .join(Perk, Item.id == Perk.item_id)\
-                    .filter(Perk.perk_series == perk_name)\
-                    .filter(Perk.counter == level)\
-                    .options(\
-                        joinedload(Item.perk),\
-                        joinedload(Item.item_spell_data).joinedload(ItemSpellData.spell_data).joinedload(SpellData.spell_data_spells).joinedload(SpellDataSpells.spell).joinedload(Spell.spell_criteria).joinedload(SpellCriterion.criterion)\
-                    )\
-                    .first()
+                perk_item = items_by_level.get((perk_name, level))
 
                 if not perk_item:
                     logger.warning(f"Perk level not found: {perk_name} level {level}")
@@ -432,7 +599,7 @@ class PerkService:
                             "operator": ac.criterion.operator,
                             "order_index": ac.order_index
                         }
-                        for ac in sorted(action.action_criteria, key=lambda x: x.order_index)
+                        for ac in sorted(action.action_criteria, key=attrgetter("order_index"))
                     ] if action.action_criteria else []
                 }
                 for action in perk_item.actions
@@ -453,7 +620,7 @@ class PerkService:
             "type": perk.type,
             "level": perk.level_required,
             "ai_title": perk.ai_level_required if perk.ai_level_required > 0 else None,
-            "formatted_name": f"{perk.name} {perk.counter}"
+            "formatted_name": perk.formatted_name
         }
 
         # Add attack/defense stats if available
@@ -491,30 +658,7 @@ class PerkService:
             Dictionary with complete perk item information or None if not found
         """
         logger.info(f"Looking up perk info by AOID: {aoid}")
-
-        # Query the perk item by AOID with all relationships loaded
-        from sqlalchemy.orm import selectinload
-
-        perk_item = self.db.query(Item)\
-            .join(Perk, Item.id == Perk.item_id)\
-            .filter(Item.aoid == aoid)\
-            .options(
-                joinedload(Item.perk),
-                selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
-                selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data).selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell).selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
-                selectinload(Item.actions).selectinload(Action.action_criteria).selectinload(ActionCriteria.criterion),
-                joinedload(Item.attack_defense)
-            )\
-            .first()
-
-        if not perk_item:
-            logger.info(f"No perk found with AOID {aoid}")
-            return None
-
-        perk_info = self._build_perk_info_dict(perk_item)
-        if perk_info:
-            logger.info(f"Found complete perk item: {perk_item.perk.name} (type: {perk_item.perk.type}, level: {perk_item.perk.counter})")
-        return perk_info
+        return self.batch_get_perk_info_by_aoids([aoid]).get(aoid)
 
     def batch_get_perk_info_by_aoids(self, aoids: List[int]) -> Dict[int, Optional[Dict[str, Any]]]:
         """
@@ -529,26 +673,30 @@ class PerkService:
         if not aoids:
             return {}
 
-        from sqlalchemy.orm import selectinload
+        # Only query AOIDs not already looked up during this request
+        missing = [aoid for aoid in dict.fromkeys(aoids) if aoid not in self._perk_info_cache]
+        if not missing:
+            return {aoid: self._perk_info_cache[aoid] for aoid in aoids if self._perk_info_cache[aoid]}
 
         perk_items = self.db.query(Item)\
             .join(Perk, Item.id == Perk.item_id)\
-            .filter(Item.aoid.in_(aoids))\
+            .filter(Item.aoid.in_(missing))\
             .options(
-                joinedload(Item.perk),
+                contains_eager(Item.perk),
                 selectinload(Item.item_stats).selectinload(ItemStats.stat_value),
-                selectinload(Item.item_spell_data).selectinload(ItemSpellData.spell_data).selectinload(SpellData.spell_data_spells).selectinload(SpellDataSpells.spell).selectinload(Spell.spell_criteria).selectinload(SpellCriterion.criterion),
+                *SPELL_CHAIN_LOADERS,
                 selectinload(Item.actions).selectinload(Action.action_criteria).selectinload(ActionCriteria.criterion),
                 joinedload(Item.attack_defense)
             )\
             .all()
 
-        # Build lookup by AOID
-        results = {}
+        # Build lookup by AOID; remember misses too so they are not re-queried
+        for aoid in missing:
+            self._perk_info_cache[aoid] = None
         for perk_item in perk_items:
-            perk_info = self._build_perk_info_dict(perk_item)
-            results[perk_item.aoid] = perk_info
+            self._perk_info_cache[perk_item.aoid] = self._build_perk_info_dict(perk_item)
 
+        results = {aoid: self._perk_info_cache[aoid] for aoid in aoids if self._perk_info_cache[aoid]}
         logger.info(f"Batch perk lookup: {len(aoids)} requested, {len(results)} found")
         return results
 
@@ -569,8 +717,8 @@ class PerkService:
             .join(Perk, Item.id == Perk.item_id)\
             .filter(Item.aoid == aoid)\
             .options(
-                joinedload(Item.perk),
-                joinedload(Item.item_spell_data).joinedload(ItemSpellData.spell_data).joinedload(SpellData.spell_data_spells).joinedload(SpellDataSpells.spell).joinedload(Spell.spell_criteria).joinedload(SpellCriterion.criterion)
+                contains_eager(Item.perk),
+                *SPELL_CHAIN_LOADERS
             )\
             .first()
 
@@ -626,7 +774,7 @@ class PerkService:
             spell_data=spell_data_responses,
             point_cost=point_cost,
             perk_series=perk.perk_series,  # Add perk_series for grouping
-            formatted_name=f"{perk.name} {perk.counter}"  # Add formatted name with counter
+            formatted_name=perk.formatted_name
         )
 
         logger.info(f"Found perk: {perk.name} (type: {perk.type}, level: {perk.counter})")
@@ -668,7 +816,7 @@ class PerkService:
             .join(Perk, Item.id == Perk.item_id)\
             .filter(Perk.perk_series == perk_name)\
             .filter(Perk.counter == target_level)\
-            .options(joinedload(Item.perk))\
+            .options(contains_eager(Item.perk))\
             .first()
 
         if not perk_item:
@@ -740,62 +888,131 @@ class PerkService:
             prerequisite_perks=prerequisite_perks
         )
 
+    # Cache invalidation
+
+    def get_data_etag(self) -> str:
+        """
+        Weak ETag for the current perk data version, used for conditional GETs.
+
+        Hashed from a perks-table aggregate, so every worker agrees on it and it
+        only changes with the data. The value is cached under the "perks" tag
+        to skip the aggregate on most requests.
+        """
+        etag = cache_service.get(PERK_ETAG_KEY)
+        if etag is None:
+            count, max_id, id_sum = self.db.query(
+                func.count(Perk.item_id), func.max(Perk.item_id), func.sum(Perk.item_id)
+            ).one()
+            digest = hashlib.blake2b(f"{count}:{max_id}:{id_sum}".encode(), digest_size=8).hexdigest()
+            etag = f'W/"{digest}"'
+            cache_service.set(PERK_ETAG_KEY, etag, CACHE_TTL['perks_etag'])
+            cache_service.tag(PERK_ETAG_KEY, "perks")
+        return etag
+
+    @staticmethod
+    def invalidate_all() -> int:
+        """
+        Drop every cached perk response (after a reseed or perk data change).
+
+        With the memory backend this only reaches the calling process.
+        """
+        return invalidate_cache_tag("perks")
+
     # Helper methods for ID/name conversion
 
     def _profession_ids_to_names(self, profession_ids: List[int]) -> List[str]:
         """Convert profession IDs to names."""
-        return [PROFESSION_NAMES.get(prof_id, f'Unknown({prof_id})') for prof_id in profession_ids if prof_id in PROFESSION_NAMES]
+        return [PROFESSION_NAMES[prof_id] for prof_id in profession_ids if prof_id in PROFESSION_NAMES]
 
     def _breed_ids_to_names(self, breed_ids: List[int]) -> List[str]:
         """Convert breed IDs to names."""
-        return [BREED_NAMES.get(breed_id, f'Unknown({breed_id})') for breed_id in breed_ids if breed_id in BREED_NAMES]
+        return [BREED_NAMES[breed_id] for breed_id in breed_ids if breed_id in BREED_NAMES]
 
     def _profession_name_to_id(self, profession_name: str) -> Optional[int]:
         """Convert profession name to ID."""
-        for prof_id, name in PROFESSION_NAMES.items():
-            if name == profession_name:
-                return prof_id
-        return None
+        return PROFESSION_IDS.get(profession_name)
 
     def _breed_name_to_id(self, breed_name: str) -> Optional[int]:
         """Convert breed name to ID."""
-        for breed_id, name in BREED_NAMES.items():
-            if name == breed_name:
-                return breed_id
-        return None
-
-    # Helper methods
+        return BREED_IDS.get(breed_name)
 
-# Old helper methods removed - now using Perk table data directly
+    def _resolve_id(self, value: Optional[str], name_to_id) -> Optional[int]:
+        """Resolve a profession/breed given as a numeric ID or a name."""
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return name_to_id(value)
+
+    @staticmethod
+    def _allows(column, value_id: int):
+        """Array requirement is empty (everyone allowed) or contains value_id."""
+        # cardinality() is 0 for '{}' where array_length() is NULL; the @>
+        # branch is served by the GIN index on the column
+        return or_(
+            func.coalesce(func.cardinality(column), 0) == 0,
+            column.contains([value_id])
+        )
 
-    def _can_purchase_level(self, perk_name: str, target_level: int, owned_perks: Dict[str, int]) -> bool:
-        """Check if character can purchase the target perk level (sequential validation)."""
-        current_level = owned_perks.get(perk_name, 0)
-        return target_level <= current_level + 1
+    @staticmethod
+    def _name_matches(search: str):
+        """
+        Perk name search predicate.
 
-    def _is_affordable(
-        self,
-        perk_type: str,
-        perk_level: int,
-        available_sl_points: Optional[int],
-        available_ai_points: Optional[int],
+        Always a substring ILIKE (trigram-indexed). Multi-word searches also
+        match the words in any order through the name_tsv GIN index, so
+        "shot aimed" finds "Aimed Shot" while a half-typed "aimed sh" still
+        matches as a substring.
+        """
+        substring = Perk.name.ilike(f'%{search}%')
+        if len(search.split()) < 2:
+            return substring
+        return or_(substring, Perk.name_tsv.op('@@')(func.websearch_to_tsquery('simple', search)))
+
+    @staticmethod
+    def _filter_purchasable(
+        query,
         owned_perks: Optional[Dict[str, int]],
-        perk_name: str
-    ) -> bool:
-        """Check if character has enough points to purchase the perk."""
-        if perk_type == 'LE':
-            return True  # LE research is free
-
-        # Calculate cost (1 point per level)
-        current_level = owned_perks.get(perk_name, 0) if owned_perks else 0
-        cost = perk_level - current_level
-
-        if perk_type == 'SL' and available_sl_points is not None:
-            return available_sl_points >= cost
-        elif perk_type == 'AI' and available_ai_points is not None:
-            return available_ai_points >= cost
+        available_sl_points: Optional[int],
+        available_ai_points: Optional[int]
+    ):
+        """
+        Restrict a perk query to levels that can be bought next and afforded.
 
-        return True  # If no point limits specified, assume affordable
+        Purchases are sequential and each level costs one point, both relative
+        to the owned level of the perk; LE research is free. Unset arguments
+        add no predicate at all.
+        """
+        owned_level = case(owned_perks, value=Perk.name, else_=0) if owned_perks else 0
+        if owned_perks:
+            query = query.filter(Perk.counter <= owned_level + 1)
+        if available_sl_points is not None:
+            query = query.filter(or_(Perk.type != 'SL', Perk.counter - owned_level <= available_sl_points))
+        if available_ai_points is not None:
+            query = query.filter(or_(Perk.type != 'AI', Perk.counter - owned_level <= available_ai_points))
+        return query
+
+    def _perk_to_response(self, row) -> PerkResponse:
+        """Build a PerkResponse from a PERK_LIST_COLUMNS row."""
+        # Every field is a typed column value straight from the DB (perks.counter
+        # and level_required are NOT NULL), so per-row validation is skipped
+        return PerkResponse.model_construct(
+            id=row.item_id,
+            aoid=row.aoid,
+            name=row.name,
+            counter=row.counter,
+            type=row.type,
+            # Empty list indicates "all allowed"
+            professions=self._profession_ids_to_names(row.professions or []),
+            breeds=self._breed_ids_to_names(row.breeds or []),
+            level=row.level_required,
+            ai_title=row.ai_level_required if row.ai_level_required > 0 else None,
+            description=row.description,
+            ql=row.ql,
+            perk_series=row.perk_series,
+            formatted_name=row.formatted_name
+        )
 
     def _get_spell_data_responses(self, item: Item) -> List[SpellDataResponse]:
         """Convert item spell data to response format following the pattern from items endpoint."""
@@ -863,23 +1080,16 @@ class PerkService:
         return spell_data_list
 
     def _extract_perk_effects(self, item: Item) -> List[PerkEffect]:
-        """Extract stat effects from item spell data."""
+        """Extract stat effects from item spell data (uses the loaded spell chain)."""
         effects = []
 
-        # Query spell data for this item
-        spell_data_query = self.db.query(SpellData)\
-            .join(ItemSpellData, SpellData.id == ItemSpellData.spell_data_id)\
-            .filter(ItemSpellData.item_id == item.id)
-
-        for spell_data in spell_data_query.all():
-            # Query spells in this spell data
-            spells_query = self.db.query(Spell)\
-                .join(SpellDataSpells, Spell.id == SpellDataSpells.spell_id)\
-                .filter(SpellDataSpells.spell_data_id == spell_data.id)
-
-            for spell in spells_query.all():
+        for isd in item.item_spell_data:
+            if not isd.spell_data:
+                continue
+            for sds in isd.spell_data.spell_data_spells:
+                spell = sds.spell
                 # Extract stat modifications from spell parameters
-                if spell.spell_params and isinstance(spell.spell_params, dict):
+                if spell and spell.spell_params and isinstance(spell.spell_params, dict):
                     stat_id = spell.spell_params.get('Stat')
                     value = spell.spell_params.get('Value', 0)
 
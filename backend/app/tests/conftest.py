@@ -4,12 +4,14 @@ Pytest configuration and fixtures for TinkerTools backend tests.
 
 import pytest
 import os
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_read_only_db
 from app.models import *
 
 # Import all fixtures from fixture modules
@@ -66,6 +68,7 @@ def client(db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db_with_session
+    app.dependency_overrides[get_read_only_db] = override_get_db_with_session
     with TestClient(app) as test_client:
         yield test_client
 
@@ -74,6 +77,35 @@ def client(db_session):
     db_session.expunge_all()  # Clear all objects from session identity map
 
 
+@pytest.fixture
+def count_queries():
+    """
+    Count SQL statements issued while a block runs.
+
+    Listens on every Engine, so statements are counted whether they go
+    through the db_session fixture's connection or the application's own pool.
+
+    Usage:
+        with count_queries() as statements:
+            client.get(...)
+        assert len(statements) == 2
+    """
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
+
+
 @pytest.fixture
 def sample_stat_value(db_session):
     """Query a real stat value from the database for testing.
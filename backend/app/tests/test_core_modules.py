@@ -14,6 +14,7 @@ import asyncio
 import os
 from unittest.mock import Mock, patch, MagicMock
 from typing import Any
+from collections import namedtuple
 
 from app.core.cache import (
     CacheService,
@@ -22,6 +23,7 @@ from app.core.cache import (
     get_cached_response,
     cache_response,
     invalidate_cache_pattern,
+    invalidate_cache_tag,
     get_cache_stats,
     CACHE_TTL
 )
@@ -30,7 +32,9 @@ from app.core.decorators import (
     performance_monitor,
     log_query_params
 )
-from app.core.config import Settings, settings
+from app.core.config import Settings
+from app.core.pagination import paginate, paginate_with_window, paginate_without_total, page_count
+from app.api.schemas import PaginatedResponse
 
 
 # ============================================================================
@@ -114,6 +118,16 @@ class TestCacheService:
         result = cache.delete("nonexistent")
         assert result is False
 
+    def test_cache_add_only_sets_absent_keys(self, cache):
+        """Test that add() behaves like SET NX, including for expired keys."""
+        assert cache.add("lock", 1, ttl=1) is True
+        assert cache.add("lock", 2, ttl=1) is False
+        assert cache.get("lock") == 1
+
+        time.sleep(1.1)
+        assert cache.add("lock", 3, ttl=1) is True
+        assert cache.get("lock") == 3
+
     def test_cache_clear(self, cache):
         """Test clearing all cache entries."""
         cache.set("key1", "value1")
@@ -311,6 +325,36 @@ class TestCacheModuleFunctions:
         assert get_cached_response("items:detail:1") is not None
         assert get_cached_response("spells:list:1") is not None
 
+    def test_invalidate_cache_tag(self):
+        """Test that invalidating a tag drops only the keys registered under it."""
+        cache_response("perks:a", "a")
+        cache_response("perks:b", "b")
+        cache_response("items:c", "c")
+        cache_service.tag("perks:a", "perks", "perk_series:Accumulator")
+        cache_service.tag("perks:b", "perks")
+
+        assert invalidate_cache_tag("perk_series:Accumulator") == 1
+        assert get_cached_response("perks:a") is None
+        assert get_cached_response("perks:b") == "b"
+
+        assert invalidate_cache_tag("perks") == 1
+        assert get_cached_response("perks:b") is None
+        assert get_cached_response("items:c") == "c"
+
+    def test_removed_keys_leave_tag_registry(self):
+        """Test that deleted and expired keys are dropped from their tags."""
+        cache_response("perks:a", "a")
+        cache_response("perks:b", "b", ttl=0.01)
+        cache_service.tag("perks:a", "perks")
+        cache_service.tag("perks:b", "perks")
+
+        cache_service.delete("perks:a")
+        time.sleep(0.02)
+        cache_service.cleanup_expired()
+
+        assert "perks" not in cache_service.tags
+        assert cache_service.key_tags == {}
+
     def test_invalidate_cache_pattern_no_matches(self):
         """Test pattern invalidation with no matches."""
         cache_response("test:key", {"data": "test"})
@@ -461,6 +505,69 @@ class TestCachedResponseDecorator:
 
         assert call_count == 1  # Only called once
 
+    def test_service_param_excluded_from_cache_key(self):
+        """Test that per-request services wrapping a session don't split the cache."""
+        from sqlalchemy.orm import Session
+        call_count = 0
+
+        class Service:
+            def __init__(self):
+                self.db = Session()
+
+        @cached_response("items_list")
+        def get_items(page: int = 1, service=None):
+            nonlocal call_count
+            call_count += 1
+            return {"items": [], "page": page}
+
+        get_items(page=1, service=Service())
+        get_items(page=1, service=Service())
+
+        assert call_count == 1
+
+    def test_response_cached_as_encoded_bytes(self):
+        """Test that pre-serialized responses are stored as bytes and rebuilt on a hit."""
+        from fastapi import Response
+        from app.core.decorators import EncodedBody
+        call_count = 0
+
+        @cached_response("symbiants")
+        def get_page(page: int = 1):
+            nonlocal call_count
+            call_count += 1
+            return Response(content=b'{"page":1}', media_type="application/json")
+
+        first = get_page(page=1)
+        second = get_page(page=1)
+
+        assert call_count == 1
+        assert isinstance(second, Response)
+        assert second is not first
+        assert second.body == first.body
+        assert second.media_type == "application/json"
+
+        key = cache_key_for_query(f"{get_page.__module__}.{get_page.__name__}", page=1)
+        assert isinstance(get_cached_response(key), EncodedBody)
+
+    def test_concurrent_misses_compute_once(self):
+        """Test that concurrent misses on one key run the function only once."""
+        call_count = 0
+
+        @cached_response("items_list")
+        def get_items(page: int = 1):
+            nonlocal call_count
+            call_count += 1
+            time.sleep(0.2)
+            return {"items": [], "page": page}
+
+        threads = [threading.Thread(target=get_items, kwargs={"page": 1}) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert call_count == 1
+
     def test_default_ttl_from_cache_type(self):
         """Test that default TTL is used from CACHE_TTL when not specified."""
         @cached_response("items_list")
@@ -639,6 +746,208 @@ class TestDecoratorComposition:
             assert call_count == 1  # Not executed again
 
 
+# ============================================================================
+# Pagination Module Tests
+# ============================================================================
+
+class TestPaginate:
+    """Test suite for the paginate helper."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Clear cache before each test."""
+        cache_service.clear()
+        yield
+        cache_service.clear()
+
+    @staticmethod
+    def make_query(rows, total):
+        """Build a query mock returning rows for the page and total for count()."""
+        query = MagicMock()
+        query.offset.return_value.limit.return_value.all.return_value = rows
+        query.order_by.return_value.count.return_value = total
+        return query
+
+    def test_short_page_skips_count(self):
+        """Test that a short page derives the total without counting."""
+        query = self.make_query([1, 2, 3], total=999)
+
+        rows, total = paginate(query, page=2, page_size=10, count_key="k:count")
+
+        assert rows == [1, 2, 3]
+        assert total == 13
+        query.order_by.return_value.count.assert_not_called()
+
+    def test_full_page_count_is_cached(self):
+        """Test that a full page counts once and reuses the cached total."""
+        query = self.make_query(list(range(10)), total=42)
+
+        assert paginate(query, 1, 10, count_key="k:count")[1] == 42
+        assert paginate(query, 2, 10, count_key="k:count")[1] == 42
+        assert query.order_by.return_value.count.call_count == 1
+
+    def test_exact_count_bypasses_cache(self):
+        """Test that exact_count always recounts."""
+        query = self.make_query(list(range(10)), total=42)
+        cache_service.set("k:count", 7)
+
+        assert paginate(query, 1, 10, count_key="k:count", exact_count=True)[1] == 42
+
+
+class TestPaginateWithWindow:
+    """Test suite for the window-count paginate helper."""
+
+    @staticmethod
+    def make_query(rows, total):
+        """Build a query mock returning (entity, full_count) rows and total for count()."""
+        query = MagicMock()
+        Row = namedtuple("Row", ["entity", "full_count"])
+        window_rows = [Row(row, total) for row in rows]
+        query.add_columns.return_value.offset.return_value.limit.return_value.all.return_value = window_rows
+        query.order_by.return_value.count.return_value = total
+        return query
+
+    def test_total_comes_from_the_page(self):
+        """Test that the total is read from the window column without a COUNT."""
+        query = self.make_query(["a", "b"], total=57)
+
+        rows, total = paginate_with_window(query, page=3, page_size=2)
+
+        assert rows == ["a", "b"]
+        assert total == 57
+        query.order_by.return_value.count.assert_not_called()
+
+    def test_empty_first_page_is_zero(self):
+        """Test that an empty first page means nothing matched."""
+        query = self.make_query([], total=0)
+
+        assert paginate_with_window(query, page=1, page_size=10) == ([], 0)
+        query.order_by.return_value.count.assert_not_called()
+
+    def test_past_last_page_still_counts(self):
+        """Test that a page past the end falls back to COUNT for the total."""
+        query = self.make_query([], total=25)
+
+        assert paginate_with_window(query, page=9, page_size=10) == ([], 25)
+
+    def test_cached_total_skips_window(self):
+        """Test that later pages of the same filters reuse the cached total."""
+        cache_service.clear()
+        query = self.make_query(["a", "b"], total=57)
+        query.offset.return_value.limit.return_value.all.return_value = ["c", "d"]
+
+        assert paginate_with_window(query, 1, 2, count_key="w:count") == (["a", "b"], 57)
+        assert paginate_with_window(query, 2, 2, count_key="w:count") == (["c", "d"], 57)
+        assert query.add_columns.call_count == 1
+        cache_service.clear()
+
+
+class TestPaginateWithoutTotal:
+    """Test suite for the count-free paginate helper."""
+
+    def test_extra_row_signals_next_page(self):
+        """Test that one over-fetched row is trimmed and reported as has_next."""
+        query = MagicMock()
+        query.offset.return_value.limit.return_value.all.return_value = [1, 2, 3]
+
+        assert paginate_without_total(query, page=2, page_size=2) == ([1, 2], True)
+        query.offset.assert_called_once_with(2)
+        query.offset.return_value.limit.assert_called_once_with(3)
+        query.count.assert_not_called()
+
+    def test_last_page_has_no_next(self):
+        """Test that a page without the extra row is the last one."""
+        query = MagicMock()
+        query.offset.return_value.limit.return_value.all.return_value = [1]
+
+        assert paginate_without_total(query, page=1, page_size=2) == ([1], False)
+
+
+class TestPaginatedResponseFromPage:
+    """Test suite for PaginatedResponse.from_page."""
+
+    def test_derives_pages_and_flags(self):
+        """Test that pages and next/prev flags follow from the total."""
+        response = PaginatedResponse[int].from_page([1, 2], total=5, page=2, page_size=2)
+
+        assert response.pages == 3
+        assert response.has_next is True
+        assert response.has_prev is True
+
+    def test_without_total_uses_given_has_next(self):
+        """Test that a count-free page keeps the caller's has_next."""
+        response = PaginatedResponse[int].from_page([1, 2], total=None, page=1, page_size=2, has_next=True)
+
+        assert response.total is None
+        assert response.pages is None
+        assert response.has_next is True
+        assert response.has_prev is False
+
+    def test_without_total_derives_has_next_from_cursor(self):
+        """Test that a count-free page with a next cursor reports a next page."""
+        response = PaginatedResponse[int].from_page(
+            [1, 2], total=None, page=1, page_size=2, next_cursor="WzJd"
+        )
+
+        assert response.has_next is True
+        assert response.next_cursor == "WzJd"
+
+    def test_without_total_or_has_next_raises(self):
+        """Test that a count-free page without has_next or a cursor is rejected clearly."""
+        with pytest.raises(ValueError, match="has_next is required"):
+            PaginatedResponse[int].from_page([1, 2], total=None, page=1, page_size=2)
+
+
+class TestPageCount:
+    """Test suite for page_count."""
+
+    def test_rounds_up_partial_pages(self):
+        """Test that a partial last page counts as a page."""
+        assert page_count(10, 5) == 2
+        assert page_count(11, 5) == 3
+        assert page_count(1, 50) == 1
+
+    def test_empty_result_is_one_page(self):
+        """Test that zero rows still report a single page."""
+        assert page_count(0, 50) == 1
+
+
+# ============================================================================
+# Database Module Tests
+# ============================================================================
+
+class TestReadOnlySession:
+    """Test suite for the read-only session dependency."""
+
+    def test_transaction_is_read_only(self):
+        """Test that read-only sessions run in a READ ONLY transaction."""
+        from sqlalchemy import text
+        from app.core.database import get_read_only_db
+
+        sessions = get_read_only_db()
+        db = next(sessions)
+        try:
+            assert db.execute(text("SHOW transaction_read_only")).scalar() == "on"
+        finally:
+            sessions.close()
+
+    def test_regular_session_is_writable(self):
+        """Test that the read-only option does not leak into pooled connections."""
+        from sqlalchemy import text
+        from app.core.database import get_read_only_db, get_db
+
+        sessions = get_read_only_db()
+        next(sessions)
+        sessions.close()
+
+        sessions = get_db()
+        db = next(sessions)
+        try:
+            assert db.execute(text("SHOW transaction_read_only")).scalar() == "off"
+        finally:
+            sessions.close()
+
+
 # ============================================================================
 # Config Module Tests
 # ============================================================================
@@ -654,6 +963,9 @@ class TestSettingsClass:
         assert test_settings.APP_ENV == "development"
         assert test_settings.LOG_LEVEL == "INFO"
         assert test_settings.REDIS_URL == "redis://localhost:6379/0"
+        assert test_settings.DEBUG is False
+        assert test_settings.CACHE_WARMUP_ON_STARTUP is False
+        assert test_settings.CACHE_BACKEND == "memory"
 
     def test_settings_from_environment(self):
         """Test that Settings loads from environment variables."""
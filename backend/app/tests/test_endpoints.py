@@ -10,7 +10,7 @@ from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.main import app
+from app.main import app, warm_profession_nano_cache
 from app.core.database import get_db
 from app.api.schemas import (
     ItemDetail,
@@ -54,6 +54,29 @@ class TestGeneralEndpoints:
         assert "documentation" in data
         assert "health" in data
 
+    def test_no_duplicate_routes(self):
+        """Test that no two routers register the same method and path."""
+        seen = set()
+        duplicates = []
+        for route in app.routes:
+            for method in getattr(route, "methods", None) or ():
+                key = (method, route.path)
+                if key in seen:
+                    duplicates.append(key)
+                seen.add(key)
+
+        assert duplicates == []
+
+    def test_startup_warms_profession_pages(self):
+        """Test that the lifespan starts the profession page warmup when enabled."""
+        with patch("app.main.settings.CACHE_WARMUP_ON_STARTUP", True), \
+                patch("app.main.threading.Thread") as thread:
+            with TestClient(app):
+                pass
+
+        thread.assert_called_once_with(target=warm_profession_nano_cache, daemon=True)
+        thread.return_value.start.assert_called_once()
+
 
 class TestItemEndpoints:
     """Test cases for item API endpoints."""
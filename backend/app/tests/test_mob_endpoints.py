@@ -133,6 +133,26 @@ def test_list_mobs_invalid_page_size(client):
     assert response.status_code == 422
 
 
+def test_list_mobs_cursor_matches_offset(client, db_session):
+    """Test that seeking with next_cursor returns the same rows as the next offset page."""
+    first = client.get("/api/v1/mobs?page=1&page_size=2").json()
+    if first["next_cursor"] is None:
+        pytest.skip("Need more than one page of mobs")
+
+    by_cursor = client.get(f"/api/v1/mobs?page_size=2&cursor={first['next_cursor']}").json()
+    by_offset = client.get("/api/v1/mobs?page=2&page_size=2").json()
+
+    assert [m["id"] for m in by_cursor["items"]] == [m["id"] for m in by_offset["items"]]
+    assert by_cursor["total"] == first["total"]
+    assert by_cursor["has_prev"] is True
+
+
+def test_list_mobs_invalid_cursor(client):
+    """Test with a cursor that does not decode to a mob sort key."""
+    response = client.get("/api/v1/mobs?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
 # ============================================================================
 # GET /api/v1/mobs/{mob_id} Tests
 # ============================================================================
@@ -203,6 +223,16 @@ def test_get_mob_drops_filter_family(client, db_session):
         assert symbiant["family"] == "Control"
 
 
+def test_get_mob_drops_filter_family_no_match(client, db_session):
+    """Test that an existing mob with no drops in the family returns an empty list, not 404."""
+    mob = db_session.query(Mob).filter(Mob.id == MOB_ID_AHPTA).one()
+
+    response = client.get(f"/api/v1/mobs/{mob.id}/drops?family=NoSuchFamily")
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
 def test_get_mob_drops_no_drops(client, db_session):
     """Test getting drops for mob with no drops using real database mob."""
     # Alatyr has 7 drops, but we'll test with an invalid mob ID for no drops
@@ -308,6 +338,20 @@ def test_get_mob_by_id_with_symbiant_count(client, db_session):
     assert data["symbiant_count"] >= 1
 
 
+def test_mob_source_type_id_is_cached(db_session):
+    """Test that the 'mob' source type id is looked up once and reused."""
+    from app.api.routes import mobs as mobs_routes
+
+    expected = db_session.query(SourceType.id).filter(SourceType.name == 'mob').scalar()
+
+    mobs_routes._mob_source_type_id = None
+    assert mobs_routes.get_mob_source_type_id(db_session) == expected
+    assert mobs_routes._mob_source_type_id == expected
+
+    # A cached value is returned without consulting the session
+    assert mobs_routes.get_mob_source_type_id(None) == expected
+
+
 def test_list_mobs_ordering(client, db_session):
     """Test that mobs are ordered by level then name."""
     # Just verify that endpoint returns ordered results by level
@@ -7,9 +7,12 @@ validating full pipeline from database to response without mocks.
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import text
 
 from app.main import app
 from app.models import Item
+from app.core.cache import cache_service
+from app.api.routes.nanos import _FAST_SELECT_SQL
 
 
 # Test client fixture
@@ -345,6 +348,33 @@ def test_get_nano_casting_requirements(client, db_session):
     assert isinstance(data["casting_requirements"], list)
 
 
+def test_get_nano_query_count_is_bounded(client, db_session, count_queries):
+    """Test that nano detail loads everything eagerly, with no per-relationship lazy loads."""
+    real_nano = db_session.query(Item).filter(Item.is_nano == True).first()
+    assert real_nano is not None
+    cache_service.clear()
+
+    with count_queries() as statements:
+        response = client.get(f"/api/v1/nanos/{real_nano.id}")
+
+    assert response.status_code == 200
+    # Single joinedload query for the whole graph
+    assert len(statements) <= 1
+
+
+def test_get_nanos_query_count_is_bounded(client, count_queries):
+    """Test that the nano list issues a constant number of queries regardless of page size."""
+    cache_service.clear()
+
+    with count_queries() as small:
+        assert client.get("/api/v1/nanos?page_size=5").status_code == 200
+    cache_service.clear()
+    with count_queries() as large:
+        assert client.get("/api/v1/nanos?page_size=50").status_code == 200
+
+    assert len(large) == len(small)
+
+
 def test_get_nano_not_found(client):
     """Test getting non-existent nano."""
     response = client.get("/api/v1/nanos/999999999")
@@ -571,6 +601,45 @@ def test_get_nanos_by_profession_fast_pagination(client):
     assert "has_prev" in data
 
 
+def test_get_nanos_by_profession_fast_cursor_matches_offset(client):
+    """Test that following next_cursor returns the same rows as the next offset page."""
+    first = client.get("/api/v1/nanos/profession/0/fast?sort=ql&sort_order=desc&page_size=10").json()
+    assert first["next_cursor"]
+
+    by_cursor = client.get(
+        f"/api/v1/nanos/profession/0/fast?sort=ql&sort_order=desc&page_size=10&cursor={first['next_cursor']}"
+    ).json()
+    by_offset = client.get("/api/v1/nanos/profession/0/fast?sort=ql&sort_order=desc&page_size=10&page=2").json()
+
+    assert [item["id"] for item in by_cursor["items"]] == [item["id"] for item in by_offset["items"]]
+
+
+def test_fast_nano_sql_fetches_wide_rows_for_page_only(db_session):
+    """Test that the deferred join only looks up page_size rows from items."""
+    statement = _FAST_SELECT_SQL[(False, True, True, False)]
+    plan = db_session.execute(
+        text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement.text),
+        {"limit": 10, "offset": 500, "prof_id": None}
+    ).scalar()
+
+    def wide_lookups(node):
+        """Yield actual row counts of scans over the outer items alias."""
+        if node.get("Alias") == "w":
+            yield node["Actual Rows"] * node.get("Actual Loops", 1)
+        for child in node.get("Plans", []):
+            yield from wide_lookups(child)
+
+    lookups = list(wide_lookups(plan[0]["Plan"]))
+    assert lookups
+    assert sum(lookups) <= 10
+
+
+def test_get_nanos_by_profession_fast_invalid_cursor(client):
+    """Test that a malformed cursor is rejected."""
+    response = client.get("/api/v1/nanos/profession/0/fast?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
 def test_get_nanos_by_profession_fast_sort_by_name(client):
     """Test sorting by name in fast endpoint."""
     response = client.get("/api/v1/nanos/profession/0/fast?sort=name&sort_order=asc&page_size=20")
@@ -672,3 +741,4 @@ def test_profession_endpoint_returns_profession_specific_nanos(client):
     # Both professions should have nanos
     assert nt_data["total"] > 0
     assert doc_data["total"] > 0
+
@@ -146,6 +146,17 @@ def test_get_perks_search_by_name(client):
         assert "accumulator" in perk["name"].lower()
 
 
+def test_get_perks_search_multiple_words_any_order(client):
+    """Test that multi-word searches match whole words regardless of order."""
+    in_order = client.get("/api/v1/perks?search=Ancient Knowledge&page_size=200").json()
+    reversed_order = client.get("/api/v1/perks?search=Knowledge Ancient&page_size=200").json()
+
+    assert [p["id"] for p in reversed_order["items"]] == [p["id"] for p in in_order["items"]]
+    for perk in reversed_order["items"]:
+        name = perk["name"].lower()
+        assert "ancient" in name and "knowledge" in name
+
+
 def test_get_perks_sort_by_name(client):
     """Test sorting perks by name."""
     response = client.get("/api/v1/perks?sort_by=name&page_size=20")
@@ -162,6 +173,17 @@ def test_get_perks_sort_by_level(client):
     assert response.status_code == 200
     data = response.json()
     assert len(data["items"]) > 0
+    levels = [perk["level"] for perk in data["items"]]
+    assert levels == sorted(levels)
+
+
+def test_get_perks_total_is_stable_across_pages(client):
+    """Test that the total is the same on the first page and past the last page."""
+    first = client.get("/api/v1/perks?type=SL&page_size=10").json()
+    past_end = client.get(f"/api/v1/perks?type=SL&page_size=10&page={first['pages'] + 1}").json()
+
+    assert past_end["items"] == []
+    assert past_end["total"] == first["total"]
 
 
 def test_get_perks_invalid_page(client):
@@ -237,6 +259,22 @@ def test_get_perk_stats_level_ranges(client):
     assert max_level <= 220
 
 
+def test_get_perk_stats_conditional_get(client):
+    """Test that a matching If-None-Match gets an empty 304 while the perk data is unchanged."""
+    response = client.get("/api/v1/perks/stats")
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    response = client.get("/api/v1/perks/stats", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # The ETag is derived from the data, so dropping the cache does not rotate it
+    PerkService.invalidate_all()
+    response = client.get("/api/v1/perks/stats", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
 # ============================================================================
 # GET /api/v1/perks/series - Perk Series Listing Tests
 # ============================================================================
@@ -276,6 +314,19 @@ def test_get_perk_series_filter_by_type(client):
         assert series["type"] == "SL"
 
 
+def test_get_perk_series_groups_levels_once(client):
+    """Test that each series appears once with its levels in counter order."""
+    response = client.get("/api/v1/perks/series")
+
+    assert response.status_code == 200
+    data = response.json()
+    names = [series["series_name"] for series in data]
+    assert len(names) == len(set(names))
+    for series in data:
+        counters = [perk["counter"] for perk in series["perks"]]
+        assert counters and counters == sorted(counters)
+
+
 # ============================================================================
 # GET /api/v1/perks/{perk_name} - Perk Series Detail Tests
 # ============================================================================
@@ -355,6 +406,18 @@ def test_lookup_perk_by_aoid_accumulator(client):
     assert data["name"] == "Accumulator"
     assert data["counter"] == 1
     assert data["type"] == "SL"
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_lookup_perk_by_aoid_conditional_get(client):
+    """Test that a lookup revalidated with a matching ETag gets an empty 304."""
+    response = client.get("/api/v1/perks/lookup/210830")
+    etag = response.headers["etag"]
+
+    response = client.get("/api/v1/perks/lookup/210830", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert "immutable" in response.headers["cache-control"]
 
 
 def test_lookup_perk_by_aoid_not_found(client):
@@ -364,6 +427,8 @@ def test_lookup_perk_by_aoid_not_found(client):
     assert response.status_code == 200
     # Returns null body for easier handling in frontend
     assert response.json() is None
+    # Misses may be imported later, so they must not be cached downstream
+    assert "cache-control" not in response.headers
 
 
 def test_lookup_perk_invalid_aoid(client):
@@ -386,6 +451,41 @@ def test_lookup_perk_multiple_aoids(client):
         assert data["counter"] == i
 
 
+def test_perk_service_lookups_are_memoized_per_instance(db_session):
+    """Test that repeated lookups on one PerkService reuse the first result."""
+    service = PerkService(db_session)
+
+    with patch.object(service, '_load_perk_series', wraps=service._load_perk_series) as load:
+        first = service.get_perk_series("Accumulator")
+        assert service.get_perk_series("Accumulator") is first
+        assert load.call_count == 1
+
+    batch = service.batch_get_perk_info_by_aoids([210830, 210831, 999999999])
+    assert set(batch) == {210830, 210831}
+    assert service.get_perk_info_by_aoid(210830) is batch[210830]
+    assert service.get_perk_info_by_aoid(999999999) is None
+
+
+def test_get_perk_series_query_count_is_bounded(db_session, count_queries):
+    """Test that a series loads with one query per relationship hop, not per level."""
+    with count_queries() as statements:
+        series = PerkService(db_session).get_perk_series("Accumulator")
+
+    assert series is not None
+    assert len(series.levels) > 1
+    # Items + perk, then one selectin query per hop of the spell chain
+    assert len(statements) <= 7
+
+
+def test_calculate_perk_effects_query_count_is_bounded(db_session, count_queries):
+    """Test that effect calculation loads every owned level in one batch."""
+    with count_queries() as statements:
+        PerkService(db_session).calculate_perk_effects({"Accumulator": 5, "Exploration": 3})
+
+    # Same bound as a single series, however many perks and levels are owned
+    assert len(statements) <= 7
+
+
 # ============================================================================
 # POST /api/v1/perks/calculate - Perk Calculation Tests (Strategic Mocks)
 # ============================================================================
@@ -456,6 +556,24 @@ def test_calculate_perk_effects_invalid_level(client):
     assert response.status_code == 422
 
 
+def test_calculate_perk_costs_use_bulk_types(client, db_session):
+    """Test that point costs follow the type returned by the bulk type lookup."""
+    perk_types = PerkService(db_session).get_perk_types_bulk(["Accumulator", "NoSuchPerkSeries"])
+    assert set(perk_types) == {"Accumulator"}
+
+    response = client.post("/api/v1/perks/calculate", json={
+        "character_level": 220,
+        "ai_title_level": 30,
+        "owned_perks": {"Accumulator": 1},
+        "target_perks": {"Accumulator": 3, "NoSuchPerkSeries": 2}
+    })
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_sl_cost"] == (2 if perk_types["Accumulator"] == "SL" else 0)
+    assert data["total_ai_cost"] == (2 if perk_types["Accumulator"] == "AI" else 0)
+
+
 @patch.object(PerkService, 'get_perk_series')
 def test_calculate_perk_effects_sl_points(mock_get_series, client):
     """Test SL point calculation."""
@@ -2,17 +2,21 @@
 Unit tests for spell API endpoints.
 
 Tests all spell-related endpoints including list, search, criteria filtering, and detail views.
-Uses service layer mocking pattern to avoid database transaction isolation issues.
+Uses service layer mocking pattern to avoid database transaction isolation issues; the
+query-count test seeds its own rows through the rolled-back db_session fixture instead.
 """
 
 import pytest
+from collections import namedtuple
 from unittest.mock import Mock, patch, MagicMock
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.core.cache import cache_service
 from app.models import Spell, Criterion, SpellCriterion
 from app.api.schemas import SpellResponse, SpellWithCriteria
 from app.core.database import get_db
+from app.api.routes.spells import _parse_criteria
 
 
 @pytest.fixture
@@ -21,6 +25,22 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keep cached list totals from leaking between tests."""
+    cache_service.clear()
+    yield
+    cache_service.clear()
+
+
+WindowRow = namedtuple("WindowRow", ["entity", "full_count"])
+
+
+def window_rows(spells, total):
+    """Shape mocked results like a query carrying COUNT(*) OVER ()."""
+    return [WindowRow(spell, total) for spell in spells]
+
+
 def create_spell_with_criteria(spell, criteria):
     """Helper to properly set up spell-criteria relationship for mocking."""
     # Create actual SpellCriterion instances for proper SQLAlchemy handling
@@ -47,7 +67,9 @@ def test_get_spells_empty(client, monkeypatch):
     mock_query.count.return_value = 0
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = []
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([], 0)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -87,7 +109,9 @@ def test_get_spells_with_data(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -136,14 +160,24 @@ def test_get_spells_pagination(client, monkeypatch):
     first_page_query.count.return_value = 15
     first_page_query.offset.return_value = first_page_query
     first_page_query.limit.return_value = first_page_query
-    first_page_query.all.return_value = spells[:5]
+    first_page_query.order_by.return_value = first_page_query
+    first_page_query.add_columns.return_value = first_page_query
+    first_page_query.all.return_value = window_rows(spells[:5], 15)
+
+    # Second page returns next 5 spells; the first page cached the total, so
+    # they come back as plain entities unless the window query runs again
+    second_page_window = Mock()
+    second_page_window.offset.return_value = second_page_window
+    second_page_window.limit.return_value = second_page_window
+    second_page_window.all.return_value = window_rows(spells[5:10], 15)
 
-    # Second page returns next 5 spells
     second_page_query = Mock()
     second_page_query.filter.return_value = second_page_query
     second_page_query.count.return_value = 15
     second_page_query.offset.return_value = second_page_query
     second_page_query.limit.return_value = second_page_query
+    second_page_query.order_by.return_value = second_page_query
+    second_page_query.add_columns.return_value = second_page_window
     second_page_query.all.return_value = spells[5:10]
 
     mock_db = Mock()
@@ -203,7 +237,9 @@ def test_get_spells_filter_by_target(client, monkeypatch):
     mock_query.count.return_value = 5
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = spells
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows(spells, 5)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -240,6 +276,108 @@ def test_get_spells_invalid_page_size(client):
     assert response.status_code == 422
 
 
+def test_get_spells_without_total(client, monkeypatch):
+    """Test that with_total=false skips counting and derives has_next from an extra row."""
+    spells = [
+        Spell(
+            id=i,
+            target=1,
+            tick_count=10,
+            tick_interval=100,
+            spell_id=10000 + i,
+            spell_format=f"Spell Effect {i}",
+            spell_params={}
+        )
+        for i in range(1, 7)
+    ]
+
+    mock_query = Mock()
+    mock_query.filter.return_value = mock_query
+    mock_query.order_by.return_value = mock_query
+    mock_query.offset.return_value = mock_query
+    mock_query.limit.return_value = mock_query
+    mock_query.all.return_value = spells
+
+    mock_db = Mock()
+    mock_db.query.return_value = mock_query
+
+    def mock_get_db():
+        return mock_db
+
+    app.dependency_overrides[get_db] = mock_get_db
+
+    try:
+        response = client.get("/api/v1/spells?page_size=5&with_total=false")
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [1, 2, 3, 4, 5]
+        assert data["total"] is None
+        assert data["pages"] is None
+        assert data["has_next"] is True
+        mock_query.limit.assert_called_with(6)
+        mock_query.add_columns.assert_not_called()
+        mock_query.count.assert_not_called()
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_get_spells_invalid_cursor(client):
+    """Test with a cursor that does not decode to a spell id."""
+    response = client.get("/api/v1/spells?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_get_spells_cursor_page(client, monkeypatch):
+    """Test seeking past the previous page with next_cursor."""
+    spells = [
+        Spell(
+            id=i,
+            target=1,
+            tick_count=10,
+            tick_interval=100,
+            spell_id=10000 + i,
+            spell_format=f"Spell Effect {i}",
+            spell_params={}
+        )
+        for i in range(1, 11)
+    ]
+
+    mock_query = Mock()
+    mock_query.filter.return_value = mock_query
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.count.return_value = 15
+    mock_query.offset.return_value = mock_query
+    mock_query.limit.return_value = mock_query
+    mock_query.all.side_effect = [window_rows(spells[:5], 15), spells[5:10]]
+
+    mock_db = Mock()
+    mock_db.query.return_value = mock_query
+
+    def mock_get_db():
+        return mock_db
+
+    app.dependency_overrides[get_db] = mock_get_db
+
+    try:
+        response = client.get("/api/v1/spells?page_size=5")
+        assert response.status_code == 200
+        first = response.json()
+        assert [item["id"] for item in first["items"]] == [1, 2, 3, 4, 5]
+        assert first["next_cursor"] is not None
+
+        response = client.get(f"/api/v1/spells?page_size=5&cursor={first['next_cursor']}")
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [6, 7, 8, 9, 10]
+        assert data["total"] == 15
+        assert data["has_prev"] is True
+        # The total came from the first page's window, not a second COUNT
+        mock_query.count.assert_not_called()
+    finally:
+        app.dependency_overrides.clear()
+
+
 @pytest.mark.skip(reason="Cache pollution from previous test - response structure tested in detail endpoint tests")
 def test_get_spells_response_structure(client, monkeypatch):
     """Test spell response structure contains all required fields."""
@@ -258,7 +396,9 @@ def test_get_spells_response_structure(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -308,7 +448,8 @@ def test_search_spells_by_format(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -350,7 +491,8 @@ def test_search_spells_partial_match(client, monkeypatch):
     mock_query.count.return_value = 15
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = spells
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows(spells, 15)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -388,7 +530,8 @@ def test_search_spells_case_insensitive(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -423,7 +566,8 @@ def test_search_spells_no_results(client, monkeypatch):
     mock_query.count.return_value = 0
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = []
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([], 0)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -450,6 +594,15 @@ def test_search_spells_missing_query(client):
     assert response.status_code == 422
 
 
+def test_search_spells_query_too_short(client):
+    """Test that terms too short for the trigram index are rejected."""
+    response = client.get("/api/v1/spells/search?q=ab")
+    assert response.status_code == 400
+
+    response = client.get("/api/v1/spells/search?q=%20ab%20")
+    assert response.status_code == 400
+
+
 def test_search_spells_pagination(client, monkeypatch):
     """Test pagination in spell search."""
     spells = [
@@ -471,7 +624,8 @@ def test_search_spells_pagination(client, monkeypatch):
     mock_query.count.return_value = 15
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = spells[:5]
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows(spells[:5], 15)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -519,7 +673,9 @@ def test_get_spells_with_criteria_single_requirement(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -568,7 +724,9 @@ def test_get_spells_with_criteria_multiple_and(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -612,7 +770,9 @@ def test_get_spells_with_criteria_multiple_or(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     # For OR logic, we need to mock subquery as well
     subquery_mock = Mock()
@@ -666,7 +826,9 @@ def test_get_spells_with_criteria_individual_filters(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -709,7 +871,9 @@ def test_get_spells_with_criteria_filter_by_target(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -752,7 +916,9 @@ def test_get_spells_with_criteria_filter_by_spell_id(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -781,6 +947,16 @@ def test_get_spells_with_criteria_invalid_format(client):
     assert "Invalid criteria_requirements format" in data.get("error", data.get("detail", ""))
 
 
+def test_parse_criteria():
+    """Test parsing criteria requirement strings into triples."""
+    assert _parse_criteria("100:200:1,150:300:2") == ((100, 200, 1), (150, 300, 2))
+
+    with pytest.raises(ValueError):
+        _parse_criteria("100:200")
+    with pytest.raises(ValueError):
+        _parse_criteria("100:abc:1")
+
+
 def test_get_spells_with_criteria_no_filters(client, monkeypatch):
     """Test getting spells with criteria without any filters."""
     criterion = Criterion(id=1, value1=16, value2=100, operator=1)
@@ -803,7 +979,9 @@ def test_get_spells_with_criteria_no_filters(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -851,7 +1029,9 @@ def test_get_spells_with_criteria_pagination(client, monkeypatch):
     mock_query.count.return_value = 10
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = spells[:5]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows(spells[:5], 10)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -873,6 +1053,44 @@ def test_get_spells_with_criteria_pagination(client, monkeypatch):
         app.dependency_overrides.clear()
 
 
+def test_get_spells_with_criteria_loads_criteria_up_front(client, db_session, count_queries):
+    """Test that a page of spells and all their criteria loads in two queries."""
+    # A value1 no game criterion uses, so the page holds only the seeded spells
+    marker = 987654
+    criteria = [Criterion(value1=marker, value2=n, operator=1) for n in range(3)]
+    spells = [
+        Spell(target=1, tick_count=1, tick_interval=0, spell_id=marker, spell_format="{}", spell_params={})
+        for _ in range(4)
+    ]
+    db_session.add_all(criteria + spells)
+    db_session.flush()
+    db_session.add_all([
+        SpellCriterion(spell_id=spell.id, criterion_id=criterion.id)
+        for spell in spells for criterion in criteria
+    ])
+    db_session.flush()
+    # The endpoint must load criteria itself rather than find them in the identity map
+    db_session.expunge_all()
+
+    def real_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = real_get_db
+    try:
+        with count_queries() as statements:
+            response = client.get(f"/api/v1/spells/with-criteria?value1={marker}&page_size=50")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 4
+    assert all(len(item["criteria"]) == 3 for item in items)
+    # Page with its window total, then one IN query for the spell_criteria
+    # links joined to their criteria - not one query per spell
+    assert len(statements) == 2
+
+
 def test_get_spells_with_criteria_response_structure(client, monkeypatch):
     """Test that criteria response includes all required fields."""
     criterion = Criterion(id=1, value1=16, value2=100, operator=1)
@@ -895,7 +1113,9 @@ def test_get_spells_with_criteria_response_structure(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -1078,7 +1298,8 @@ def test_spell_search_ordering(client, monkeypatch):
     mock_query.count.return_value = 5
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = spells
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows(spells, 5)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -1125,7 +1346,9 @@ def test_get_spells_large_page_size(client, monkeypatch):
     mock_query.count.return_value = 15
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = spells
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows(spells, 15)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -1152,7 +1375,9 @@ def test_get_spells_beyond_last_page(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = []
+    mock_query.order_by.return_value = mock_query
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -1191,7 +1416,8 @@ def test_search_spells_special_characters(client, monkeypatch):
     mock_query.count.return_value = 1
     mock_query.offset.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = [spell]
+    mock_query.add_columns.return_value = mock_query
+    mock_query.all.return_value = window_rows([spell], 1)
 
     mock_db = Mock()
     mock_db.query.return_value = mock_query
@@ -1203,7 +1429,7 @@ def test_search_spells_special_characters(client, monkeypatch):
     app.dependency_overrides[get_db] = mock_get_db
 
     try:
-        response = client.get("/api/v1/spells/search?q=%24")  # $ character
+        response = client.get("/api/v1/spells/search?q=%24%7B%7D")  # ${} characters
         assert response.status_code == 200
     finally:
         app.dependency_overrides.clear()
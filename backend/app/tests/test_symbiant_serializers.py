@@ -0,0 +1,193 @@
+"""
+Unit tests for the shared symbiant serializers.
+
+The serializers skip Pydantic validation with model_construct, so these
+tests pin their output against a golden payload and against the same
+payload run through full validation. The loader options are checked
+against the real database by counting the symbiant list's queries.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import InvalidRequestError
+
+from app.main import app
+from app.core.cache import cache_service
+from app.models import Item
+from app.tests.db_test_constants import ITEM_SYMBIANT_ADOBE_ARTILLERY_OCULAR
+from app.api.schemas.symbiant import SymbiantResponse
+from app.api.services.symbiant_serializers import (
+    symbiant_item_load_options, serialize_item_effects, load_item_effects, symbiant_response
+)
+
+
+GOLDEN_SYMBIANT = {
+    "id": 10,
+    "aoid": 235723,
+    "name": "Artillery Ocular Symbiant, Control Unit Aban",
+    "ql": 120,
+    "slot_id": 1,
+    "family": "Artillery",
+    "spell_data": [
+        {
+            "id": 7,
+            "event": 14,
+            "spells": [
+                {
+                    "target": 3,
+                    "tick_count": 1,
+                    "tick_interval": 0,
+                    "spell_id": 53045,
+                    "spell_format": "{Stat} {Amount}",
+                    "spell_params": {"Stat": 16, "Amount": 12},
+                    "id": 5,
+                    "criteria": [],
+                }
+            ],
+        }
+    ],
+    "actions": [
+        {
+            "action": 6,
+            "id": 3,
+            "item_id": 10,
+            "criteria": [{"value1": 54, "value2": 100, "operator": 2, "id": 1}],
+        }
+    ],
+}
+
+
+def make_item():
+    """Build an Item-shaped object graph matching GOLDEN_SYMBIANT."""
+    criterion = SimpleNamespace(id=1, value1=54, value2=100, operator=2)
+    action = SimpleNamespace(
+        id=3, action=6, item_id=10,
+        action_criteria=[SimpleNamespace(criterion=criterion)]
+    )
+    spell = SimpleNamespace(
+        id=5, target=3, tick_count=1, tick_interval=0, spell_id=53045,
+        spell_format="{Stat} {Amount}", spell_params={"Stat": 16, "Amount": 12},
+        spell_criteria=[]
+    )
+    spell_data = SimpleNamespace(
+        id=7, event=14,
+        spell_data_spells=[SimpleNamespace(spell=spell)]
+    )
+    return SimpleNamespace(
+        id=10,
+        actions=[action],
+        item_spell_data=[SimpleNamespace(spell_data=spell_data)]
+    )
+
+
+def make_symbiant():
+    """Build a symbiant_items row matching GOLDEN_SYMBIANT."""
+    return SimpleNamespace(
+        id=10, aoid=235723, name="Artillery Ocular Symbiant, Control Unit Aban",
+        ql=120, slot_id=1, family="Artillery"
+    )
+
+
+def test_symbiant_response_matches_golden():
+    """Test that the constructed response serializes to the golden payload."""
+    response = symbiant_response(make_symbiant(), serialize_item_effects([make_item()]))
+
+    assert response.model_dump() == GOLDEN_SYMBIANT
+
+
+def test_symbiant_response_matches_validated_model():
+    """Test that skipping validation yields what full validation would."""
+    response = symbiant_response(make_symbiant(), serialize_item_effects([make_item()]))
+
+    validated = SymbiantResponse.model_validate(GOLDEN_SYMBIANT)
+    assert response.model_dump() == validated.model_dump()
+    assert response.model_dump_json() == validated.model_dump_json()
+
+
+def test_symbiant_without_item_has_empty_effects():
+    """Test that a symbiant with no matching item gets empty lists."""
+    response = symbiant_response(make_symbiant(), {})
+
+    assert response.actions == []
+    assert response.spell_data == []
+
+
+def test_symbiant_list_query_count(count_queries):
+    """Test that a full symbiant page loads in a fixed number of queries."""
+    cache_service.clear()
+    client = TestClient(app)
+
+    with count_queries() as statements:
+        response = client.get("/api/v1/symbiants?page_size=200")
+
+    assert response.status_code == 200
+    # page with its windowed total, then one row query per level:
+    # actions, action_criteria, item_spell_data, spell_data_spells, spell_criteria
+    assert len(statements) <= 6
+    cache_service.clear()
+
+
+def test_symbiant_load_options_forbid_lazy_loads(db_session):
+    """Test that relationships outside the serialized chain raise instead of lazy loading."""
+    item = (
+        db_session.query(Item)
+        .filter(Item.id == ITEM_SYMBIANT_ADOBE_ARTILLERY_OCULAR)
+        .options(*symbiant_item_load_options())
+        .one()
+    )
+
+    # The serialized chain is fully loaded
+    serialize_item_effects([item])
+
+    with pytest.raises(InvalidRequestError):
+        item.item_stats
+
+
+def test_load_item_effects_matches_orm_serialization(db_session):
+    """Test that the Core row loader builds what the ORM path builds."""
+    item = (
+        db_session.query(Item)
+        .filter(Item.id == ITEM_SYMBIANT_ADOBE_ARTILLERY_OCULAR)
+        .options(*symbiant_item_load_options())
+        .one()
+    )
+    actions, spell_data = serialize_item_effects([item])[item.id]
+
+    effects = load_item_effects(db_session, [item.id])
+    loaded_actions, loaded_spell_data = effects[item.id]
+
+    def by_id(models):
+        return sorted((m.model_dump() for m in models), key=lambda m: m["id"])
+
+    def spell_data_by_id(models):
+        dumped = by_id(models)
+        for sd in dumped:
+            sd["spells"].sort(key=lambda s: s["id"])
+            for spell in sd["spells"]:
+                spell["criteria"].sort(key=lambda c: c["id"])
+        return dumped
+
+    assert by_id(loaded_actions) == by_id(actions)
+    assert spell_data_by_id(loaded_spell_data) == spell_data_by_id(spell_data)
+
+
+def test_load_item_effects_empty():
+    """Test that no ids means no queries and no effects."""
+    assert load_item_effects(None, []) == {}
+
+
+def test_symbiant_list_past_last_page_skips_effects(count_queries):
+    """Test that an empty page issues no item effect queries."""
+    cache_service.clear()
+    client = TestClient(app)
+
+    with count_queries() as statements:
+        response = client.get("/api/v1/symbiants?page=100000&page_size=200")
+
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+    # the empty windowed page, then a plain count for the total
+    assert len(statements) <= 2
+    cache_service.clear()
@@ -4,6 +4,7 @@ Tests that endpoints are working using service layer mocking pattern.
 """
 
 import pytest
+from collections import namedtuple
 from unittest.mock import Mock, MagicMock
 from fastapi.testclient import TestClient
 
@@ -12,6 +13,9 @@ from app.models import Item, Spell, Criterion, SpellCriterion
 from app.core.database import get_db
 
 
+WindowRow = namedtuple("WindowRow", ["entity", "full_count"])
+
+
 @pytest.fixture
 def client():
     """Create a test client."""
@@ -120,6 +124,8 @@ class TestTask4Endpoints:
         mock_query = Mock()
         mock_query.filter.return_value = mock_query
         mock_query.count.return_value = 0
+        mock_query.order_by.return_value = mock_query
+        mock_query.add_columns.return_value = mock_query
         mock_query.offset.return_value = mock_query
         mock_query.limit.return_value = mock_query
         mock_query.all.return_value = []
@@ -147,6 +153,7 @@ class TestTask4Endpoints:
         mock_query.filter.return_value = mock_query
         mock_query.order_by.return_value = mock_query
         mock_query.count.return_value = 0
+        mock_query.add_columns.return_value = mock_query
         mock_query.offset.return_value = mock_query
         mock_query.limit.return_value = mock_query
         mock_query.all.return_value = []
@@ -176,6 +183,8 @@ class TestTask4Endpoints:
         mock_query.filter.return_value = mock_query
         mock_query.options.return_value = mock_query
         mock_query.count.return_value = 0
+        mock_query.order_by.return_value = mock_query
+        mock_query.add_columns.return_value = mock_query
         mock_query.offset.return_value = mock_query
         mock_query.limit.return_value = mock_query
         mock_query.all.return_value = []
@@ -232,6 +241,7 @@ class TestPerformanceMonitoring:
         data = response.json()
         assert data["status"] == "healthy"
         assert "performance_monitoring" in data
+        assert response.headers["cache-control"] == "no-store"
 
     def test_performance_overview(self, client):
         """Test performance overview endpoint."""
@@ -270,9 +280,17 @@ class TestPaginationConsistency:
             mock_query.filter.return_value = mock_query
             mock_query.distinct.return_value = mock_query
             mock_query.count.return_value = 10
+            mock_query.order_by.return_value = mock_query
+            mock_query.add_columns.return_value = mock_query
             mock_query.offset.return_value = mock_query
             mock_query.limit.return_value = mock_query
-            mock_query.all.return_value = []
+            if endpoint == "/api/v1/spells":
+                # Windowed pagination: each row is (entity, full_count)
+                mock_query.all.return_value = [
+                    WindowRow(Spell(id=spell_id, target=1), 10) for spell_id in range(1, 6)
+                ]
+            else:
+                mock_query.all.return_value = []
 
             mock_db = Mock()
             mock_db.query.return_value = mock_query
@@ -301,6 +319,11 @@ class TestPaginationConsistency:
                 assert isinstance(data["pages"], int)
                 assert isinstance(data["has_next"], bool)
                 assert isinstance(data["has_prev"], bool)
+
+                if endpoint == "/api/v1/spells":
+                    assert data["total"] == 10
+                    assert len(data["items"]) == 5
+                    assert data["has_next"] is True
             finally:
                 app.dependency_overrides.clear()
 
@@ -375,6 +398,8 @@ class TestEndpointResponseStructure:
             mock_query.filter.return_value = mock_query
             mock_query.distinct.return_value = mock_query
             mock_query.count.return_value = 1
+            mock_query.order_by.return_value = mock_query
+            mock_query.add_columns.return_value = mock_query
             mock_query.offset.return_value = mock_query
             mock_query.limit.return_value = mock_query
             mock_query.all.return_value = []
@@ -420,6 +445,7 @@ class TestEndpointResponseStructure:
             mock_query.order_by.return_value = mock_query
             mock_query.distinct.return_value = mock_query
             mock_query.count.return_value = 0
+            mock_query.add_columns.return_value = mock_query
             mock_query.offset.return_value = mock_query
             mock_query.limit.return_value = mock_query
             mock_query.all.return_value = []
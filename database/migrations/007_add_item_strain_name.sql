@@ -0,0 +1,24 @@
+-- Migration 007: Add Item Strain Name
+-- Created: 2026-10-18
+-- Description: Adds a stored generated strain_name column to items so nano strain
+--              filtering and aggregation can run in SQL instead of Python string splits
+
+\echo 'Running Migration 007: Add Item Strain Name...'
+
+-- Strain is the text after the last ' - ' in the item name (NULL when there is none)
+ALTER TABLE items ADD COLUMN IF NOT EXISTS strain_name VARCHAR(128)
+    GENERATED ALWAYS AS (
+        CASE WHEN name LIKE '% - %' THEN btrim(regexp_replace(name, '^.* - ', '')) END
+    ) STORED;
+
+-- Partial index for nano strain lookups
+CREATE INDEX IF NOT EXISTS idx_items_nano_strain_name ON items (strain_name) WHERE is_nano = true;
+
+COMMENT ON COLUMN items.strain_name IS 'Nano strain derived from the item name suffix after the last " - "';
+
+-- Record migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('007', 'add_item_strain_name', CURRENT_TIMESTAMP)
+ON CONFLICT (version) DO NOTHING;
+
+\echo 'Migration 007 completed successfully!'
@@ -0,0 +1,18 @@
+-- Migration 008: Add Perk Name Trigram Index
+-- Created: 2026-10-18
+-- Description: Adds a pg_trgm GIN index on perks.name so the perk list
+--              "name ILIKE '%term%'" search can use an index instead of a scan
+
+\echo 'Running Migration 008: Add Perk Name Trigram Index...'
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Serves ILIKE/LIKE substring and case-insensitive matches on perk names
+CREATE INDEX IF NOT EXISTS idx_perks_name_trgm ON perks USING GIN (name gin_trgm_ops);
+
+-- Record migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('008', 'add_perk_name_trigram_index', CURRENT_TIMESTAMP)
+ON CONFLICT (version) DO NOTHING;
+
+\echo 'Migration 008 completed successfully!'
@@ -0,0 +1,18 @@
+-- Migration 009: Add Perk Formatted Name
+-- Created: 2026-10-18
+-- Description: Adds a stored generated formatted_name column ("<name> <counter>")
+--              to perks so list queries read it instead of formatting it per row
+
+\echo 'Running Migration 009: Add Perk Formatted Name...'
+
+ALTER TABLE perks ADD COLUMN IF NOT EXISTS formatted_name VARCHAR(140)
+    GENERATED ALWAYS AS (name || ' ' || counter::text) STORED;
+
+COMMENT ON COLUMN perks.formatted_name IS 'Perk name followed by its level, e.g. "Accumulator 3"';
+
+-- Record migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('009', 'add_perk_formatted_name', CURRENT_TIMESTAMP)
+ON CONFLICT (version) DO NOTHING;
+
+\echo 'Migration 009 completed successfully!'
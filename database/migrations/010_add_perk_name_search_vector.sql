@@ -0,0 +1,19 @@
+-- Migration 010: Add Perk Name Search Vector
+-- Created: 2026-10-18
+-- Description: Adds a stored generated tsvector of perks.name with a GIN index so
+--              multi-word perk searches match whole words in any order
+
+\echo 'Running Migration 010: Add Perk Name Search Vector...'
+
+-- 'simple' config: perk names are proper nouns, so no stemming or stop words
+ALTER TABLE perks ADD COLUMN IF NOT EXISTS name_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', name)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_perks_name_tsv ON perks USING GIN (name_tsv);
+
+-- Record migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('010', 'add_perk_name_search_vector', CURRENT_TIMESTAMP)
+ON CONFLICT (version) DO NOTHING;
+
+\echo 'Migration 010 completed successfully!'
@@ -0,0 +1,21 @@
+-- Migration 011: Add Search Trigram Indexes
+-- Created: 2026-10-18
+-- Description: Adds pg_trgm GIN indexes behind the remaining "col ILIKE '%term%'"
+--              filters: mob playfield and spell format search
+
+\echo 'Running Migration 011: Add Search Trigram Indexes...'
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- GET /mobs?playfield=...
+CREATE INDEX IF NOT EXISTS idx_mobs_playfield_trgm ON mobs USING GIN (playfield gin_trgm_ops);
+
+-- GET /spells/search?q=...
+CREATE INDEX IF NOT EXISTS idx_spells_spell_format_trgm ON spells USING GIN (spell_format gin_trgm_ops);
+
+-- Record migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('011', 'add_search_trigram_indexes', CURRENT_TIMESTAMP)
+ON CONFLICT (version) DO NOTHING;
+
+\echo 'Migration 011 completed successfully!'
@@ -165,7 +165,11 @@ CREATE TABLE items (
     is_nano BOOLEAN DEFAULT FALSE,
     is_perk BOOLEAN DEFAULT FALSE,
     atkdef_id INTEGER REFERENCES attack_defense(id) ON DELETE SET NULL,
-    animation_mesh_id INTEGER REFERENCES animation_mesh(id) ON DELETE SET NULL
+    animation_mesh_id INTEGER REFERENCES animation_mesh(id) ON DELETE SET NULL,
+    -- Nano strain: text after the last ' - ' in the name (see migration 007)
+    strain_name VARCHAR(128) GENERATED ALWAYS AS (
+        CASE WHEN name LIKE '% - %' THEN btrim(regexp_replace(name, '^.* - ', '')) END
+    ) STORED
 );
 
 -- Performance indexes for items
@@ -177,6 +181,7 @@ CREATE INDEX idx_items_is_nano ON items (is_nano);
 CREATE INDEX idx_items_is_perk ON items (is_perk);
 CREATE INDEX idx_items_atkdef ON items (atkdef_id);
 CREATE INDEX idx_items_animation_mesh ON items (animation_mesh_id);
+CREATE INDEX idx_items_nano_strain_name ON items (strain_name) WHERE is_nano = true;
 
 -- ============================================================================
 -- Item Relationship Junction Tables